@@ -1,6 +1,16 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List, Literal
+
+
+JOB_RESPONSE_FIELDS = (
+    "id", "title", "company", "location", "url", "posted_date", "description",
+    "source", "scraped_at", "created_at", "updated_at", "duplicate_of",
+)
+# List views never show the description, by far the largest column
+SUMMARY_FIELDS = tuple(field for field in JOB_RESPONSE_FIELDS if field != "description")
+
+FacetName = Literal["company", "location", "source"]
 
 
 class JobCreateDTO(BaseModel):
@@ -27,6 +37,9 @@ class JobResponseDTO(BaseModel):
     scraped_at: Optional[datetime] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
+    duplicate_of: Optional[str] = None
+    rank: Optional[float] = None
+    snippet: Optional[str] = None
 
     class Config:
         from_attributes = True
@@ -36,24 +49,205 @@ class JobsSubmitRequestDTO(BaseModel):
     jobs: List[JobCreateDTO]
 
 
+class NearDuplicateDTO(BaseModel):
+    id: str
+    duplicate_of: str
+    distance: int
+
+
 class JobsSubmitResponseDTO(BaseModel):
     success: bool
     inserted: int
+    # Stored postings rewritten because their content changed (upsert mode)
+    updated: int = 0
+    # Stored postings resubmitted with the same content hash (upsert mode)
+    unchanged: int = 0
+    unchanged_ids: List[str] = Field(default_factory=list)
     duplicates: int
+    duplicate_ids: List[str] = Field(default_factory=list)
+    near_duplicates: List[NearDuplicateDTO] = Field(default_factory=list)
     total: int
 
 
+class JobsSyncRequestDTO(BaseModel):
+    ids: List[str] = Field(max_length=10000)
+    # Optional id -> content hash (see domain.services.content_hash)
+    hashes: Optional[Dict[str, str]] = None
+
+
+class JobsSyncResponseDTO(BaseModel):
+    # Ids to upload next, in request order
+    missing: List[str]
+    # Stored ids whose content hash differs from the client's
+    changed: List[str] = Field(default_factory=list)
+    known: int
+    total: int
+
+
+class JobsTicketDTO(BaseModel):
+    ticket: str
+    status: Literal["pending", "completed", "failed"]
+    total: int
+    processed: int
+    inserted: int
+    updated: int = 0
+    unchanged: int = 0
+    duplicates: int
+    duplicate_ids: List[str] = Field(default_factory=list)
+    near_duplicates: List[NearDuplicateDTO] = Field(default_factory=list)
+    error: Optional[str] = None
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+
+
+class StreamChunkProgressDTO(BaseModel):
+    chunk: int
+    last_line: int
+    inserted: int
+    updated: int = 0
+    unchanged: int = 0
+    duplicates: int
+    near_duplicates: int = 0
+    total: int
+
+
+class StreamLineErrorDTO(BaseModel):
+    line: int
+    error: str
+
+
+class JobsStreamSubmitResponseDTO(BaseModel):
+    success: bool
+    inserted: int
+    updated: int = 0
+    unchanged: int = 0
+    duplicates: int
+    near_duplicates: int = 0
+    invalid: int
+    total: int
+    chunks: List[StreamChunkProgressDTO]
+    errors: List[StreamLineErrorDTO]
+
+
+class BulkLoadChunkDTO(BaseModel):
+    chunk: int
+    last_line: int
+    inserted: int
+    duplicates: int
+    invalid: int
+    total: int
+
+
+class JobsBulkLoadResponseDTO(BaseModel):
+    success: bool
+    inserted: int
+    duplicates: int
+    invalid: int
+    total: int
+    elapsed_s: float
+    rows_per_s: float
+    # Every line up to this one is loaded
+    committed_line: int = 0
+    chunks: List[BulkLoadChunkDTO]
+    errors: List[StreamLineErrorDTO]
+
+
 class JobFilterDTO(BaseModel):
     search: Optional[str] = None
     location: Optional[str] = None
     company: Optional[str] = None
     source: Optional[str] = None
+    search_mode: Literal["substring", "fulltext"] = "substring"
+    pagination: Literal["offset", "cursor"] = "offset"
+    cursor: Optional[str] = None
+    collapse_duplicates: bool = False
+    # Only jobs scraped at or after this instant (prunes older partitions)
+    scraped_since: Optional[datetime] = None
+    view: Literal["full", "summary"] = "full"
+    fields: Optional[List[str]] = None
+    # Counts per value of each facet for the whole filter, not just the page
+    facets: Optional[List[FacetName]] = None
+    facet_limit: int = Field(default=10, ge=1, le=100)
     limit: int = Field(default=50, ge=1, le=1000)
     offset: int = Field(default=0, ge=0)
 
+    @property
+    def uses_cursor(self) -> bool:
+        return self.pagination == "cursor" or self.cursor is not None
+
+    @property
+    def include_description(self) -> bool:
+        if self.fields is not None:
+            return "description" in self.fields
+        return self.view == "full"
+
+
+class FacetValueDTO(BaseModel):
+    value: str
+    count: int
+
+
+class JobSearchFacetsResponseDTO(BaseModel):
+    results: List[JobResponseDTO]
+    total: int
+    facets: Dict[str, List[FacetValueDTO]]
+
+
+class JobExportFilterDTO(BaseModel):
+    search: Optional[str] = None
+    location: Optional[str] = None
+    company: Optional[str] = None
+    source: Optional[str] = None
+    search_mode: Literal["substring", "fulltext"] = "substring"
+    scraped_since: Optional[datetime] = None
+    format: Literal["ndjson", "csv", "parquet"] = "ndjson"
+
+
+class JobsDeleteRequestDTO(BaseModel):
+    ids: List[str] = Field(min_length=1, max_length=100000)
+
+
+class JobsUpdateRequestDTO(BaseModel):
+    jobs: List[JobCreateDTO] = Field(min_length=1)
+
+
+class JobDeleteFilterDTO(BaseModel):
+    location: Optional[str] = None
+    company: Optional[str] = None
+    source: Optional[str] = None
+    scraped_before: Optional[datetime] = None
+    duplicates_only: bool = False
+
+    @property
+    def has_criteria(self) -> bool:
+        return bool(self.location or self.company or self.source or self.scraped_before or self.duplicates_only)
+
+
+class JobsDeleteResponseDTO(BaseModel):
+    deleted: int
+    requested: Optional[int] = None
+
+
+class JobsUpdateResponseDTO(BaseModel):
+    updated: int
+    requested: int
+
 
 class JobStatsDTO(BaseModel):
     total_jobs: int
     total_companies: int
     total_locations: int
     jobs_by_source: dict[str, int]
+    as_of: Optional[datetime] = None
+    age_seconds: Optional[float] = None
+    from_snapshot: bool = False
+
+
+class CompanySuggestionDTO(BaseModel):
+    company: str
+    similarity: float
+
+
+class CompanySuggestionsDTO(BaseModel):
+    query: str
+    suggestions: List[CompanySuggestionDTO]
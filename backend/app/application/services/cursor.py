@@ -0,0 +1,21 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Tuple
+
+from app.domain.exceptions.job_exceptions import InvalidSearchCriteriaError
+
+
+def encode_cursor(created_at: datetime, job_id: str) -> str:
+    payload = json.dumps([created_at.isoformat(), job_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, job_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), str(job_id)
+    except (ValueError, TypeError, binascii.Error, UnicodeError):
+        raise InvalidSearchCriteriaError("Invalid pagination cursor")
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+from app.domain.exceptions.job_exceptions import PartialSaveError, RepositoryError
+from app.domain.ports.job_bulk_loader import IJobBulkLoader
+from app.domain.ports.stats_refresher import IStatsRefresher
+from app.domain.services.job_validation import validate_job_records
+
+
+MAX_REPORTED_ERRORS = 100
+
+
+class BulkLoadJobsUseCase:
+    def __init__(
+        self,
+        loader: IJobBulkLoader,
+        stats_refresher: Optional[IStatsRefresher] = None,
+        chunk_size: int = 50000,
+        concurrency: int = 1,
+        clock: Callable[[], float] = time.perf_counter
+    ):
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        self.loader = loader
+        self.stats_refresher = stats_refresher
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self._clock = clock
+
+    async def execute(
+        self,
+        lines: AsyncIterator[Tuple[int, bytes]],
+        chunk_size: Optional[int] = None,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        concurrency: Optional[int] = None
+    ) -> Dict[str, Any]:
+        # With concurrency > 1, up to that many chunks are merged at once, each
+        # in its own transaction; which of two chunks sharing an id or url
+        # wins is then not deterministic.
+        chunk_size = chunk_size or self.chunk_size
+        concurrency = concurrency or self.concurrency
+        started = self._clock()
+        summary = {
+            "success": True,
+            "inserted": 0,
+            "duplicates": 0,
+            "invalid": 0,
+            "total": 0,
+            "elapsed_s": 0.0,
+            "rows_per_s": 0.0,
+            "committed_line": 0,
+            "chunks": [],
+            "errors": []
+        }
+
+        def reject(line_number: int, error: str) -> None:
+            # A bad line is reported and skipped, it does not abort the load
+            summary["invalid"] += 1
+            if len(summary["errors"]) < MAX_REPORTED_ERRORS:
+                summary["errors"].append({"line": line_number, "error": error})
+
+        def update_rate() -> None:
+            elapsed = self._clock() - started
+            summary["elapsed_s"] = round(elapsed, 3)
+            summary["rows_per_s"] = round(summary["total"] / elapsed, 1) if elapsed else 0.0
+
+        async def flush(records: List[Dict[str, Any]], line_numbers: List[int], number: int) -> None:
+            nonlocal loaded
+            valid, errors = validate_job_records(records)
+            for index, error in errors.items():
+                reject(line_numbers[index], error)
+
+            result = await self.loader.load_chunk(valid)
+            summary["inserted"] += result["inserted"]
+            summary["duplicates"] += result["duplicates"]
+            update_rate()
+            chunk = {
+                "chunk": number,
+                "last_line": line_numbers[-1],
+                "inserted": result["inserted"],
+                "duplicates": result["duplicates"],
+                "invalid": len(errors),
+                "total": len(records)
+            }
+            summary["chunks"].append(chunk)
+            loaded += len(records)
+            if on_progress is not None:
+                on_progress({
+                    **chunk,
+                    "loaded": loaded,
+                    "elapsed_s": summary["elapsed_s"],
+                    "rows_per_s": summary["rows_per_s"]
+                })
+
+        in_flight: Set[asyncio.Task] = set()
+        submitted = 0
+        loaded = 0
+
+        async def submit(records: List[Dict[str, Any]], line_numbers: List[int]) -> None:
+            nonlocal submitted
+            if len(in_flight) >= concurrency:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                in_flight.difference_update(done)
+                for task in done:
+                    task.result()
+            submitted += 1
+            in_flight.add(asyncio.create_task(flush(records, line_numbers, submitted)))
+
+        records: List[Dict[str, Any]] = []
+        line_numbers: List[int] = []
+        try:
+            async for line_number, line in lines:
+                summary["total"] += 1
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    reject(line_number, f"Invalid JSON: {str(e)}")
+                    continue
+                if not isinstance(record, dict):
+                    reject(line_number, "Each line must be a JSON object")
+                    continue
+
+                records.append(record)
+                line_numbers.append(line_number)
+                if len(records) >= chunk_size:
+                    await submit(records, line_numbers)
+                    records, line_numbers = [], []
+
+            if records:
+                await submit(records, line_numbers)
+            await asyncio.gather(*in_flight)
+        except RepositoryError as e:
+            summary["success"] = False
+            # The summary is completed by the finally block before this propagates
+            raise PartialSaveError(f"Bulk load stopped: {str(e)}", summary, e)
+        finally:
+            # A failed chunk stops the load; chunks already merged stay committed
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            summary["chunks"].sort(key=lambda chunk: chunk["chunk"])
+            summary["committed_line"] = _committed_line(summary["chunks"])
+            update_rate()
+
+            if summary["inserted"] and self.stats_refresher is not None:
+                self.stats_refresher.mark_dirty()
+
+        return summary
+
+
+def _committed_line(chunks: List[Dict[str, Any]]) -> int:
+    # Every line up to this one is loaded, so a failed load can resume after
+    # it; with concurrency, later chunks may be loaded too, and are skipped
+    # as duplicates on the rerun
+    line = 0
+    for number, chunk in enumerate(chunks, start=1):
+        if chunk["chunk"] != number:
+            break
+        line = chunk["last_line"]
+    return line
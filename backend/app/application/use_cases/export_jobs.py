@@ -0,0 +1,94 @@
+import asyncio
+from datetime import datetime
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from app.domain.ports.job_repository import IJobRepository
+from app.application.dto.job_dto import JobExportFilterDTO
+
+
+_RANGE_DONE = object()
+
+# [lower, upper) in (created_at, id) export order; None leaves a side open
+KeyRange = Tuple[Optional[Tuple[datetime, str]], Optional[Tuple[datetime, str]]]
+
+
+class ExportJobsUseCase:
+    # Exports outlive the request handler, so the use case opens its own
+    # repository scope for the duration of the stream.
+    def __init__(
+        self,
+        repository_scope: Callable[[], AsyncContextManager[IJobRepository]],
+        chunk_size: int = 1000
+    ):
+        self.repository_scope = repository_scope
+        self.chunk_size = chunk_size
+
+    async def execute(
+        self,
+        filter_dto: JobExportFilterDTO,
+        key_range: Optional[KeyRange] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        async with self.repository_scope() as repository:
+            async for rows in repository.export_rows(
+                search_term=filter_dto.search,
+                location=filter_dto.location,
+                company=filter_dto.company,
+                source=filter_dto.source,
+                search_mode=filter_dto.search_mode,
+                chunk_size=self.chunk_size,
+                scraped_since=filter_dto.scraped_since,
+                key_range=key_range
+            ):
+                yield rows
+
+    async def execute_parallel(
+        self,
+        filter_dto: JobExportFilterDTO,
+        concurrency: int
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        # The matching rows are split into disjoint (created_at, id) ranges of
+        # about the same size, one scope and cursor each. Chunks are yielded as
+        # they arrive, so rows are not in created_at order across ranges.
+        if concurrency <= 1:
+            async for rows in self.execute(filter_dto):
+                yield rows
+            return
+
+        async with self.repository_scope() as repository:
+            boundaries = await repository.export_boundaries(
+                concurrency,
+                search_term=filter_dto.search,
+                location=filter_dto.location,
+                company=filter_dto.company,
+                source=filter_dto.source,
+                search_mode=filter_dto.search_mode,
+                scraped_since=filter_dto.scraped_since
+            )
+        edges = [None, *boundaries, None]
+        key_ranges = list(zip(edges, edges[1:]))
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+
+        async def produce(key_range: KeyRange) -> None:
+            try:
+                async for rows in self.execute(filter_dto, key_range=key_range):
+                    await queue.put(rows)
+                await queue.put(_RANGE_DONE)
+            except Exception as e:
+                await queue.put(e)
+
+        tasks = [asyncio.create_task(produce(key_range)) for key_range in key_ranges]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is _RANGE_DONE:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
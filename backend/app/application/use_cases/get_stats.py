@@ -1,21 +1,44 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
 from app.domain.ports.job_repository import IJobRepository
 from app.domain.exceptions.job_exceptions import RepositoryError
 from app.application.dto.job_dto import JobStatsDTO
 
 
 class GetStatsUseCase:
-    def __init__(self, job_repository: IJobRepository):
+    def __init__(self, job_repository: IJobRepository, max_staleness_seconds: Optional[float] = None):
         self.job_repository = job_repository
+        self.max_staleness_seconds = max_staleness_seconds
 
-    async def execute(self) -> JobStatsDTO:
-        total_jobs = await self.job_repository.count_total()
-        total_companies = await self.job_repository.count_distinct_companies()
-        total_locations = await self.job_repository.count_distinct_locations()
-        jobs_by_source = await self.job_repository.count_by_source()
+    def _to_dto(self, stats: Dict[str, Any], from_snapshot: bool) -> JobStatsDTO:
+        as_of = stats["refreshed_at"]
+        age_seconds = None
+        if as_of is not None:
+            age_seconds = max((datetime.now(timezone.utc) - as_of).total_seconds(), 0.0)
 
         return JobStatsDTO(
-            total_jobs=total_jobs,
-            total_companies=total_companies,
-            total_locations=total_locations,
-            jobs_by_source=jobs_by_source
+            total_jobs=stats["total_jobs"],
+            total_companies=stats["total_companies"],
+            total_locations=stats["total_locations"],
+            jobs_by_source=stats["jobs_by_source"],
+            as_of=as_of,
+            age_seconds=age_seconds,
+            from_snapshot=from_snapshot
         )
+
+    async def execute(self, fresh: bool = False) -> JobStatsDTO:
+        if not fresh:
+            snapshot = await self.job_repository.get_stats_snapshot()
+            if snapshot is not None:
+                dto = self._to_dto(snapshot, from_snapshot=True)
+                # A snapshot that outlived its bound (refresher down) is recomputed
+                if (
+                    self.max_staleness_seconds is None
+                    or dto.age_seconds is None
+                    or dto.age_seconds <= self.max_staleness_seconds
+                ):
+                    return dto
+
+        stats = await self.job_repository.get_stats()
+        return self._to_dto(stats, from_snapshot=False)
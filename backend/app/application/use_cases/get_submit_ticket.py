@@ -0,0 +1,15 @@
+from typing import Any, Dict, Optional
+
+from app.domain.ports.job_ingest_queue import IJobIngestQueue
+
+
+class GetSubmitTicketUseCase:
+    # Tickets live in the write-behind queue's memory: polling one needs
+    # neither a database session nor the primary.
+    def __init__(self, ingest_queue: Optional[IJobIngestQueue]):
+        self.ingest_queue = ingest_queue
+
+    def execute(self, ticket_id: str) -> Optional[Dict[str, Any]]:
+        if self.ingest_queue is None:
+            return None
+        return self.ingest_queue.get_ticket(ticket_id)
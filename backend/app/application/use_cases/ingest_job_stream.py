@@ -0,0 +1,79 @@
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.domain.entities.job import Job
+from app.domain.exceptions.job_exceptions import JobValidationError
+from app.application.dto.job_dto import JobCreateDTO
+from app.application.use_cases.submit_jobs import SubmitJobsUseCase
+
+
+MAX_REPORTED_ERRORS = 100
+
+
+class IngestJobStreamUseCase:
+    def __init__(self, submit_use_case: SubmitJobsUseCase, chunk_size: int = 500):
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        self.submit_use_case = submit_use_case
+        self.chunk_size = chunk_size
+
+    async def execute(
+        self,
+        lines: AsyncIterator[Tuple[int, bytes]],
+        chunk_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        chunk_size = chunk_size or self.chunk_size
+        summary = {
+            "success": True,
+            "inserted": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "duplicates": 0,
+            "near_duplicates": 0,
+            "invalid": 0,
+            "total": 0,
+            "chunks": [],
+            "errors": []
+        }
+        buffer: List[Job] = []
+
+        async def flush(jobs: List[Job], last_line: int) -> None:
+            result = await self.submit_use_case.save_jobs(jobs)
+            summary["inserted"] += result["inserted"]
+            summary["updated"] += result.get("updated", 0)
+            summary["unchanged"] += result.get("unchanged", 0)
+            summary["duplicates"] += result["duplicates"]
+            summary["near_duplicates"] += len(result["near_duplicates"])
+            summary["chunks"].append({
+                "chunk": len(summary["chunks"]) + 1,
+                "last_line": last_line,
+                "inserted": result["inserted"],
+                "updated": result.get("updated", 0),
+                "unchanged": result.get("unchanged", 0),
+                "duplicates": result["duplicates"],
+                "near_duplicates": len(result["near_duplicates"]),
+                "total": result["total"]
+            })
+
+        line_number = 0
+        async for line_number, line in lines:
+            summary["total"] += 1
+            try:
+                job_dto = JobCreateDTO.model_validate_json(line)
+                buffer.append(self.submit_use_case.to_entity(job_dto))
+            except (ValidationError, JobValidationError) as e:
+                # A bad line is reported and skipped, it does not abort the upload
+                summary["invalid"] += 1
+                if len(summary["errors"]) < MAX_REPORTED_ERRORS:
+                    summary["errors"].append({"line": line_number, "error": str(e)})
+                continue
+
+            if len(buffer) >= chunk_size:
+                await flush(buffer, line_number)
+                buffer = []
+
+        if buffer:
+            await flush(buffer, line_number)
+
+        return summary
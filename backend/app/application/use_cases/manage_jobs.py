@@ -0,0 +1,43 @@
+from typing import Any, Dict, List, Optional
+
+from app.domain.ports.job_repository import IJobRepository
+from app.domain.ports.stats_refresher import IStatsRefresher
+from app.domain.exceptions.job_exceptions import InvalidSearchCriteriaError
+from app.application.dto.job_dto import JobCreateDTO, JobDeleteFilterDTO
+from app.application.use_cases.submit_jobs import to_job_entity
+
+
+class ManageJobsUseCase:
+    def __init__(self, job_repository: IJobRepository, stats_refresher: Optional[IStatsRefresher] = None):
+        self.job_repository = job_repository
+        self.stats_refresher = stats_refresher
+
+    def _changed(self, count: int) -> None:
+        if count and self.stats_refresher is not None:
+            self.stats_refresher.mark_dirty()
+
+    async def delete_many(self, job_ids: List[str]) -> Dict[str, Any]:
+        deleted = await self.job_repository.delete_many(job_ids)
+        self._changed(deleted)
+        return {"deleted": deleted, "requested": len(set(job_ids))}
+
+    async def update_many(self, jobs_dto: List[JobCreateDTO]) -> Dict[str, Any]:
+        jobs = [to_job_entity(job_dto) for job_dto in jobs_dto]
+        updated = await self.job_repository.update_many(jobs)
+        self._changed(updated)
+        return {"updated": updated, "requested": len({job.id for job in jobs})}
+
+    async def delete_where(self, filter_dto: JobDeleteFilterDTO) -> Dict[str, Any]:
+        # An empty filter would empty the table
+        if not filter_dto.has_criteria:
+            raise InvalidSearchCriteriaError("At least one criterion is required to delete jobs")
+
+        deleted = await self.job_repository.delete_where(
+            location=filter_dto.location,
+            company=filter_dto.company,
+            source=filter_dto.source,
+            scraped_before=filter_dto.scraped_before,
+            duplicates_only=filter_dto.duplicates_only
+        )
+        self._changed(deleted)
+        return {"deleted": deleted}
@@ -0,0 +1,58 @@
+import asyncio
+import time
+from typing import Any, AsyncContextManager, Callable, Dict, Optional
+
+from app.domain.ports.job_repository import IJobRepository
+
+
+class ReindexJobsUseCase:
+    # Maintenance pass: fills the SimHash and content hash of rows stored
+    # before they existed, then optionally rebuilds the table's indexes.
+    def __init__(
+        self,
+        repository_scope: Callable[[], AsyncContextManager[IJobRepository]],
+        batch_size: int = 1000,
+        clock: Callable[[], float] = time.perf_counter
+    ):
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        self.repository_scope = repository_scope
+        self.batch_size = batch_size
+        self._clock = clock
+
+    async def execute(
+        self,
+        concurrency: int = 1,
+        rebuild_indexes: bool = False,
+        on_progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        started = self._clock()
+        summary = {"backfilled": 0, "batches": 0, "indexes_rebuilt": False, "elapsed_s": 0.0}
+
+        async def worker() -> None:
+            # Each batch is its own transaction; a worker stops at the first empty one
+            while True:
+                async with self.repository_scope() as repository:
+                    count = await repository.backfill_fingerprints(self.batch_size)
+                if not count:
+                    return
+                summary["backfilled"] += count
+                summary["batches"] += 1
+                if on_progress is not None:
+                    on_progress({
+                        "batches": summary["batches"],
+                        "backfilled": summary["backfilled"],
+                        "elapsed_s": round(self._clock() - started, 3)
+                    })
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+        if rebuild_indexes:
+            async with self.repository_scope() as repository:
+                await repository.rebuild_indexes()
+            summary["indexes_rebuilt"] = True
+
+        summary["elapsed_s"] = round(self._clock() - started, 3)
+        return summary
@@ -1,29 +1,140 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.domain.entities.job import Job
+from app.domain.entities.job_search_hit import JobSearchHit
 from app.domain.ports.job_repository import IJobRepository
 from app.domain.exceptions.job_exceptions import RepositoryError, InvalidSearchCriteriaError
-from app.application.dto.job_dto import JobFilterDTO
+from app.application.dto.job_dto import JobFilterDTO, JOB_RESPONSE_FIELDS, SUMMARY_FIELDS
+from app.application.services.cursor import encode_cursor, decode_cursor
 
 
 class SearchJobsUseCase:
     def __init__(self, job_repository: IJobRepository):
         self.job_repository = job_repository
 
-    async def execute(self, filter_dto: JobFilterDTO) -> List[Job]:
+    def _validate(self, filter_dto: JobFilterDTO) -> None:
         if filter_dto.limit < 1 or filter_dto.limit > 1000:
             raise InvalidSearchCriteriaError("Limit must be between 1 and 1000")
 
         if filter_dto.offset < 0:
             raise InvalidSearchCriteriaError("Offset must be non-negative")
 
+        if filter_dto.uses_cursor and filter_dto.offset:
+            raise InvalidSearchCriteriaError("Offset cannot be combined with cursor pagination")
+
+        if filter_dto.uses_cursor and filter_dto.search_mode == "fulltext":
+            raise InvalidSearchCriteriaError("Cursor pagination is not available for fulltext search")
+
+        if filter_dto.fields is not None:
+            unknown = [field for field in filter_dto.fields if field not in JOB_RESPONSE_FIELDS]
+            if unknown:
+                raise InvalidSearchCriteriaError(f"Unknown fields: {', '.join(unknown)}")
+
+    def _projection(self, filter_dto: JobFilterDTO) -> Optional[List[str]]:
+        if filter_dto.fields is None:
+            return list(SUMMARY_FIELDS) if filter_dto.view == "summary" else None
+
+        # id always comes back; cursor pagination also needs created_at
+        required = ["id", "created_at"] if filter_dto.uses_cursor else ["id"]
+        projected = required + [field for field in filter_dto.fields if field not in required]
+        return list(dict.fromkeys(projected))
+
+    async def execute(self, filter_dto: JobFilterDTO) -> List[Job]:
+        self._validate(filter_dto)
+
         jobs = await self.job_repository.search(
             search_term=filter_dto.search,
             location=filter_dto.location,
             company=filter_dto.company,
             source=filter_dto.source,
             limit=filter_dto.limit,
-            offset=filter_dto.offset
+            offset=filter_dto.offset,
+            collapse_duplicates=filter_dto.collapse_duplicates,
+            include_description=filter_dto.include_description,
+            scraped_since=filter_dto.scraped_since
         )
 
         return jobs
+
+    def _facet_names(self, filter_dto: JobFilterDTO) -> Optional[List[str]]:
+        return list(dict.fromkeys(filter_dto.facets)) if filter_dto.facets else None
+
+    async def execute_rows(
+        self, filter_dto: JobFilterDTO
+    ) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[Dict[str, Any]]]:
+        # Path of the list route: plain row mappings with the projection applied,
+        # offset or cursor pagination, and the facet counts if any were asked
+        # for (None otherwise), read by the same statement as the page
+        self._validate(filter_dto)
+        after = decode_cursor(filter_dto.cursor) if filter_dto.cursor else None
+        limit = filter_dto.limit + 1 if filter_dto.uses_cursor else filter_dto.limit
+        rows, facets = await self._search_rows(filter_dto, self._projection(filter_dto), limit, after)
+
+        if not filter_dto.uses_cursor or len(rows) <= filter_dto.limit:
+            return rows, None, facets
+
+        rows = rows[:filter_dto.limit]
+        last = rows[-1]
+        return rows, encode_cursor(last["created_at"], last["id"]), facets
+
+    async def _search_rows(
+        self,
+        filter_dto: JobFilterDTO,
+        fields: Optional[List[str]],
+        limit: int,
+        after: Optional[Tuple[Any, str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        criteria = dict(
+            search_term=filter_dto.search,
+            location=filter_dto.location,
+            company=filter_dto.company,
+            source=filter_dto.source,
+            limit=limit,
+            offset=filter_dto.offset,
+            after=after,
+            collapse_duplicates=filter_dto.collapse_duplicates,
+            fields=fields,
+            scraped_since=filter_dto.scraped_since
+        )
+        facets = self._facet_names(filter_dto)
+        if facets is None:
+            return await self.job_repository.search_rows(**criteria), None
+
+        return await self.job_repository.search_rows_with_facets(
+            **criteria, facets=facets, facet_limit=filter_dto.facet_limit
+        )
+
+    async def execute_fulltext(
+        self, filter_dto: JobFilterDTO
+    ) -> Tuple[List[JobSearchHit], Optional[Dict[str, Any]]]:
+        # Ranked hits, and the facet counts as in execute_rows
+        self._validate(filter_dto)
+        facets = self._facet_names(filter_dto)
+
+        # Without a query there is nothing to rank: behave like a plain listing
+        if not filter_dto.search or not filter_dto.search.strip():
+            if facets is None:
+                jobs = await self.execute(filter_dto)
+                return [JobSearchHit(job=job, rank=0.0) for job in jobs], None
+
+            fields = None if filter_dto.include_description else list(SUMMARY_FIELDS)
+            rows, facets = await self._search_rows(filter_dto, fields, filter_dto.limit)
+            return [JobSearchHit(job=Job(**row), rank=0.0) for row in rows], facets
+
+        criteria = dict(
+            query=filter_dto.search,
+            location=filter_dto.location,
+            company=filter_dto.company,
+            source=filter_dto.source,
+            limit=filter_dto.limit,
+            offset=filter_dto.offset,
+            collapse_duplicates=filter_dto.collapse_duplicates,
+            include_description=filter_dto.include_description,
+            scraped_since=filter_dto.scraped_since
+        )
+        if facets is None:
+            return await self.job_repository.search_fulltext(**criteria), None
+
+        return await self.job_repository.search_fulltext_with_facets(
+            **criteria, facets=facets, facet_limit=filter_dto.facet_limit
+        )
@@ -1,48 +1,87 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from app.domain.entities.job import Job
 from app.domain.ports.job_repository import IJobRepository
+from app.domain.ports.job_ingest_queue import IJobIngestQueue
+from app.domain.ports.stats_refresher import IStatsRefresher
 from app.domain.exceptions.job_exceptions import JobValidationError, RepositoryError
 from app.application.dto.job_dto import JobCreateDTO
 
 
+def to_job_entity(job_dto: JobCreateDTO) -> Job:
+    try:
+        return Job(
+            id=job_dto.id,
+            title=job_dto.title,
+            company=job_dto.company,
+            location=job_dto.location,
+            url=job_dto.url,
+            source=job_dto.source,
+            posted_date=job_dto.posted_date,
+            description=job_dto.description,
+            scraped_at=datetime.fromisoformat(job_dto.scraped_at) if job_dto.scraped_at else None,
+        )
+    except (ValueError, TypeError) as e:
+        raise JobValidationError(f"Invalid job data: {str(e)}")
+
+
 class SubmitJobsUseCase:
-    def __init__(self, job_repository: IJobRepository):
+    def __init__(
+        self,
+        job_repository: IJobRepository,
+        stats_refresher: Optional[IStatsRefresher] = None,
+        ingest_queue: Optional[IJobIngestQueue] = None,
+        upsert: bool = False
+    ):
         self.job_repository = job_repository
+        self.stats_refresher = stats_refresher
+        self.ingest_queue = ingest_queue
+        self.upsert = upsert
 
-    async def execute(self, jobs_dto: List[JobCreateDTO]) -> Dict[str, Any]:
-        if not jobs_dto:
+    @property
+    def is_queued(self) -> bool:
+        return self.ingest_queue is not None
+
+    def to_entity(self, job_dto: JobCreateDTO) -> Job:
+        return to_job_entity(job_dto)
+
+    async def save_jobs(self, jobs: List[Job]) -> Dict[str, Any]:
+        if not jobs:
             return {
                 "success": True,
                 "inserted": 0,
+                "updated": 0,
+                "unchanged": 0,
+                "unchanged_ids": [],
                 "duplicates": 0,
+                "duplicate_ids": [],
+                "near_duplicates": [],
                 "total": 0
             }
 
-        jobs = []
-        for job_dto in jobs_dto:
-            try:
-                job = Job(
-                    id=job_dto.id,
-                    title=job_dto.title,
-                    company=job_dto.company,
-                    location=job_dto.location,
-                    url=job_dto.url,
-                    source=job_dto.source,
-                    posted_date=job_dto.posted_date,
-                    description=job_dto.description,
-                    scraped_at=datetime.fromisoformat(job_dto.scraped_at) if job_dto.scraped_at else None,
-                )
-                jobs.append(job)
-            except (ValueError, TypeError) as e:
-                raise JobValidationError(f"Invalid job data: {str(e)}")
-
-        result = await self.job_repository.save_many(jobs)
+        result = await self.job_repository.save_many(jobs, upsert=self.upsert)
+
+        if (result["inserted"] or result.get("updated")) and self.stats_refresher is not None:
+            self.stats_refresher.mark_dirty()
 
         return {
             "success": True,
             "inserted": result["inserted"],
+            "updated": result.get("updated", 0),
+            "unchanged": result.get("unchanged", 0),
+            "unchanged_ids": result.get("unchanged_ids", []),
             "duplicates": result["duplicates"],
+            "duplicate_ids": result["duplicate_ids"],
+            "near_duplicates": result.get("near_duplicates", []),
             "total": result["total"]
         }
+
+    async def execute(self, jobs_dto: List[JobCreateDTO]) -> Dict[str, Any]:
+        jobs = [self.to_entity(job_dto) for job_dto in jobs_dto]
+        return await self.save_jobs(jobs)
+
+    async def enqueue(self, jobs_dto: List[JobCreateDTO]) -> Dict[str, Any]:
+        # Write-behind mode: validate now, insert later in a coalesced batch
+        jobs = [self.to_entity(job_dto) for job_dto in jobs_dto]
+        return await self.ingest_queue.enqueue(jobs)
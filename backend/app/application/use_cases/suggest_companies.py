@@ -0,0 +1,25 @@
+from app.domain.ports.job_repository import IJobRepository
+from app.domain.exceptions.job_exceptions import InvalidSearchCriteriaError
+from app.application.dto.job_dto import CompanySuggestionDTO, CompanySuggestionsDTO
+
+
+class SuggestCompaniesUseCase:
+    def __init__(self, job_repository: IJobRepository):
+        self.job_repository = job_repository
+
+    async def execute(self, query: str, limit: int = 5) -> CompanySuggestionsDTO:
+        if not query or not query.strip():
+            raise InvalidSearchCriteriaError("Query cannot be empty")
+
+        if limit < 1 or limit > 50:
+            raise InvalidSearchCriteriaError("Limit must be between 1 and 50")
+
+        matches = await self.job_repository.suggest_companies(query.strip(), limit)
+
+        return CompanySuggestionsDTO(
+            query=query,
+            suggestions=[
+                CompanySuggestionDTO(company=company, similarity=similarity)
+                for company, similarity in matches
+            ]
+        )
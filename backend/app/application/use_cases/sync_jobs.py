@@ -0,0 +1,33 @@
+from typing import Any, Dict, List, Optional
+
+from app.domain.ports.job_repository import IJobRepository
+
+
+class SyncJobsUseCase:
+    # First phase of a delta upload: the client sends only ids, then submits
+    # the full postings of the missing ones. With content hashes and upserts
+    # enabled, stored postings whose hash differs are reported as changed too;
+    # without upserts a resubmission would only count as a duplicate.
+    def __init__(self, job_repository: IJobRepository, upsert: bool = False):
+        self.job_repository = job_repository
+        self.upsert = upsert
+
+    async def execute(self, job_ids: List[str], hashes: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        unique_ids = list(dict.fromkeys(job_ids))
+        if not hashes or not self.upsert:
+            existing = await self.job_repository.find_existing_ids(unique_ids)
+            changed: List[str] = []
+        else:
+            stored = await self.job_repository.find_content_hashes(unique_ids)
+            existing = set(stored)
+            changed = [
+                job_id for job_id in unique_ids
+                if job_id in stored and job_id in hashes and stored[job_id] != hashes[job_id]
+            ]
+
+        return {
+            "missing": [job_id for job_id in unique_ids if job_id not in existing],
+            "changed": changed,
+            "known": len(existing),
+            "total": len(unique_ids)
+        }
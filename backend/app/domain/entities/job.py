@@ -3,6 +3,18 @@ from datetime import datetime
 from typing import Optional
 
 
+# (field, label in error messages, max length), in validation order; also
+# applied column by column to bulk loads (domain.services.job_validation)
+REQUIRED_FIELDS = (
+    ("id", "ID", 50),
+    ("title", "title", 255),
+    ("company", "company", 255),
+    ("location", "location", 255),
+    ("url", "URL", 500),
+    ("source", "source", 50),
+)
+
+
 @dataclass
 class Job:
     id: str
@@ -16,43 +28,18 @@ class Job:
     scraped_at: Optional[datetime] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
+    # Canonical posting this one was detected as a near-duplicate of
+    duplicate_of: Optional[str] = None
 
     def __post_init__(self):
-        if not self.id or not self.id.strip():
-            raise ValueError("Job ID cannot be empty")
-
-        if not self.title or not self.title.strip():
-            raise ValueError("Job title cannot be empty")
-
-        if not self.company or not self.company.strip():
-            raise ValueError("Job company cannot be empty")
-
-        if not self.location or not self.location.strip():
-            raise ValueError("Job location cannot be empty")
-
-        if not self.url or not self.url.strip():
-            raise ValueError("Job URL cannot be empty")
-
-        if not self.source or not self.source.strip():
-            raise ValueError("Job source cannot be empty")
-
-        if len(self.id) > 50:
-            raise ValueError("Job ID cannot exceed 50 characters")
-
-        if len(self.title) > 255:
-            raise ValueError("Job title cannot exceed 255 characters")
-
-        if len(self.company) > 255:
-            raise ValueError("Job company cannot exceed 255 characters")
-
-        if len(self.location) > 255:
-            raise ValueError("Job location cannot exceed 255 characters")
-
-        if len(self.url) > 500:
-            raise ValueError("Job URL cannot exceed 500 characters")
-
-        if len(self.source) > 50:
-            raise ValueError("Job source cannot exceed 50 characters")
+        for field, label, _ in REQUIRED_FIELDS:
+            value = getattr(self, field)
+            if not value or not value.strip():
+                raise ValueError(f"Job {label} cannot be empty")
+
+        for field, label, max_length in REQUIRED_FIELDS:
+            if len(getattr(self, field)) > max_length:
+                raise ValueError(f"Job {label} cannot exceed {max_length} characters")
 
     def is_from_linkedin(self) -> bool:
         return self.source.lower() == 'linkedin'
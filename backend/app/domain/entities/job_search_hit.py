@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from app.domain.entities.job import Job
+
+
+@dataclass
+class JobSearchHit:
+    job: Job
+    rank: float
+    snippet: Optional[str] = None
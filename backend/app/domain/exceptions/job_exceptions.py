@@ -27,5 +27,22 @@ class RepositoryError(JobDomainException):
         super().__init__(message)
 
 
+class PartialSaveError(RepositoryError):
+    # A batched write stopped part-way: result accounts for what was committed
+    # before the failure (save_many lists the others in result["failed_ids"],
+    # a bulk load gives result["committed_line"] to resume after)
+
+    def __init__(self, message: str, result: dict, original_error: Exception = None):
+        self.result = result
+        super().__init__(message, original_error)
+
+
 class InvalidSearchCriteriaError(JobDomainException):
     pass
+
+
+class IngestQueueFullError(JobDomainException):
+
+    def __init__(self, message: str, retry_after: float = 1.0):
+        self.retry_after = retry_after
+        super().__init__(message)
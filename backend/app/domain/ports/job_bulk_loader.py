@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+
+class IJobBulkLoader(ABC):
+    # Records are validated and normalized (domain.services.job_validation)
+    @abstractmethod
+    async def load_chunk(self, records: List[Dict[str, Any]]) -> Dict[str, int]:
+        pass
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from app.domain.entities.job import Job
+
+
+class IJobIngestQueue(ABC):
+    @abstractmethod
+    async def enqueue(self, jobs: List[Job]) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    def get_ticket(self, ticket_id: str) -> Optional[Dict[str, Any]]:
+        pass
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence, Set, Tuple
 from app.domain.entities.job import Job
+from app.domain.entities.job_search_hit import JobSearchHit
 
 
 class IJobRepository(ABC):
@@ -9,7 +11,7 @@ class IJobRepository(ABC):
         pass
 
     @abstractmethod
-    async def save_many(self, jobs: List[Job]) -> Dict[str, Any]:
+    async def save_many(self, jobs: List[Job], upsert: bool = False) -> Dict[str, Any]:
         pass
 
     @abstractmethod
@@ -20,6 +22,14 @@ class IJobRepository(ABC):
     async def exists_by_id(self, job_id: str) -> bool:
         pass
 
+    @abstractmethod
+    async def find_existing_ids(self, job_ids: List[str]) -> Set[str]:
+        pass
+
+    @abstractmethod
+    async def find_content_hashes(self, job_ids: List[str]) -> Dict[str, Optional[str]]:
+        pass
+
     @abstractmethod
     async def search(
         self,
@@ -28,10 +38,126 @@ class IJobRepository(ABC):
         company: Optional[str] = None,
         source: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[Tuple[datetime, str]] = None,
+        collapse_duplicates: bool = False,
+        include_description: bool = True,
+        scraped_since: Optional[datetime] = None
     ) -> List[Job]:
         pass
 
+    @abstractmethod
+    async def search_rows(
+        self,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, str]] = None,
+        collapse_duplicates: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        scraped_since: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def search_rows_with_facets(
+        self,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, str]] = None,
+        collapse_duplicates: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        scraped_since: Optional[datetime] = None,
+        facets: Sequence[str] = ("company", "location", "source"),
+        facet_limit: int = 10
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def search_fulltext(
+        self,
+        query: str,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        collapse_duplicates: bool = False,
+        include_description: bool = True,
+        scraped_since: Optional[datetime] = None
+    ) -> List[JobSearchHit]:
+        pass
+
+    @abstractmethod
+    async def search_fulltext_with_facets(
+        self,
+        query: str,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        collapse_duplicates: bool = False,
+        include_description: bool = True,
+        scraped_since: Optional[datetime] = None,
+        facets: Sequence[str] = ("company", "location", "source"),
+        facet_limit: int = 10
+    ) -> Tuple[List[JobSearchHit], Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def export_rows(
+        self,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        search_mode: str = "substring",
+        chunk_size: int = 1000,
+        scraped_since: Optional[datetime] = None,
+        key_range: Optional[Tuple[Optional[Tuple[datetime, str]], Optional[Tuple[datetime, str]]]] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        pass
+
+    @abstractmethod
+    async def export_boundaries(
+        self,
+        count: int,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        search_mode: str = "substring",
+        scraped_since: Optional[datetime] = None
+    ) -> List[Tuple[datetime, str]]:
+        pass
+
+    @abstractmethod
+    async def search_facets(
+        self,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        search_mode: str = "substring",
+        collapse_duplicates: bool = False,
+        scraped_since: Optional[datetime] = None,
+        facets: Sequence[str] = ("company", "location", "source"),
+        limit: int = 10
+    ) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def suggest_companies(self, name: str, limit: int = 5) -> List[Tuple[str, float]]:
+        pass
+
     @abstractmethod
     async def count_total(self) -> int:
         pass
@@ -48,6 +174,26 @@ class IJobRepository(ABC):
     async def count_by_source(self) -> Dict[str, int]:
         pass
 
+    @abstractmethod
+    async def get_stats(self) -> Dict[str, Any]:
+        pass
+
+    @abstractmethod
+    async def get_stats_snapshot(self) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    async def refresh_stats_snapshot(self) -> bool:
+        pass
+
+    @abstractmethod
+    async def backfill_fingerprints(self, limit: int = 500) -> int:
+        pass
+
+    @abstractmethod
+    async def rebuild_indexes(self) -> None:
+        pass
+
     @abstractmethod
     async def delete_by_id(self, job_id: str) -> bool:
         pass
@@ -55,3 +201,22 @@ class IJobRepository(ABC):
     @abstractmethod
     async def update(self, job: Job) -> Job:
         pass
+
+    @abstractmethod
+    async def delete_many(self, job_ids: List[str]) -> int:
+        pass
+
+    @abstractmethod
+    async def update_many(self, jobs: List[Job]) -> int:
+        pass
+
+    @abstractmethod
+    async def delete_where(
+        self,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        scraped_before: Optional[datetime] = None,
+        duplicates_only: bool = False
+    ) -> int:
+        pass
@@ -0,0 +1,7 @@
+from abc import ABC, abstractmethod
+
+
+class IStatsRefresher(ABC):
+    @abstractmethod
+    def mark_dirty(self) -> None:
+        pass
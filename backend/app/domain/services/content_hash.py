@@ -0,0 +1,22 @@
+import hashlib
+from typing import Any, Mapping
+
+from app.domain.entities.job import Job
+
+
+# Fields whose change makes a resubmitted posting worth rewriting. scraped_at
+# is left out: every re-scrape has a new one. Clients can compute the same
+# value to ask /api/jobs/sync which of their jobs changed.
+CONTENT_FIELDS = ("title", "company", "location", "url", "source", "posted_date", "description")
+
+_SEPARATOR = "\x1f"
+
+
+def hash_content(values: Mapping[str, Any]) -> str:
+    # SHA-256 hex of the fields joined by the unit separator, missing values as ""
+    content = _SEPARATOR.join(values.get(field) or "" for field in CONTENT_FIELDS)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def job_content_hash(job: Job) -> str:
+    return hash_content({field: getattr(job, field) for field in CONTENT_FIELDS})
@@ -0,0 +1,79 @@
+from datetime import datetime
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from app.domain.entities.job import REQUIRED_FIELDS
+
+
+# posted_date is not bounded by the entity, only by its column; a single
+# oversized value would otherwise fail a whole COPY chunk.
+OPTIONAL_FIELDS = (("posted_date", 100), ("description", None))
+
+DEFAULT_SOURCE = "linkedin"
+
+
+def _fail(errors: Dict[int, str], indexes: Sequence[int], column: Sequence[Any], check, message: str) -> None:
+    # Only the first error of a record is kept, like Job.__post_init__
+    for index in indexes:
+        if index not in errors and check(column[index]):
+            errors[index] = message
+
+
+def validate_job_records(records: Sequence[Mapping[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[int, str]]:
+    # The Job rules applied to a batch of raw records, one column at a time.
+    # Returns the valid records, normalized (source default, parsed
+    # scraped_at), and the error of each rejected record keyed by its index.
+    errors: Dict[int, str] = {}
+    indexes = range(len(records))
+    columns = {
+        field: [record.get(field) for record in records]
+        for field in [field for field, _, _ in REQUIRED_FIELDS] + [field for field, _ in OPTIONAL_FIELDS]
+    }
+    # Same default as the submit payload
+    columns["source"] = [DEFAULT_SOURCE if value is None else value for value in columns["source"]]
+
+    for field, label, _ in REQUIRED_FIELDS:
+        _fail(
+            errors, indexes, columns[field],
+            lambda value: not value or (isinstance(value, str) and not value.strip()),
+            f"Job {label} cannot be empty"
+        )
+    for field, label, _ in REQUIRED_FIELDS:
+        _fail(errors, indexes, columns[field], lambda value: not isinstance(value, str), f"Job {label} must be a string")
+    for field, label, max_length in REQUIRED_FIELDS:
+        _fail(
+            errors, indexes, columns[field],
+            lambda value: len(value) > max_length,
+            f"Job {label} cannot exceed {max_length} characters"
+        )
+    for field, max_length in OPTIONAL_FIELDS:
+        _fail(
+            errors, indexes, columns[field],
+            lambda value: value is not None and not isinstance(value, str),
+            f"Job {field} must be a string"
+        )
+        if max_length is not None:
+            _fail(
+                errors, indexes, columns[field],
+                lambda value: value is not None and len(value) > max_length,
+                f"Job {field} cannot exceed {max_length} characters"
+            )
+
+    scraped_at: List[Optional[datetime]] = []
+    for index, record in enumerate(records):
+        value = record.get("scraped_at")
+        parsed = None
+        if value is not None and index not in errors:
+            try:
+                parsed = datetime.fromisoformat(value)
+            except (TypeError, ValueError) as e:
+                errors[index] = f"Invalid job data: {str(e)}"
+        scraped_at.append(parsed)
+
+    valid = [
+        {
+            **{field: column[index] for field, column in columns.items()},
+            "scraped_at": scraped_at[index],
+        }
+        for index in indexes if index not in errors
+    ]
+    return valid, errors
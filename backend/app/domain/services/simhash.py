@@ -0,0 +1,149 @@
+import hashlib
+import itertools
+import re
+from typing import Iterable, List, Optional, Tuple
+
+from app.domain.entities.job import Job
+
+
+FINGERPRINT_BITS = 64
+MAX_INDEXED_DISTANCE = 3
+
+# The fingerprint is cut into BLOCK_COUNT blocks (11, 11, 11, 11, 10, 10 bits)
+# and every choice of BLOCK_COUNT - MAX_INDEXED_DISTANCE blocks is a band.
+# MAX_INDEXED_DISTANCE differing bits touch at most that many blocks, so two
+# fingerprints that close always agree on one whole band: band equality is a
+# lossless pre-filter, with no false negatives up to that distance. Each band
+# spans 30 to 33 bits, so an unrelated row shares a given key with probability
+# about 2^-32 instead of 2^-16 with four 16-bit bands, and candidate fetches
+# stay small as the table grows. The price is BAND_COUNT (20) keys per row in
+# the GIN index.
+BLOCK_COUNT = 6
+_BLOCK_WIDTHS = [
+    FINGERPRINT_BITS // BLOCK_COUNT + (1 if block < FINGERPRINT_BITS % BLOCK_COUNT else 0)
+    for block in range(BLOCK_COUNT)
+]
+_BLOCK_STARTS = [sum(_BLOCK_WIDTHS[:block]) for block in range(BLOCK_COUNT)]
+BANDS = tuple(itertools.combinations(range(BLOCK_COUNT), BLOCK_COUNT - MAX_INDEXED_DISTANCE))
+BAND_COUNT = len(BANDS)
+
+# Keys are stored as INTEGER: the band number and its bits (up to 38 bits) are
+# hashed down to 32. A collision only adds a candidate, which the exact
+# Hamming check then rejects.
+_KEY_MULTIPLIER = 0x9E3779B97F4A7C15
+
+SHINGLE_SIZE = 3
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+_URL_PATTERN = re.compile(r"https?://\S+")
+_MASK = (1 << FINGERPRINT_BITS) - 1
+
+# Per-bit vote counters are packed side by side in one Python int, so a
+# feature is accumulated with 8 byte-table lookups instead of 64 bit tests.
+_COUNTER_BITS = 24
+_COUNTER_MASK = (1 << _COUNTER_BITS) - 1
+_SPREAD = [
+    sum(1 << (bit * _COUNTER_BITS) for bit in range(8) if byte >> bit & 1)
+    for byte in range(256)
+]
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN_PATTERN.findall(_URL_PATTERN.sub(" ", text.lower()))
+
+
+def _shingles(tokens: List[str]) -> Iterable[str]:
+    if len(tokens) < SHINGLE_SIZE:
+        return tokens
+    return (" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1))
+
+
+def _digest(feature: str) -> bytes:
+    return hashlib.blake2b(feature.encode("utf-8"), digest_size=FINGERPRINT_BITS // 8).digest()
+
+
+def simhash(text: str) -> int:
+    counters = 0
+    features = 0
+
+    for feature in _shingles(_tokens(text)):
+        # Byte k of the little-endian digest holds bits 8k..8k+7
+        for position, byte in enumerate(_digest(feature)):
+            counters += _SPREAD[byte] << (position * 8 * _COUNTER_BITS)
+        features += 1
+
+    fingerprint = 0
+    for bit in range(FINGERPRINT_BITS):
+        # Majority vote: the bit is set when more features set it than not
+        if 2 * (counters >> (bit * _COUNTER_BITS) & _COUNTER_MASK) > features:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def content_fingerprint(title: str, company: str, description: Optional[str]) -> int:
+    # Location, url and source are left out on purpose: a repost keeps the
+    # same wording but often changes the tracking url or the listed city.
+    return simhash(" ".join(part for part in (title, company, description) if part))
+
+
+def job_fingerprint(job: Job) -> int:
+    return content_fingerprint(job.title, job.company, job.description)
+
+
+def hamming_distance(left: int, right: int) -> int:
+    return bin((left ^ right) & _MASK).count("1")
+
+
+def band_keys(fingerprint: int) -> List[int]:
+    blocks = [
+        fingerprint >> start & ((1 << width) - 1)
+        for start, width in zip(_BLOCK_STARTS, _BLOCK_WIDTHS)
+    ]
+    keys = []
+    for band, members in enumerate(BANDS):
+        # Band number in the high bits keeps keys from different bands apart
+        value = band
+        for block in members:
+            value = value << _BLOCK_WIDTHS[block] | blocks[block]
+        # Multiplicative hashing: the high 32 bits, as a signed INTEGER
+        key = (value * _KEY_MULTIPLIER & _MASK) >> 32
+        keys.append(key - (1 << 32) if key >> 31 else key)
+    return keys
+
+
+def to_signed(fingerprint: int) -> int:
+    # Postgres BIGINT is signed
+    return fingerprint - (1 << FINGERPRINT_BITS) if fingerprint >> (FINGERPRINT_BITS - 1) else fingerprint
+
+
+def to_unsigned(value: Optional[int]) -> Optional[int]:
+    if value is None:
+        return None
+    return value & _MASK
+
+
+class NearDuplicateIndex:
+    # In-memory banded index, used to match a batch against the candidates
+    # fetched from storage and against the batch's own earlier entries.
+    def __init__(self, max_distance: int = MAX_INDEXED_DISTANCE):
+        if not 0 <= max_distance <= MAX_INDEXED_DISTANCE:
+            raise ValueError(f"Near-duplicate distance must be between 0 and {MAX_INDEXED_DISTANCE}")
+        self.max_distance = max_distance
+        self._buckets: dict = {}
+
+    def add(self, job_id: str, fingerprint: int, canonical_id: Optional[str] = None) -> None:
+        entry = (job_id, fingerprint, canonical_id or job_id)
+        for key in band_keys(fingerprint):
+            self._buckets.setdefault(key, []).append(entry)
+
+    def find(self, job_id: str, fingerprint: int) -> Optional[Tuple[str, int]]:
+        # Closest cluster within max_distance, as (canonical_id, distance)
+        best = None
+        for key in band_keys(fingerprint):
+            for candidate_id, candidate_fingerprint, canonical_id in self._buckets.get(key, ()):
+                if candidate_id == job_id or canonical_id == job_id:
+                    continue
+                distance = hamming_distance(fingerprint, candidate_fingerprint)
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (canonical_id, distance)
+        return best
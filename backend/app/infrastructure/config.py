@@ -0,0 +1,100 @@
+from functools import lru_cache
+from typing import List, Literal, Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    database_url: str = "postgresql://offeruser:offerpass@db:5432/offerdb"
+    # Comma-separated read replicas; read-only use cases are routed to them
+    database_replica_urls: str = ""
+    # Seconds an unreachable replica is skipped before being tried again
+    db_replica_failure_cooldown: float = 30.0
+    # Reads from a client that just submitted go to the primary (0 disables)
+    read_your_writes_seconds: float = 0.0
+
+    # Connection pool (per worker process: size workers so that
+    # workers * (db_pool_size + db_max_overflow) stays under max_connections)
+    db_echo: bool = False
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+
+    # asyncpg prepared statement caches; set to 0 behind pgbouncer in transaction mode
+    db_statement_cache_size: int = 100
+    # Server-side bound applied to every statement, 0 disables it
+    db_statement_timeout_ms: int = 0
+
+    jobs_batch_size: int = 500
+
+    # Monthly RANGE partitions of jobs on scraped_at (new databases only:
+    # an existing plain jobs table is not converted)
+    jobs_partitioning_enabled: bool = False
+    # Partitions created ahead of the current month
+    jobs_partition_premake_months: int = 3
+    # Partitions entirely older than this many months are removed (0 keeps everything)
+    jobs_retention_months: int = 0
+    # detach keeps expired partitions as standalone tables, drop deletes them
+    jobs_retention_mode: Literal["detach", "drop"] = "detach"
+    partition_maintenance_interval: float = 3600.0
+
+    # Write-behind mode for POST /api/jobs/submit (202 + ticket)
+    ingest_queue_enabled: bool = False
+    ingest_queue_batch_size: int = 2000
+    ingest_queue_flush_interval: float = 0.5
+    ingest_queue_max_pending: int = 50000
+    ingest_queue_ticket_retention: int = 10000
+    ingest_chunk_size: int = 1000
+    # Resubmitted postings whose content hash changed are rewritten instead
+    # of being reported as duplicates
+    ingest_upsert_enabled: bool = False
+    export_chunk_size: int = 1000
+    # Rows per COPY + merge transaction of the bulk loader
+    bulk_load_chunk_size: int = 50000
+    # Default --concurrency of the offer-search command line
+    cli_concurrency: int = 4
+    # Max SimHash Hamming distance (0-3) between two near-duplicate postings
+    near_duplicate_enabled: bool = True
+    near_duplicate_distance: int = 3
+
+    stats_refresh_interval: float = 30.0
+    stats_max_staleness: float = 300.0
+
+    cache_enabled: bool = True
+    cache_max_entries: int = 1024
+    cache_search_ttl: float = 30.0
+    cache_suggest_ttl: float = 300.0
+    cache_stats_ttl: float = 15.0
+
+    metrics_enabled: bool = True
+
+    # Statements slower than this are kept in a ring buffer (0 disables it)
+    slow_query_threshold_ms: float = 500.0
+    slow_query_log_size: int = 100
+    # Share of slow SELECTs re-run under EXPLAIN (ANALYZE, BUFFERS) in the background
+    slow_query_explain_sample_rate: float = 0.0
+    slow_query_explain_timeout_ms: int = 10000
+
+    # Required in X-Admin-Token by /admin endpoints; unset keeps them closed
+    admin_token: Optional[str] = None
+
+    @property
+    def async_database_url(self) -> str:
+        return self.database_url.replace("postgresql://", "postgresql+asyncpg://")
+
+    @property
+    def async_replica_urls(self) -> List[str]:
+        return [
+            url.strip().replace("postgresql://", "postgresql+asyncpg://")
+            for url in self.database_replica_urls.split(",")
+            if url.strip()
+        ]
+
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
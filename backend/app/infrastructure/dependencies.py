@@ -1,34 +1,219 @@
-from typing import AsyncGenerator
-from fastapi import Depends
+from contextlib import asynccontextmanager
+import hmac
+from typing import AsyncGenerator, AsyncIterator, Optional
+from fastapi import Depends, Header, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.infrastructure.secondary.persistence.database import get_async_db
+from app.infrastructure.config import get_settings
+from app.infrastructure.metrics import metrics_registry
+from app.infrastructure.secondary.persistence.database import (
+    get_async_db,
+    AsyncSessionLocal,
+    replica_router,
+    set_statement_timeout
+)
 from app.infrastructure.secondary.persistence.sqlalchemy_job_repository import SQLAlchemyJobRepository
+from app.infrastructure.secondary.persistence.stats_refresher import StatsSnapshotRefresher
+from app.infrastructure.secondary.persistence.partition_manager import JobPartitionManager
+from app.infrastructure.secondary.persistence.bulk_loader import CopyJobBulkLoader
+from app.infrastructure.secondary.queue.write_behind_queue import WriteBehindIngestQueue
+from app.infrastructure.secondary.cache.ttl_cache import TTLCache
+from app.infrastructure.secondary.cache.cached_job_repository import (
+    CachedJobRepository,
+    SEARCH,
+    SUGGEST,
+    STATS
+)
 from app.domain.ports.job_repository import IJobRepository
 from app.application.use_cases.submit_jobs import SubmitJobsUseCase
+from app.application.use_cases.get_submit_ticket import GetSubmitTicketUseCase
+from app.application.use_cases.ingest_job_stream import IngestJobStreamUseCase
 from app.application.use_cases.search_jobs import SearchJobsUseCase
 from app.application.use_cases.get_stats import GetStatsUseCase
+from app.application.use_cases.suggest_companies import SuggestCompaniesUseCase
+from app.application.use_cases.export_jobs import ExportJobsUseCase
+from app.application.use_cases.manage_jobs import ManageJobsUseCase
+from app.application.use_cases.sync_jobs import SyncJobsUseCase
+from app.application.use_cases.bulk_load_jobs import BulkLoadJobsUseCase
+from app.application.use_cases.reindex_jobs import ReindexJobsUseCase
+
+
+settings = get_settings()
+
+job_cache = TTLCache(max_entries=settings.cache_max_entries)
+if settings.metrics_enabled:
+    job_cache.register_metrics(metrics_registry)
+
+
+def build_job_repository(session: AsyncSession) -> IJobRepository:
+    repository = SQLAlchemyJobRepository(
+        session,
+        batch_size=settings.jobs_batch_size,
+        near_duplicate_distance=settings.near_duplicate_distance if settings.near_duplicate_enabled else None
+    )
+    if settings.cache_enabled:
+        return CachedJobRepository(repository, job_cache, ttls={
+            SEARCH: settings.cache_search_ttl,
+            SUGGEST: settings.cache_suggest_ttl,
+            STATS: settings.cache_stats_ttl,
+        })
+    return repository
+
+
+@asynccontextmanager
+async def export_repository_scope() -> AsyncIterator[IJobRepository]:
+    # Full-table scans are the reads replicas are for
+    async with replica_router.read_session() as session:
+        # Long-running by design: lift the per-statement bound for this transaction
+        await set_statement_timeout(session, 0)
+        yield SQLAlchemyJobRepository(session, batch_size=settings.jobs_batch_size)
+
+
+@asynccontextmanager
+async def maintenance_repository_scope() -> AsyncIterator[IJobRepository]:
+    # Primary, uncached: for command-line maintenance outside any request
+    async with AsyncSessionLocal() as session:
+        yield SQLAlchemyJobRepository(session, batch_size=settings.jobs_batch_size)
+
+
+stats_refresher = StatsSnapshotRefresher(
+    AsyncSessionLocal,
+    interval_seconds=settings.stats_refresh_interval,
+    repository_factory=build_job_repository
+)
+
+partition_manager = JobPartitionManager(
+    AsyncSessionLocal,
+    premake_months=settings.jobs_partition_premake_months,
+    retention_months=settings.jobs_retention_months,
+    retention_mode=settings.jobs_retention_mode,
+    interval_seconds=settings.partition_maintenance_interval,
+    stats_refresher=stats_refresher
+) if settings.jobs_partitioning_enabled else None
+
+bulk_loader = CopyJobBulkLoader(AsyncSessionLocal, cache=job_cache if settings.cache_enabled else None)
+
+ingest_queue = WriteBehindIngestQueue(
+    AsyncSessionLocal,
+    repository_factory=build_job_repository,
+    stats_refresher=stats_refresher,
+    batch_size=settings.ingest_queue_batch_size,
+    flush_interval=settings.ingest_queue_flush_interval,
+    max_pending=settings.ingest_queue_max_pending,
+    ticket_retention=settings.ingest_queue_ticket_retention,
+    upsert=settings.ingest_upsert_enabled
+) if settings.ingest_queue_enabled else None
+
+
+CLIENT_ID_HEADER = "X-Client-Id"
+
+
+def get_client_key(request: Request) -> Optional[str]:
+    # Extension instances may identify themselves; otherwise fall back to the peer address
+    client_id = request.headers.get(CLIENT_ID_HEADER)
+    if client_id:
+        return client_id
+    return request.client.host if request.client else None
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with replica_router.read_session(get_client_key(request)) as session:
+        yield session
 
 
 async def get_job_repository(
     session: AsyncSession = Depends(get_async_db)
 ) -> IJobRepository:
-    return SQLAlchemyJobRepository(session)
+    return build_job_repository(session)
+
+
+async def get_read_job_repository(
+    session: AsyncSession = Depends(get_read_db)
+) -> IJobRepository:
+    return build_job_repository(session)
 
 
 async def get_submit_jobs_use_case(
+    request: Request,
     repository: IJobRepository = Depends(get_job_repository)
 ) -> SubmitJobsUseCase:
-    return SubmitJobsUseCase(repository)
+    replica_router.mark_write(get_client_key(request))
+    return SubmitJobsUseCase(
+        repository,
+        stats_refresher=stats_refresher,
+        ingest_queue=ingest_queue,
+        upsert=settings.ingest_upsert_enabled
+    )
+
+
+async def get_submit_ticket_use_case() -> GetSubmitTicketUseCase:
+    # No session and no mark_write: polling must not pin the client to the primary
+    return GetSubmitTicketUseCase(ingest_queue)
+
+
+async def get_ingest_job_stream_use_case(
+    submit_use_case: SubmitJobsUseCase = Depends(get_submit_jobs_use_case)
+) -> IngestJobStreamUseCase:
+    return IngestJobStreamUseCase(submit_use_case, chunk_size=settings.ingest_chunk_size)
+
+
+async def get_sync_jobs_use_case(
+    repository: IJobRepository = Depends(get_read_job_repository)
+) -> SyncJobsUseCase:
+    return SyncJobsUseCase(repository, upsert=settings.ingest_upsert_enabled)
 
 
 async def get_search_jobs_use_case(
-    repository: IJobRepository = Depends(get_job_repository)
+    repository: IJobRepository = Depends(get_read_job_repository)
 ) -> SearchJobsUseCase:
     return SearchJobsUseCase(repository)
 
 
 async def get_get_stats_use_case(
-    repository: IJobRepository = Depends(get_job_repository)
+    repository: IJobRepository = Depends(get_read_job_repository)
 ) -> GetStatsUseCase:
-    return GetStatsUseCase(repository)
+    return GetStatsUseCase(repository, max_staleness_seconds=settings.stats_max_staleness)
+
+
+async def get_suggest_companies_use_case(
+    repository: IJobRepository = Depends(get_read_job_repository)
+) -> SuggestCompaniesUseCase:
+    return SuggestCompaniesUseCase(repository)
+
+
+def build_export_jobs_use_case() -> ExportJobsUseCase:
+    return ExportJobsUseCase(export_repository_scope, chunk_size=settings.export_chunk_size)
+
+
+async def get_export_jobs_use_case() -> ExportJobsUseCase:
+    return build_export_jobs_use_case()
+
+
+async def get_manage_jobs_use_case(
+    repository: IJobRepository = Depends(get_job_repository)
+) -> ManageJobsUseCase:
+    return ManageJobsUseCase(repository, stats_refresher=stats_refresher)
+
+
+def build_bulk_load_use_case() -> BulkLoadJobsUseCase:
+    return BulkLoadJobsUseCase(
+        bulk_loader,
+        stats_refresher=stats_refresher,
+        chunk_size=settings.bulk_load_chunk_size
+    )
+
+
+def build_reindex_jobs_use_case() -> ReindexJobsUseCase:
+    return ReindexJobsUseCase(maintenance_repository_scope, batch_size=settings.jobs_batch_size)
+
+
+async def get_bulk_load_jobs_use_case() -> BulkLoadJobsUseCase:
+    return build_bulk_load_use_case()
+
+
+async def require_admin_token(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    # Admin endpoints expose raw SQL parameters: closed until ADMIN_TOKEN is set
+    if not settings.admin_token:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled")
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token, settings.admin_token):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
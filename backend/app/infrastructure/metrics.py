@@ -0,0 +1,181 @@
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds, from a cached read to a slow export page
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    type_name = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.callback = callback
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *label_values: str, amount: float = 1) -> None:
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values: str) -> float:
+        return self._values.get(label_values, 0)
+
+    def samples(self) -> Iterable[str]:
+        values = self.callback() if self.callback is not None else self._values
+        for label_values, value in list(values.items()):
+            yield f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(value)}"
+
+
+class Histogram:
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts (last one is +Inf), sum, count].
+        # Buckets are stored non-cumulative so an observation is a single
+        # bisect and increment; they are accumulated at scrape time.
+        self._series: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, *label_values: str) -> None:
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def count(self, *label_values: str) -> int:
+        series = self._series.get(label_values)
+        return series[2] if series else 0
+
+    def sum(self, *label_values: str) -> float:
+        series = self._series.get(label_values)
+        return series[1] if series else 0.0
+
+    def samples(self) -> Iterable[str]:
+        for label_values, (counts, total, count) in list(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.label_names, label_values, f'le="{_format_value(bound)}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.label_names, label_values)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+class Gauge:
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.callback = callback
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, *label_values: str) -> None:
+        self._values[label_values] = value
+
+    def samples(self) -> Iterable[str]:
+        values = self.callback() if self.callback is not None else self._values
+        for label_values, value in list(values.items()):
+            yield f"{self.name}{_format_labels(self.label_names, label_values)} {_format_value(value)}"
+
+
+# Counters and gauges accept a callback read at scrape time, so sources that
+# already keep their own counters (pool, cache) cost nothing on the hot path.
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None
+    ) -> Counter:
+        return self._register(Counter(name, documentation, label_names, callback))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Sequence[str] = (),
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, label_names, callback))
+
+    def get(self, name: str):
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+metrics_registry = MetricsRegistry()
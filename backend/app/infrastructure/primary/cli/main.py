@@ -0,0 +1,234 @@
+"""Command line for bulk operations, run next to the API rather than through it.
+
+Usage:
+    offer-search import archive.ndjson.gz --concurrency 4
+    offer-search export jobs.parquet --format parquet --source linkedin --concurrency 4
+    offer-search reindex --concurrency 4 --rebuild-indexes
+    offer-search stats
+
+Reads the same settings as the API (DATABASE_URL, ...). Progress goes to
+stderr, results to stdout as JSON.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, TextIO
+
+
+READ_SIZE = 1024 * 1024
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def print_result(result: Dict[str, Any], stream: TextIO = sys.stdout) -> None:
+    print(json.dumps(result, indent=2, default=_json_default), file=stream)
+
+
+def print_progress(message: str) -> None:
+    print(message, file=sys.stderr, flush=True)
+
+
+async def read_chunks(handle: BinaryIO) -> AsyncIterator[bytes]:
+    # Blocking reads off the event loop, one megabyte at a time
+    while True:
+        data = await asyncio.to_thread(handle.read, READ_SIZE)
+        if not data:
+            return
+        yield data
+
+
+async def import_jobs(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.infrastructure.dependencies import build_bulk_load_use_case
+    from app.infrastructure.primary.http.ndjson import iter_ndjson_lines
+
+    def report(progress: Dict[str, Any]) -> None:
+        print_progress(
+            f"chunk {progress['chunk']}: {progress['loaded']} lines loaded, "
+            f"{progress['inserted']} inserted, {progress['duplicates']} duplicates, "
+            f"{progress['invalid']} invalid ({progress['rows_per_s']:.0f} rows/s)"
+        )
+
+    use_case = build_bulk_load_use_case()
+    gzip = args.gzip or args.path.endswith(".gz")
+
+    async def run(handle: BinaryIO) -> Dict[str, Any]:
+        return await use_case.execute(
+            iter_ndjson_lines(read_chunks(handle), gzip=gzip),
+            chunk_size=args.chunk_size,
+            on_progress=report,
+            concurrency=args.concurrency
+        )
+
+    if args.path == "-":
+        return await run(sys.stdin.buffer)
+    with open(args.path, "rb") as handle:
+        return await run(handle)
+
+
+async def export_jobs(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.application.dto.job_dto import JobExportFilterDTO
+    from app.infrastructure.dependencies import build_export_jobs_use_case
+    from app.infrastructure.primary.http.export_formats import EXPORT_FORMATS, ensure_format_available
+
+    ensure_format_available(args.format)
+    filter_dto = JobExportFilterDTO(
+        search=args.search,
+        location=args.location,
+        company=args.company,
+        source=args.source,
+        search_mode=args.search_mode,
+        scraped_since=args.scraped_since,
+        format=args.format
+    )
+    use_case = build_export_jobs_use_case()
+    encode = EXPORT_FORMATS[args.format][2]
+    started = time.perf_counter()
+    counts = {"rows": 0, "reported_at": started}
+
+    async def counted(batches: AsyncIterator[List[Dict[str, Any]]]) -> AsyncIterator[List[Dict[str, Any]]]:
+        async for rows in batches:
+            counts["rows"] += len(rows)
+            now = time.perf_counter()
+            if now - counts["reported_at"] >= 1.0:
+                counts["reported_at"] = now
+                print_progress(f"{counts['rows']} rows exported ({counts['rows'] / (now - started):.0f} rows/s)")
+            yield rows
+
+    async def write(handle: BinaryIO) -> None:
+        batches = use_case.execute_parallel(filter_dto, concurrency=args.concurrency)
+        async for data in encode(counted(batches)):
+            await asyncio.to_thread(handle.write, data)
+
+    if args.path == "-":
+        await write(sys.stdout.buffer)
+        sys.stdout.buffer.flush()
+    else:
+        with open(args.path, "wb") as handle:
+            await write(handle)
+
+    elapsed = time.perf_counter() - started
+    return {
+        "rows": counts["rows"],
+        "format": args.format,
+        "elapsed_s": round(elapsed, 3),
+        "rows_per_s": round(counts["rows"] / elapsed, 1) if elapsed else 0.0
+    }
+
+
+async def reindex_jobs(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.infrastructure.dependencies import build_reindex_jobs_use_case
+
+    def report(progress: Dict[str, Any]) -> None:
+        print_progress(f"batch {progress['batches']}: {progress['backfilled']} rows backfilled")
+
+    return await build_reindex_jobs_use_case().execute(
+        concurrency=args.concurrency,
+        rebuild_indexes=args.rebuild_indexes,
+        on_progress=report
+    )
+
+
+async def refresh_stats(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.application.use_cases.get_stats import GetStatsUseCase
+    from app.infrastructure.dependencies import maintenance_repository_scope, stats_refresher
+
+    refreshed = await stats_refresher.refresh()
+    if not refreshed:
+        print_progress("another refresh is running, showing the current snapshot")
+    async with maintenance_repository_scope() as repository:
+        stats = await GetStatsUseCase(repository).execute()
+    return {"refreshed": refreshed, **stats.model_dump()}
+
+
+COMMANDS = {
+    "import": import_jobs,
+    "export": export_jobs,
+    "reindex": reindex_jobs,
+    "stats": refresh_stats,
+}
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    from app.infrastructure.config import get_settings
+
+    settings = get_settings()
+    parser = argparse.ArgumentParser(prog="offer-search", description="Offer Search bulk operations")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_concurrency(command: argparse.ArgumentParser, what: str) -> None:
+        command.add_argument("--concurrency", type=int, default=settings.cli_concurrency,
+                             help=f"{what} at once, one database connection each (default CLI_CONCURRENCY)")
+
+    import_command = commands.add_parser("import", help="Bulk load an NDJSON file through COPY")
+    import_command.add_argument("path", help="NDJSON file, gzip if it ends in .gz, or - for stdin")
+    import_command.add_argument("--chunk-size", type=int, default=None,
+                                help="Rows per COPY transaction (default BULK_LOAD_CHUNK_SIZE)")
+    import_command.add_argument("--gzip", action="store_true", help="Force gzip decompression")
+    add_concurrency(import_command, "Chunks merged")
+
+    export_command = commands.add_parser("export", help="Export jobs to a file")
+    export_command.add_argument("path", help="Output file, or - for stdout")
+    export_command.add_argument("--format", choices=["ndjson", "csv", "parquet"], default="ndjson")
+    export_command.add_argument("--search")
+    export_command.add_argument("--search-mode", choices=["substring", "fulltext"], default="substring")
+    export_command.add_argument("--location")
+    export_command.add_argument("--company")
+    export_command.add_argument("--source")
+    export_command.add_argument("--scraped-since", type=datetime.fromisoformat)
+    add_concurrency(export_command, "Key ranges read")
+
+    reindex_command = commands.add_parser("reindex", help="Backfill fingerprints and rebuild indexes")
+    reindex_command.add_argument("--rebuild-indexes", action="store_true",
+                                 help="Then run REINDEX TABLE CONCURRENTLY on jobs")
+    add_concurrency(reindex_command, "Batches backfilled")
+
+    commands.add_parser("stats", help="Refresh the stats snapshot and print it")
+
+    args = parser.parse_args(argv)
+    if getattr(args, "concurrency", 1) < 1:
+        parser.error("--concurrency must be at least 1")
+    return args
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.infrastructure.secondary.persistence.database import async_engine
+
+    try:
+        return await COMMANDS[args.command](args)
+    finally:
+        await async_engine.dispose()
+
+
+def main(argv=None) -> int:
+    from app.domain.exceptions.job_exceptions import (
+        InvalidSearchCriteriaError,
+        JobValidationError,
+        PartialSaveError,
+        RepositoryError
+    )
+
+    args = parse_args(argv)
+    try:
+        result = asyncio.run(run(args))
+    except (InvalidSearchCriteriaError, JobValidationError, RepositoryError) as e:
+        # Work committed before the failure (import chunks, reindex batches) is kept
+        print_progress(f"{args.command} failed: {e}")
+        if isinstance(e, PartialSaveError):
+            print_result(e.result)
+        return 1
+
+    # An export to stdout keeps stdout for the data
+    to_stdout = args.command == "export" and args.path == "-"
+    print_result(result, sys.stderr if to_stdout else sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Tuple
+
+from app.domain.exceptions.job_exceptions import InvalidSearchCriteriaError
+
+
+EXPORT_FIELDS = (
+    "id", "title", "company", "location", "url", "posted_date",
+    "description", "source", "scraped_at", "created_at", "updated_at",
+)
+TIMESTAMP_FIELDS = ("scraped_at", "created_at", "updated_at")
+
+Batches = AsyncIterator[List[Dict[str, Any]]]
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+async def encode_ndjson(batches: Batches) -> AsyncIterator[bytes]:
+    async for rows in batches:
+        if rows:
+            yield "".join(
+                json.dumps(row, default=_json_default, ensure_ascii=False) + "\n" for row in rows
+            ).encode("utf-8")
+
+
+async def encode_csv(batches: Batches) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+
+    async for rows in batches:
+        for row in rows:
+            writer.writerow({
+                key: value.isoformat() if isinstance(value, datetime) else value
+                for key, value in row.items()
+            })
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _DrainableSink(io.RawIOBase):
+    # Write-only file handed to ParquetWriter; bytes are drained after each row group
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _parquet_modules():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise InvalidSearchCriteriaError("Parquet export requires the optional 'pyarrow' dependency")
+    return pyarrow, pyarrow.parquet
+
+
+def ensure_format_available(export_format: str) -> None:
+    # Checked before the response starts: errors cannot be reported mid-stream
+    if export_format == "parquet":
+        _parquet_modules()
+
+
+async def encode_parquet(batches: Batches) -> AsyncIterator[bytes]:
+    pa, pq = _parquet_modules()
+    schema = pa.schema([
+        (field, pa.timestamp("us", tz="UTC") if field in TIMESTAMP_FIELDS else pa.string())
+        for field in EXPORT_FIELDS
+    ])
+    sink = _DrainableSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+
+    try:
+        async for rows in batches:
+            if rows:
+                # One row group per fetched chunk keeps memory constant
+                writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+                yield sink.drain()
+    finally:
+        writer.close()
+
+    yield sink.drain()
+
+
+EXPORT_FORMATS: Dict[str, Tuple[str, str, Callable[[Batches], AsyncIterator[bytes]]]] = {
+    "ndjson": ("application/x-ndjson", "ndjson", encode_ndjson),
+    "csv": ("text/csv; charset=utf-8", "csv", encode_csv),
+    "parquet": ("application/vnd.apache.parquet", "parquet", encode_parquet),
+}
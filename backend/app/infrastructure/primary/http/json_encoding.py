@@ -0,0 +1,44 @@
+import json
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # optional 'fast-json' extra
+    orjson = None
+
+
+# Fields of JobResponseDTO that only the fulltext path fills in
+RESPONSE_DEFAULTS = {"rank": None, "snippet": None}
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        # Same rendering as pydantic: UTC as a trailing Z
+        text = value.isoformat()
+        return text[:-6] + "Z" if value.utcoffset() == timezone.utc.utcoffset(None) else text
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_UTC_Z)
+    return json.dumps(value, default=_json_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def rows_response(
+    rows: List[Dict[str, Any]],
+    headers: Dict[str, str] = None,
+    projected: bool = False,
+    facets: Optional[Dict[str, Any]] = None
+) -> Response:
+    # Rows already match JobResponseDTO, so FastAPI's validation and
+    # jsonable_encoder pass are skipped by returning the encoded bytes.
+    # Projected rows are sent with exactly the requested fields.
+    body: Any = rows if projected else [{**row, **RESPONSE_DEFAULTS} for row in rows]
+    if facets is not None:
+        # Faceted searches wrap the page: {"results": [...], "total": n, "facets": {...}}
+        body = {"results": body, **facets}
+    return Response(content=dumps(body), media_type="application/json", headers=headers)
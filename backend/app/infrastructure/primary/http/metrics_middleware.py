@@ -0,0 +1,47 @@
+import time
+
+from app.infrastructure.metrics import MetricsRegistry
+
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    # Plain ASGI middleware: no request/response objects are built, the route
+    # template (e.g. /api/jobs/search) is read from the scope FastAPI's router
+    # filled in, which keeps the label cardinality bounded.
+    def __init__(self, app, registry: MetricsRegistry, excluded_paths=("/metrics",)):
+        self.app = app
+        self.excluded_paths = frozenset(excluded_paths)
+        self.requests = registry.counter(
+            "http_requests_total",
+            "HTTP requests handled, by method, route and status",
+            ("method", "route", "status")
+        )
+        self.duration = registry.histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency until the response is fully sent, by method, route and status",
+            ("method", "route", "status")
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            labels = (scope["method"], getattr(route, "path", UNMATCHED_ROUTE), str(status))
+            self.requests.inc(*labels)
+            self.duration.observe(time.perf_counter() - start, *labels)
@@ -0,0 +1,54 @@
+import zlib
+from typing import AsyncIterator, Tuple
+
+from app.domain.exceptions.job_exceptions import JobValidationError
+
+
+MAX_LINE_BYTES = 1024 * 1024
+
+
+async def iter_ndjson_lines(
+    chunks: AsyncIterator[bytes],
+    gzip: bool = False,
+    max_line_bytes: int = MAX_LINE_BYTES
+) -> AsyncIterator[Tuple[int, bytes]]:
+    # Only the current partial line is held in memory, whatever the payload size
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if gzip else None
+    pending = b""
+    line_number = 0
+
+    async def decoded() -> AsyncIterator[bytes]:
+        async for chunk in chunks:
+            if decompressor is None:
+                yield chunk
+                continue
+            # At most one line's worth of output per call: a small, highly
+            # compressible chunk is inflated piece by piece, so an oversized
+            # line is rejected before the rest of it is ever decompressed.
+            data = chunk
+            while data:
+                try:
+                    yield decompressor.decompress(data, max_line_bytes)
+                except zlib.error as e:
+                    raise JobValidationError(f"Invalid gzip payload: {str(e)}")
+                data = decompressor.unconsumed_tail
+        if decompressor is not None:
+            yield decompressor.flush()
+
+    async for data in decoded():
+        if not data:
+            continue
+
+        lines = (pending + data).split(b"\n")
+        pending = lines.pop()
+
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                yield line_number, line
+
+        if len(pending) > max_line_bytes:
+            raise JobValidationError(f"Line {line_number + 1} exceeds {max_line_bytes} bytes")
+
+    if pending.strip():
+        yield line_number + 1, pending
@@ -0,0 +1,141 @@
+import logging
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+
+from app.application.dto.job_dto import (
+    JobDeleteFilterDTO,
+    JobsBulkLoadResponseDTO,
+    JobsDeleteRequestDTO,
+    JobsDeleteResponseDTO,
+    JobsUpdateRequestDTO,
+    JobsUpdateResponseDTO
+)
+from app.application.use_cases.bulk_load_jobs import BulkLoadJobsUseCase
+from app.application.use_cases.manage_jobs import ManageJobsUseCase
+from app.domain.exceptions.job_exceptions import (
+    InvalidSearchCriteriaError,
+    JobValidationError,
+    PartialSaveError,
+    RepositoryError
+)
+from app.infrastructure.dependencies import (
+    get_bulk_load_jobs_use_case,
+    get_manage_jobs_use_case,
+    partition_manager,
+    require_admin_token
+)
+from app.infrastructure.primary.http.ndjson import iter_ndjson_lines
+from app.infrastructure.secondary.persistence.database import slow_query_log
+
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin_token)])
+
+
+@router.get("/slow-queries")
+def list_slow_queries(limit: int = Query(default=50, ge=1, le=1000)):
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "explain_sample_rate": slow_query_log.explain_sample_rate,
+        "count": len(slow_query_log),
+        "queries": slow_query_log.entries(limit)
+    }
+
+
+@router.delete("/slow-queries", status_code=204)
+def clear_slow_queries():
+    slow_query_log.clear()
+    return Response(status_code=204)
+
+
+def _require_partitioning():
+    if partition_manager is None:
+        raise HTTPException(status_code=404, detail="Jobs table partitioning is disabled")
+    return partition_manager
+
+
+@router.get("/partitions")
+async def list_partitions():
+    manager = _require_partitioning()
+    return {
+        "premake_months": manager.premake_months,
+        "retention_months": manager.retention_months,
+        "retention_mode": manager.retention_mode,
+        "partitions": await manager.list_partitions()
+    }
+
+
+@router.post("/partitions/maintenance")
+async def run_partition_maintenance():
+    # Same pass as the background loop: create upcoming months, remove expired ones
+    return await _require_partitioning().run_maintenance()
+
+
+@router.post("/jobs/delete", response_model=JobsDeleteResponseDTO)
+async def delete_jobs(
+    request: JobsDeleteRequestDTO,
+    use_case: ManageJobsUseCase = Depends(get_manage_jobs_use_case)
+):
+    try:
+        return await use_case.delete_many(request.ids)
+
+    except RepositoryError as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+
+@router.post("/jobs/delete-where", response_model=JobsDeleteResponseDTO)
+async def delete_jobs_where(
+    filter_dto: JobDeleteFilterDTO,
+    use_case: ManageJobsUseCase = Depends(get_manage_jobs_use_case)
+):
+    try:
+        return await use_case.delete_where(filter_dto)
+
+    except InvalidSearchCriteriaError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RepositoryError as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+
+@router.post("/jobs/update", response_model=JobsUpdateResponseDTO)
+async def update_jobs(
+    request: JobsUpdateRequestDTO,
+    use_case: ManageJobsUseCase = Depends(get_manage_jobs_use_case)
+):
+    try:
+        return await use_case.update_many(request.jobs)
+
+    except JobValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RepositoryError as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+
+
+def _log_progress(progress: Dict[str, Any]) -> None:
+    logger.info(
+        "Bulk load chunk %d: %d lines read, %d inserted, %.0f rows/s",
+        progress["chunk"], progress["loaded"], progress["inserted"], progress["rows_per_s"]
+    )
+
+
+@router.post("/jobs/bulk-load", response_model=JobsBulkLoadResponseDTO)
+async def bulk_load_jobs(
+    request: Request,
+    chunk_size: Optional[int] = Query(default=None, ge=1, le=1000000),
+    use_case: BulkLoadJobsUseCase = Depends(get_bulk_load_jobs_use_case)
+):
+    # NDJSON body, gzip accepted; for multi-million row files prefer the CLI
+    try:
+        gzip = request.headers.get("content-encoding", "").lower() == "gzip"
+        lines = iter_ndjson_lines(request.stream(), gzip=gzip)
+        return await use_case.execute(lines, chunk_size=chunk_size, on_progress=_log_progress)
+
+    except JobValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except PartialSaveError as e:
+        # The chunks merged before the failure stay loaded: report them
+        raise HTTPException(status_code=500, detail={"error": f"Database error: {str(e)}", "result": e.result})
+    except RepositoryError as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
@@ -1,30 +1,55 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List
+import math
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import List, Optional, Union
 
 from app.application.use_cases.submit_jobs import SubmitJobsUseCase
+from app.application.use_cases.get_submit_ticket import GetSubmitTicketUseCase
+from app.application.use_cases.ingest_job_stream import IngestJobStreamUseCase
 from app.application.use_cases.search_jobs import SearchJobsUseCase
 from app.application.use_cases.get_stats import GetStatsUseCase
+from app.application.use_cases.suggest_companies import SuggestCompaniesUseCase
+from app.application.use_cases.export_jobs import ExportJobsUseCase
+from app.application.use_cases.sync_jobs import SyncJobsUseCase
 from app.application.dto.job_dto import (
     JobsSubmitRequestDTO,
     JobsSubmitResponseDTO,
+    JobsTicketDTO,
+    JobsSyncRequestDTO,
+    JobsSyncResponseDTO,
+    JobsStreamSubmitResponseDTO,
     JobFilterDTO,
+    JobExportFilterDTO,
     JobResponseDTO,
-    JobStatsDTO
+    JobSearchFacetsResponseDTO,
+    JobStatsDTO,
+    CompanySuggestionsDTO
 )
 from app.domain.exceptions.job_exceptions import (
     JobValidationError,
+    IngestQueueFullError,
     RepositoryError,
     InvalidSearchCriteriaError
 )
+from app.infrastructure.primary.http.ndjson import iter_ndjson_lines
+from app.infrastructure.primary.http.json_encoding import rows_response
+from app.infrastructure.primary.http.export_formats import EXPORT_FORMATS, ensure_format_available
 from app.infrastructure.dependencies import (
     get_submit_jobs_use_case,
+    get_submit_ticket_use_case,
+    get_ingest_job_stream_use_case,
     get_search_jobs_use_case,
-    get_get_stats_use_case
+    get_get_stats_use_case,
+    get_suggest_companies_use_case,
+    get_export_jobs_use_case,
+    get_sync_jobs_use_case
 )
 
 
 router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 def _job_to_response_dto(job) -> JobResponseDTO:
     return JobResponseDTO(
@@ -38,19 +63,95 @@ def _job_to_response_dto(job) -> JobResponseDTO:
         source=job.source,
         scraped_at=job.scraped_at,
         created_at=job.created_at,
-        updated_at=job.updated_at
+        updated_at=job.updated_at,
+        duplicate_of=job.duplicate_of
     )
 
 
-@router.post("/submit", response_model=JobsSubmitResponseDTO)
+def _hit_to_response_dto(hit) -> JobResponseDTO:
+    dto = _job_to_response_dto(hit.job)
+    dto.rank = hit.rank
+    dto.snippet = hit.snippet
+    return dto
+
+
+@router.post(
+    "/submit",
+    response_model=JobsSubmitResponseDTO,
+    responses={202: {"model": JobsTicketDTO, "description": "Queued (write-behind mode)"}}
+)
 async def submit_jobs(
     request: JobsSubmitRequestDTO,
     use_case: SubmitJobsUseCase = Depends(get_submit_jobs_use_case)
 ):
     try:
+        if use_case.is_queued:
+            ticket = await use_case.enqueue(request.jobs)
+            return JSONResponse(
+                status_code=202,
+                content=JobsTicketDTO(**ticket).model_dump(mode="json"),
+                headers={"Location": f"{router.prefix}/submit/tickets/{ticket['ticket']}"}
+            )
+
         result = await use_case.execute(request.jobs)
         return JobsSubmitResponseDTO(**result)
 
+    except JobValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except IngestQueueFullError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(max(1, math.ceil(e.retry_after)))}
+        )
+    except RepositoryError as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.post("/sync", response_model=JobsSyncResponseDTO)
+async def sync_jobs(
+    request: JobsSyncRequestDTO,
+    use_case: SyncJobsUseCase = Depends(get_sync_jobs_use_case)
+):
+    try:
+        return await use_case.execute(request.ids, request.hashes)
+
+    except RepositoryError as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.get("/submit/tickets/{ticket_id}", response_model=JobsTicketDTO)
+async def get_submit_ticket(
+    ticket_id: str,
+    use_case: GetSubmitTicketUseCase = Depends(get_submit_ticket_use_case)
+):
+    ticket = use_case.execute(ticket_id)
+    if ticket is None:
+        raise HTTPException(status_code=404, detail=f"Ticket '{ticket_id}' not found")
+    return ticket
+
+
+@router.post(
+    "/submit/ndjson",
+    response_model=JobsStreamSubmitResponseDTO,
+    openapi_extra={"requestBody": {"content": {"application/x-ndjson": {
+        "schema": {"type": "string", "description": "One JobCreateDTO JSON object per line"}
+    }}}}
+)
+async def submit_jobs_ndjson(
+    request: Request,
+    chunk_size: Optional[int] = Query(default=None, ge=1, le=10000),
+    use_case: IngestJobStreamUseCase = Depends(get_ingest_job_stream_use_case)
+):
+    try:
+        gzip = request.headers.get("content-encoding", "").lower() == "gzip"
+        lines = iter_ndjson_lines(request.stream(), gzip=gzip)
+        return await use_case.execute(lines, chunk_size=chunk_size)
+
     except JobValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except RepositoryError as e:
@@ -59,14 +160,28 @@ async def submit_jobs(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.post("/search", response_model=List[JobResponseDTO])
+@router.post(
+    "/search",
+    response_model=Union[List[JobResponseDTO], JobSearchFacetsResponseDTO],
+    responses={200: {"headers": {NEXT_CURSOR_HEADER: {
+        "description": "Opaque cursor of the next page (cursor pagination only, absent on the last page)",
+        "schema": {"type": "string"}
+    }}}}
+)
 async def search_jobs(
     filter_dto: JobFilterDTO,
     use_case: SearchJobsUseCase = Depends(get_search_jobs_use_case)
 ):
     try:
-        jobs = await use_case.execute(filter_dto)
-        return [_job_to_response_dto(job) for job in jobs]
+        if filter_dto.search_mode == "fulltext" and not filter_dto.uses_cursor:
+            hits, facets = await use_case.execute_fulltext(filter_dto)
+            results = [_hit_to_response_dto(hit) for hit in hits]
+            return results if facets is None else JobSearchFacetsResponseDTO(results=results, **facets)
+
+        # Fast path: rows are encoded straight to JSON bytes
+        rows, next_cursor, facets = await use_case.execute_rows(filter_dto)
+        headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+        return rows_response(rows, headers=headers, projected=filter_dto.fields is not None, facets=facets)
 
     except InvalidSearchCriteriaError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -76,15 +191,51 @@ async def search_jobs(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.get("/export", response_class=StreamingResponse)
+async def export_jobs(
+    filter_dto: JobExportFilterDTO = Depends(),
+    use_case: ExportJobsUseCase = Depends(get_export_jobs_use_case)
+):
+    try:
+        ensure_format_available(filter_dto.format)
+    except InvalidSearchCriteriaError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    media_type, extension, encode = EXPORT_FORMATS[filter_dto.format]
+    return StreamingResponse(
+        encode(use_case.execute(filter_dto)),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="jobs.{extension}"'}
+    )
+
+
 @router.get("/stats", response_model=JobStatsDTO)
 async def get_stats(
+    fresh: bool = Query(default=False, description="Bypass the snapshot and compute live counts"),
     use_case: GetStatsUseCase = Depends(get_get_stats_use_case)
 ):
     try:
-        stats = await use_case.execute()
+        stats = await use_case.execute(fresh=fresh)
         return stats
 
     except RepositoryError as e:
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.get("/companies/suggest", response_model=CompanySuggestionsDTO)
+async def suggest_companies(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(default=5, ge=1, le=50),
+    use_case: SuggestCompaniesUseCase = Depends(get_suggest_companies_use_case)
+):
+    try:
+        return await use_case.execute(q, limit)
+
+    except InvalidSearchCriteriaError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RepositoryError as e:
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
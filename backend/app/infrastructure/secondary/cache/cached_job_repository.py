@@ -0,0 +1,455 @@
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence, Set, Tuple, Hashable
+
+from app.domain.entities.job import Job
+from app.domain.entities.job_search_hit import JobSearchHit
+from app.domain.exceptions.job_exceptions import RepositoryError
+from app.domain.ports.job_repository import IJobRepository
+from app.infrastructure.secondary.cache.ttl_cache import TTLCache, MISSING
+
+
+SEARCH = "search"
+SUGGEST = "suggest"
+STATS = "stats"
+
+DEFAULT_TTLS = {
+    SEARCH: 30.0,
+    SUGGEST: 300.0,
+    STATS: 15.0,
+}
+
+ALL_NAMESPACES = (SEARCH, SUGGEST, STATS)
+
+
+def _normalize(value: Optional[str]) -> Optional[str]:
+    # Filters are matched case-insensitively, so "Paris" and "paris" share an
+    # entry; whitespace is kept since the repository matches it as given
+    return value.lower() if value is not None else None
+
+
+class CachedJobRepository(IJobRepository):
+    def __init__(
+        self,
+        repository: IJobRepository,
+        cache: TTLCache,
+        ttls: Optional[Dict[str, float]] = None
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+
+    async def _cached(self, namespace: str, key: Hashable, loader):
+        value = self.cache.get(namespace, key)
+        if value is not MISSING:
+            return value
+
+        # Read before loading: a write landing during the load must not have
+        # its invalidation overwritten by the rows read before it
+        generation = self.cache.generation(namespace)
+        value = await loader()
+        self.cache.set(namespace, key, value, self.ttls[namespace], generation=generation)
+        return value
+
+    def _invalidate_all(self) -> None:
+        self.cache.invalidate(*ALL_NAMESPACES)
+
+    async def save(self, job: Job) -> Job:
+        saved = await self.repository.save(job)
+        self._invalidate_all()
+        return saved
+
+    async def save_many(self, jobs: List[Job], upsert: bool = False) -> Dict[str, Any]:
+        try:
+            result = await self.repository.save_many(jobs, upsert=upsert)
+        except RepositoryError:
+            # Chunks committed before the failure are stored all the same
+            self._invalidate_all()
+            raise
+        if result["inserted"] or result.get("updated"):
+            self._invalidate_all()
+        return result
+
+    async def find_by_id(self, job_id: str) -> Optional[Job]:
+        return await self.repository.find_by_id(job_id)
+
+    async def exists_by_id(self, job_id: str) -> bool:
+        return await self.repository.exists_by_id(job_id)
+
+    async def find_existing_ids(self, job_ids: List[str]) -> Set[str]:
+        # Never cached: a stale answer would make clients skip new jobs
+        return await self.repository.find_existing_ids(job_ids)
+
+    async def find_content_hashes(self, job_ids: List[str]) -> Dict[str, Optional[str]]:
+        return await self.repository.find_content_hashes(job_ids)
+
+    async def search(
+        self,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, str]] = None,
+        collapse_duplicates: bool = False,
+        include_description: bool = True,
+        scraped_since: Optional[datetime] = None
+    ) -> List[Job]:
+        key = (
+            "substring",
+            _normalize(search_term),
+            _normalize(location),
+            _normalize(company),
+            source,
+            limit,
+            offset,
+            after,
+            collapse_duplicates,
+            include_description,
+            scraped_since
+        )
+        jobs = await self._cached(SEARCH, key, lambda: self.repository.search(
+            search_term=search_term,
+            location=location,
+            company=company,
+            source=source,
+            limit=limit,
+            offset=offset,
+            after=after,
+            collapse_duplicates=collapse_duplicates,
+            include_description=include_description,
+            scraped_since=scraped_since
+        ))
+        return list(jobs)
+
+    async def search_rows(
+        self,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, str]] = None,
+        collapse_duplicates: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        scraped_since: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        key = (
+            "rows",
+            _normalize(search_term),
+            _normalize(location),
+            _normalize(company),
+            source,
+            limit,
+            offset,
+            after,
+            collapse_duplicates,
+            tuple(fields) if fields is not None else None,
+            scraped_since
+        )
+        rows = await self._cached(SEARCH, key, lambda: self.repository.search_rows(
+            search_term=search_term,
+            location=location,
+            company=company,
+            source=source,
+            limit=limit,
+            offset=offset,
+            after=after,
+            collapse_duplicates=collapse_duplicates,
+            fields=fields,
+            scraped_since=scraped_since
+        ))
+        return list(rows)
+
+    async def search_rows_with_facets(
+        self,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, str]] = None,
+        collapse_duplicates: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        scraped_since: Optional[datetime] = None,
+        facets: Sequence[str] = ("company", "location", "source"),
+        facet_limit: int = 10
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        key = (
+            "rows+facets",
+            _normalize(search_term),
+            _normalize(location),
+            _normalize(company),
+            source,
+            limit,
+            offset,
+            after,
+            collapse_duplicates,
+            tuple(fields) if fields is not None else None,
+            scraped_since,
+            tuple(facets),
+            facet_limit
+        )
+        rows, summary = await self._cached(SEARCH, key, lambda: self.repository.search_rows_with_facets(
+            search_term=search_term,
+            location=location,
+            company=company,
+            source=source,
+            limit=limit,
+            offset=offset,
+            after=after,
+            collapse_duplicates=collapse_duplicates,
+            fields=fields,
+            scraped_since=scraped_since,
+            facets=facets,
+            facet_limit=facet_limit
+        ))
+        return list(rows), summary
+
+    async def search_fulltext(
+        self,
+        query: str,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        collapse_duplicates: bool = False,
+        include_description: bool = True,
+        scraped_since: Optional[datetime] = None
+    ) -> List[JobSearchHit]:
+        key = (
+            "fulltext",
+            _normalize(query),
+            _normalize(location),
+            _normalize(company),
+            source,
+            limit,
+            offset,
+            collapse_duplicates,
+            include_description,
+            scraped_since
+        )
+        hits = await self._cached(SEARCH, key, lambda: self.repository.search_fulltext(
+            query=query,
+            location=location,
+            company=company,
+            source=source,
+            limit=limit,
+            offset=offset,
+            collapse_duplicates=collapse_duplicates,
+            include_description=include_description,
+            scraped_since=scraped_since
+        ))
+        return list(hits)
+
+    async def search_fulltext_with_facets(
+        self,
+        query: str,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        collapse_duplicates: bool = False,
+        include_description: bool = True,
+        scraped_since: Optional[datetime] = None,
+        facets: Sequence[str] = ("company", "location", "source"),
+        facet_limit: int = 10
+    ) -> Tuple[List[JobSearchHit], Dict[str, Any]]:
+        key = (
+            "fulltext+facets",
+            _normalize(query),
+            _normalize(location),
+            _normalize(company),
+            source,
+            limit,
+            offset,
+            collapse_duplicates,
+            include_description,
+            scraped_since,
+            tuple(facets),
+            facet_limit
+        )
+        hits, summary = await self._cached(SEARCH, key, lambda: self.repository.search_fulltext_with_facets(
+            query=query,
+            location=location,
+            company=company,
+            source=source,
+            limit=limit,
+            offset=offset,
+            collapse_duplicates=collapse_duplicates,
+            include_description=include_description,
+            scraped_since=scraped_since,
+            facets=facets,
+            facet_limit=facet_limit
+        ))
+        return list(hits), summary
+
+    def export_rows(
+        self,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        search_mode: str = "substring",
+        chunk_size: int = 1000,
+        scraped_since: Optional[datetime] = None,
+        key_range: Optional[Tuple[Optional[Tuple[datetime, str]], Optional[Tuple[datetime, str]]]] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        return self.repository.export_rows(
+            search_term=search_term,
+            location=location,
+            company=company,
+            source=source,
+            search_mode=search_mode,
+            chunk_size=chunk_size,
+            scraped_since=scraped_since,
+            key_range=key_range
+        )
+
+    async def export_boundaries(
+        self,
+        count: int,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        search_mode: str = "substring",
+        scraped_since: Optional[datetime] = None
+    ) -> List[Tuple[datetime, str]]:
+        return await self.repository.export_boundaries(
+            count,
+            search_term=search_term,
+            location=location,
+            company=company,
+            source=source,
+            search_mode=search_mode,
+            scraped_since=scraped_since
+        )
+
+    async def search_facets(
+        self,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        search_mode: str = "substring",
+        collapse_duplicates: bool = False,
+        scraped_since: Optional[datetime] = None,
+        facets: Sequence[str] = ("company", "location", "source"),
+        limit: int = 10
+    ) -> Dict[str, Any]:
+        key = (
+            "facets",
+            search_mode,
+            _normalize(search_term),
+            _normalize(location),
+            _normalize(company),
+            source,
+            collapse_duplicates,
+            scraped_since,
+            tuple(facets),
+            limit
+        )
+        return await self._cached(SEARCH, key, lambda: self.repository.search_facets(
+            search_term=search_term,
+            location=location,
+            company=company,
+            source=source,
+            search_mode=search_mode,
+            collapse_duplicates=collapse_duplicates,
+            scraped_since=scraped_since,
+            facets=facets,
+            limit=limit
+        ))
+
+    async def suggest_companies(self, name: str, limit: int = 5) -> List[Tuple[str, float]]:
+        suggestions = await self._cached(
+            SUGGEST,
+            (_normalize(name), limit),
+            lambda: self.repository.suggest_companies(name, limit)
+        )
+        return list(suggestions)
+
+    async def count_total(self) -> int:
+        return await self._cached(STATS, "count_total", self.repository.count_total)
+
+    async def count_distinct_companies(self) -> int:
+        return await self._cached(
+            STATS, "count_distinct_companies", self.repository.count_distinct_companies
+        )
+
+    async def count_distinct_locations(self) -> int:
+        return await self._cached(
+            STATS, "count_distinct_locations", self.repository.count_distinct_locations
+        )
+
+    async def count_by_source(self) -> Dict[str, int]:
+        counts = await self._cached(STATS, "count_by_source", self.repository.count_by_source)
+        return dict(counts)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        # Never cached: callers ask for live counts precisely to skip stale ones
+        return await self.repository.get_stats()
+
+    async def get_stats_snapshot(self) -> Optional[Dict[str, Any]]:
+        snapshot = await self._cached(STATS, "snapshot", self.repository.get_stats_snapshot)
+        return dict(snapshot) if snapshot is not None else None
+
+    async def refresh_stats_snapshot(self) -> bool:
+        refreshed = await self.repository.refresh_stats_snapshot()
+        if refreshed:
+            self.cache.invalidate(STATS)
+        return refreshed
+
+    async def backfill_fingerprints(self, limit: int = 500) -> int:
+        # Derived columns only: nothing cached changes
+        return await self.repository.backfill_fingerprints(limit)
+
+    async def rebuild_indexes(self) -> None:
+        await self.repository.rebuild_indexes()
+
+    async def delete_by_id(self, job_id: str) -> bool:
+        deleted = await self.repository.delete_by_id(job_id)
+        if deleted:
+            self._invalidate_all()
+        return deleted
+
+    async def update(self, job: Job) -> Job:
+        updated = await self.repository.update(job)
+        self._invalidate_all()
+        return updated
+
+    async def delete_many(self, job_ids: List[str]) -> int:
+        deleted = await self.repository.delete_many(job_ids)
+        if deleted:
+            self._invalidate_all()
+        return deleted
+
+    async def update_many(self, jobs: List[Job]) -> int:
+        updated = await self.repository.update_many(jobs)
+        if updated:
+            self._invalidate_all()
+        return updated
+
+    async def delete_where(
+        self,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        scraped_before: Optional[datetime] = None,
+        duplicates_only: bool = False
+    ) -> int:
+        deleted = await self.repository.delete_where(
+            location=location,
+            company=company,
+            source=source,
+            scraped_before=scraped_before,
+            duplicates_only=duplicates_only
+        )
+        if deleted:
+            self._invalidate_all()
+        return deleted
@@ -0,0 +1,95 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from app.infrastructure.metrics import MetricsRegistry
+
+
+MISSING = object()
+
+
+# Bounded LRU cache whose entries expire after a TTL. Invalidating a namespace
+# bumps its generation instead of scanning the entries: stale keys can no
+# longer be hit and age out through LRU eviction.
+class TTLCache:
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        if max_entries < 1:
+            raise ValueError("Cache must hold at least one entry")
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def _counter(self, namespace: str) -> Dict[str, int]:
+        if namespace not in self._counters:
+            self._counters[namespace] = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        return self._counters[namespace]
+
+    def _full_key(self, namespace: str, key: Hashable) -> Tuple:
+        return (namespace, self.generation(namespace), key)
+
+    def generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    def get(self, namespace: str, key: Hashable) -> Any:
+        full_key = self._full_key(namespace, key)
+        entry = self._entries.get(full_key)
+        counter = self._counter(namespace)
+
+        if entry is None or entry[0] <= self._clock():
+            if entry is not None:
+                del self._entries[full_key]
+            counter["misses"] += 1
+            return MISSING
+
+        self._entries.move_to_end(full_key)
+        counter["hits"] += 1
+        return entry[1]
+
+    def set(
+        self, namespace: str, key: Hashable, value: Any, ttl: float, generation: Optional[int] = None
+    ) -> None:
+        # generation is the one read before loading value: if the namespace was
+        # invalidated meanwhile, value may predate the write and is dropped
+        if ttl <= 0 or (generation is not None and generation != self.generation(namespace)):
+            return
+
+        full_key = self._full_key(namespace, key)
+        self._entries[full_key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(full_key)
+
+        while len(self._entries) > self.max_entries:
+            (evicted_namespace, _, _), _ = self._entries.popitem(last=False)
+            self._counter(evicted_namespace)["evictions"] += 1
+
+    def invalidate(self, *namespaces: str) -> None:
+        for namespace in namespaces:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            self._counter(namespace)["invalidations"] += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "namespaces": {name: dict(counter) for name, counter in self._counters.items()}
+        }
+
+    def register_metrics(self, registry: MetricsRegistry, prefix: str = "cache") -> "TTLCache":
+        registry.gauge(f"{prefix}_entries", "Entries currently held", callback=lambda: {(): len(self._entries)})
+        for field in ("hits", "misses", "evictions", "invalidations"):
+            registry.counter(
+                f"{prefix}_{field}_total",
+                f"Cache {field} by namespace",
+                ("namespace",),
+                callback=lambda field=field: {
+                    (name,): counter[field] for name, counter in self._counters.items()
+                }
+            )
+        return self
@@ -0,0 +1,139 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import asyncpg
+from sqlalchemy import BigInteger, Column, MetaData, Table, and_, any_, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.exceptions.job_exceptions import RepositoryError
+from app.domain.ports.job_bulk_loader import IJobBulkLoader
+from app.domain.services.content_hash import hash_content
+from app.domain.services.simhash import band_keys, content_fingerprint, to_signed
+from app.infrastructure.secondary.cache.cached_job_repository import ALL_NAMESPACES
+from app.infrastructure.secondary.cache.ttl_cache import TTLCache
+from app.infrastructure.secondary.persistence.database import set_statement_timeout
+from app.infrastructure.secondary.persistence.models.job_key_model import JobKeyModel
+from app.infrastructure.secondary.persistence.models.job_model import JobModel, PARTITIONED
+
+
+STAGING_TABLE = "jobs_bulk_staging"
+
+LOADED_COLUMNS = (
+    "id", "title", "company", "location", "url", "posted_date", "description",
+    "source", "scraped_at", "simhash", "simhash_bands", "content_hash",
+)
+
+# Session-private and dropped before commit (or by the rollback): concurrent
+# loads never see each other's rows, and nothing is left on a pooled connection.
+staging = Table(
+    STAGING_TABLE,
+    MetaData(),
+    # Position in the chunk: the first occurrence of an id or url wins
+    Column("line", BigInteger),
+    *(Column(name, JobModel.__table__.c[name].type) for name in LOADED_COLUMNS),
+    prefixes=["TEMPORARY"]
+)
+
+
+def staging_record(line: int, record: Dict[str, Any]) -> Tuple:
+    value = content_fingerprint(record["title"], record["company"], record["description"])
+    computed = {
+        "simhash": to_signed(value),
+        "simhash_bands": band_keys(value),
+        "content_hash": hash_content(record),
+    }
+    return (line,) + tuple(
+        computed[name] if name in computed else record[name]
+        for name in LOADED_COLUMNS
+    )
+
+
+# Backfills and migrations: each chunk is COPYed into a temporary staging
+# table, then merged into jobs with one INSERT ... SELECT skipping the ids
+# and urls already taken. Near-duplicate detection is not applied: loaded
+# rows are all canonical, but their SimHash is stored for later submits.
+class CopyJobBulkLoader(IJobBulkLoader):
+    def __init__(self, session_factory: async_sessionmaker, cache: Optional[TTLCache] = None):
+        self.session_factory = session_factory
+        self.cache = cache
+
+    async def _copy(self, session: AsyncSession, records: Sequence[Dict[str, Any]]) -> None:
+        connection = await session.connection()
+        await connection.run_sync(staging.create)
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            STAGING_TABLE,
+            records=[staging_record(line, record) for line, record in enumerate(records)],
+            columns=staging.c.keys()
+        )
+
+    def _staged_columns(self, scraped_at) -> List[Any]:
+        return [scraped_at if name == "scraped_at" else staging.c[name] for name in LOADED_COLUMNS]
+
+    async def _merge(self, session: AsyncSession) -> int:
+        scraped_at = func.coalesce(staging.c.scraped_at, func.now())
+        source = select(*self._staged_columns(scraped_at)).order_by(staging.c.line)
+        stmt = (
+            insert(JobModel)
+            .from_select(list(LOADED_COLUMNS), source)
+            .on_conflict_do_nothing()
+            .returning(JobModel.id)
+        )
+        result = await session.execute(stmt)
+        return len(result.scalars().all())
+
+    async def _merge_partitioned(self, session: AsyncSession) -> int:
+        # The registry arbitrates ids and urls, then each claimed key brings
+        # in the staged row it was claimed with.
+        claim = (
+            insert(JobKeyModel)
+            .from_select(
+                ["id", "url", "scraped_at"],
+                select(
+                    staging.c.id, staging.c.url, func.coalesce(staging.c.scraped_at, func.now())
+                ).order_by(staging.c.line)
+            )
+            .on_conflict_do_nothing()
+            .returning(JobKeyModel.id)
+        )
+        claimed = (await session.execute(claim)).scalars().all()
+        if not claimed:
+            return 0
+
+        source = (
+            select(*self._staged_columns(JobKeyModel.scraped_at))
+            .distinct(staging.c.id)
+            .select_from(staging.join(JobKeyModel, and_(
+                JobKeyModel.id == staging.c.id,
+                JobKeyModel.url == staging.c.url
+            )))
+            .where(staging.c.id == any_(literal(claimed, ARRAY(JobKeyModel.id.type))))
+            .order_by(staging.c.id, staging.c.line)
+        )
+        result = await session.execute(
+            insert(JobModel).from_select(list(LOADED_COLUMNS), source).returning(JobModel.id)
+        )
+        return len(result.scalars().all())
+
+    async def load_chunk(self, records: List[Dict[str, Any]]) -> Dict[str, int]:
+        if not records:
+            return {"inserted": 0, "duplicates": 0}
+
+        async with self.session_factory() as session:
+            try:
+                # A merge of tens of thousands of rows is long by design
+                await set_statement_timeout(session, 0)
+                await self._copy(session, records)
+                inserted = await (self._merge_partitioned(session) if PARTITIONED else self._merge(session))
+                connection = await session.connection()
+                await connection.run_sync(staging.drop)
+                await session.commit()
+
+            except (SQLAlchemyError, asyncpg.PostgresError) as e:
+                await session.rollback()
+                raise RepositoryError(f"Error bulk loading jobs: {str(e)}", e)
+
+        if inserted and self.cache is not None:
+            self.cache.invalidate(*ALL_NAMESPACES)
+        return {"inserted": inserted, "duplicates": len(records) - inserted}
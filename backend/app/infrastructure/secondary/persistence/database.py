@@ -1,36 +1,96 @@
-from sqlalchemy import create_engine
+from typing import Optional
+
+from sqlalchemy import select, func
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-import os
-from dotenv import load_dotenv
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
 
-load_dotenv()
+from app.infrastructure.config import Settings, get_settings
+from app.infrastructure.metrics import metrics_registry
+from app.infrastructure.secondary.persistence.pool_metrics import PoolMetrics
+from app.infrastructure.secondary.persistence.query_metrics import QueryMetrics
+from app.infrastructure.secondary.persistence.slow_query_log import SlowQueryRecorder
+from app.infrastructure.secondary.persistence.replica_router import ReplicaRouter
 
-DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://offeruser:offerpass@db:5432/offerdb")
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
-ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
 
-async_engine = create_async_engine(ASYNC_DATABASE_URL, echo=False)
-AsyncSessionLocal = async_sessionmaker(
-    async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False
+def create_engine_from_settings(settings: Settings, url: Optional[str] = None) -> AsyncEngine:
+    server_settings = {}
+    if settings.db_statement_timeout_ms:
+        server_settings["statement_timeout"] = str(settings.db_statement_timeout_ms)
+
+    return create_async_engine(
+        url or settings.async_database_url,
+        echo=settings.db_echo,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args={
+            # asyncpg's own statement cache and SQLAlchemy's adapter cache
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+            "server_settings": server_settings,
+        }
+    )
+
+
+settings = get_settings()
+
+DATABASE_URL = settings.database_url
+ASYNC_DATABASE_URL = settings.async_database_url
+
+
+def create_sessionmaker(engine: AsyncEngine) -> async_sessionmaker:
+    return async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False
+    )
+
+
+async_engine = create_engine_from_settings(settings)
+replica_engines = [create_engine_from_settings(settings, url) for url in settings.async_replica_urls]
+
+pool_metrics = PoolMetrics().attach(async_engine)
+if settings.metrics_enabled:
+    pool_metrics.register(metrics_registry)
+    query_metrics = QueryMetrics(metrics_registry)
+    for engine in (async_engine, *replica_engines):
+        query_metrics.attach(engine)
+
+slow_query_log = SlowQueryRecorder(
+    threshold_ms=settings.slow_query_threshold_ms,
+    capacity=settings.slow_query_log_size,
+    explain_sample_rate=settings.slow_query_explain_sample_rate,
+    explain_timeout_ms=settings.slow_query_explain_timeout_ms
+)
+if settings.slow_query_threshold_ms > 0:
+    for engine in (async_engine, *replica_engines):
+        slow_query_log.attach(engine)
+
+AsyncSessionLocal = create_sessionmaker(async_engine)
+
+replica_router = ReplicaRouter(
+    AsyncSessionLocal,
+    replicas=[(f"replica-{i}", create_sessionmaker(engine)) for i, engine in enumerate(replica_engines)],
+    failure_cooldown=settings.db_replica_failure_cooldown,
+    read_your_writes_seconds=settings.read_your_writes_seconds
 )
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+async def set_statement_timeout(session: AsyncSession, timeout_ms: int) -> None:
+    # Transaction-local override of db_statement_timeout_ms (0 disables the bound)
+    await session.execute(select(func.set_config("statement_timeout", str(timeout_ms), True)))
+
+
+async def init_db() -> None:
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
 
 async def get_async_db():
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, DateTime, Index
+
+from app.infrastructure.secondary.persistence.database import Base
+
+
+# Global uniqueness of job ids and urls when jobs is partitioned (see
+# job_model.PARTITIONED); scraped_at points lookups at a single partition.
+# Stays empty on an unpartitioned database.
+class JobKeyModel(Base):
+    __tablename__ = "job_keys"
+
+    id = Column(String(50), primary_key=True)
+    url = Column(String(500), nullable=False, unique=True)
+    scraped_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        # Retention clears the keys of a removed partition by range
+        Index('idx_job_keys_scraped_at', 'scraped_at'),
+    )
@@ -1,8 +1,27 @@
-from sqlalchemy import Column, String, DateTime, Text, Index
+from sqlalchemy import Column, String, DateTime, Text, Index, Computed, DDL, BigInteger, Integer, event
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
+from app.infrastructure.config import get_settings
 from app.infrastructure.secondary.persistence.database import Base
 
 
+# 'simple' keeps the index language-agnostic: offers are scraped in French and English.
+SEARCH_CONFIG = "simple"
+
+SEARCH_VECTOR_EXPRESSION = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(company, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'C')"
+)
+
+# A partitioned table can only enforce keys that include the partition key:
+# (id, scraped_at) becomes the primary key, and the uniqueness of id and url
+# moves to the job_keys registry.
+PARTITIONED = get_settings().jobs_partitioning_enabled
+PARTITION_KEY = "scraped_at"
+
+
 class JobModel(Base):
     __tablename__ = "jobs"
 
@@ -10,15 +29,52 @@ class JobModel(Base):
     title = Column(String(255), nullable=False, index=True)
     company = Column(String(255), nullable=False, index=True)
     location = Column(String(255), nullable=False, index=True)
-    url = Column(String(500), nullable=False, unique=True)
+    url = Column(String(500), nullable=False, unique=not PARTITIONED)
     posted_date = Column(String(100))
     description = Column(Text)
     source = Column(String(50), nullable=False, default='linkedin', index=True)
-    scraped_at = Column(DateTime(timezone=True), server_default=func.now())
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    scraped_at = Column(DateTime(timezone=True), primary_key=PARTITIONED, server_default=func.now())
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True)
+    ))
+    # Near-duplicate detection: 64-bit SimHash of title+company+description,
+    # its LSH band keys, and the canonical posting of the cluster (NULL when
+    # the row is itself canonical).
+    simhash = Column(BigInteger)
+    simhash_bands = deferred(Column(ARRAY(Integer)))
+    duplicate_of = Column(String(50))
+    # SHA-256 of the content fields (domain.services.content_hash): resubmits
+    # only rewrite rows whose hash differs
+    content_hash = Column(String(64))
 
     __table_args__ = (
         Index('idx_title_company', 'title', 'company'),
-        Index('idx_location_company', 'location', 'company'),
+        # Serves the newest-first ordering and keyset pagination of search();
+        # exports read it backwards
+        Index('idx_jobs_created_at_id', created_at.desc(), id.desc()),
+        Index('idx_jobs_search_vector', 'search_vector', postgresql_using='gin'),
+        # Trigram indexes serve the leading-wildcard ILIKE filters and fuzzy matching
+        Index(
+            'idx_jobs_location_trgm', 'location',
+            postgresql_using='gin',
+            postgresql_ops={'location': 'gin_trgm_ops'}
+        ),
+        Index(
+            'idx_jobs_company_trgm', 'company',
+            postgresql_using='gin',
+            postgresql_ops={'company': 'gin_trgm_ops'}
+        ),
+        Index('idx_jobs_simhash_bands', 'simhash_bands', postgresql_using='gin'),
+        Index('idx_jobs_duplicate_of', 'duplicate_of'),
+        {"postgresql_partition_by": f"RANGE ({PARTITION_KEY})"} if PARTITIONED else {},
     )
+
+
+event.listen(
+    JobModel.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
@@ -0,0 +1,69 @@
+from sqlalchemy import (
+    Column, String, Integer, DateTime, MetaData, Table, DDL,
+    select, func, distinct, tuple_, case, event
+)
+from sqlalchemy.dialects import postgresql
+
+from app.infrastructure.secondary.persistence.database import Base
+from app.infrastructure.secondary.persistence.models.job_model import JobModel
+
+
+STATS_VIEW_NAME = "job_stats_mv"
+TOTAL_SCOPE = "__all__"
+
+
+def build_stats_query():
+    # One scan computes the global row (empty grouping set) and one row per source
+    is_total = func.grouping(JobModel.source)
+    return select(
+        case((is_total == 1, TOTAL_SCOPE), else_="source:" + JobModel.source).label("scope"),
+        JobModel.source.label("source"),
+        func.count().label("total_jobs"),
+        func.count(distinct(JobModel.company)).label("total_companies"),
+        func.count(distinct(JobModel.location)).label("total_locations"),
+        func.now().label("refreshed_at"),
+    ).group_by(func.grouping_sets(tuple_(JobModel.source), tuple_()))
+
+
+# Kept out of Base.metadata: create_all must not create it as a plain table
+job_stats_view = Table(
+    STATS_VIEW_NAME,
+    MetaData(),
+    Column("scope", String, primary_key=True),
+    Column("source", String(50)),
+    Column("total_jobs", Integer),
+    Column("total_companies", Integer),
+    Column("total_locations", Integer),
+    Column("refreshed_at", DateTime(timezone=True)),
+)
+
+
+_stats_query_sql = str(
+    build_stats_query().compile(
+        dialect=postgresql.dialect(),
+        compile_kwargs={"literal_binds": True}
+    )
+)
+
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        f"CREATE MATERIALIZED VIEW IF NOT EXISTS {STATS_VIEW_NAME} AS {_stats_query_sql}"
+    ).execute_if(dialect="postgresql")
+)
+
+# REFRESH ... CONCURRENTLY requires a unique index on the view
+event.listen(
+    Base.metadata,
+    "after_create",
+    DDL(
+        f"CREATE UNIQUE INDEX IF NOT EXISTS idx_{STATS_VIEW_NAME}_scope ON {STATS_VIEW_NAME} (scope)"
+    ).execute_if(dialect="postgresql")
+)
+
+event.listen(
+    Base.metadata,
+    "before_drop",
+    DDL(f"DROP MATERIALIZED VIEW IF EXISTS {STATS_VIEW_NAME}").execute_if(dialect="postgresql")
+)
@@ -0,0 +1,200 @@
+import asyncio
+import logging
+import re
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.ports.stats_refresher import IStatsRefresher
+from app.infrastructure.secondary.persistence.models.job_key_model import JobKeyModel
+from app.infrastructure.secondary.persistence.models.job_model import JobModel
+
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = JobModel.__tablename__
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+# jobs_p202610 holds scraped_at in [2026-10-01, 2026-11-01) UTC
+PARTITION_NAME_PATTERN = re.compile(rf"^{PARENT_TABLE}_p(\d{{4}})(\d{{2}})$")
+
+RETENTION_MODES = ("detach", "drop")
+
+
+def month_start(moment: datetime) -> datetime:
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return datetime(moment.year, moment.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARENT_TABLE}_p{month:%Y%m}"
+
+
+def partition_month(name: str) -> Optional[datetime]:
+    # None for the default partition and anything not created here
+    match = PARTITION_NAME_PATTERN.match(name)
+    if match is None:
+        return None
+    return datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=timezone.utc)
+
+
+def planned_partitions(now: datetime, premake_months: int) -> List[datetime]:
+    current = month_start(now)
+    return [add_months(current, offset) for offset in range(premake_months + 1)]
+
+
+def expired_partitions(names: Sequence[str], now: datetime, retention_months: int) -> List[Tuple[str, datetime]]:
+    # Only partitions whose whole range is past the cutoff; the default
+    # partition is never removed.
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(month_start(now), -retention_months)
+    expired = []
+    for name in names:
+        month = partition_month(name)
+        if month is not None and add_months(month, 1) <= cutoff:
+            expired.append((name, month))
+    return sorted(expired, key=lambda item: item[1])
+
+
+# Keeps monthly partitions of jobs ahead of the clock and removes expired
+# ones whole: DETACH (and DROP) PARTITION costs a catalog update where a
+# DELETE would rewrite and later vacuum every row.
+class JobPartitionManager:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        premake_months: int = 3,
+        retention_months: int = 0,
+        retention_mode: str = "detach",
+        interval_seconds: float = 3600.0,
+        stats_refresher: Optional[IStatsRefresher] = None,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc)
+    ):
+        if premake_months < 0:
+            raise ValueError("Premade partitions must be non-negative")
+        if retention_mode not in RETENTION_MODES:
+            raise ValueError(f"Retention mode must be one of: {', '.join(RETENTION_MODES)}")
+        self.session_factory = session_factory
+        self.premake_months = premake_months
+        self.retention_months = retention_months
+        self.retention_mode = retention_mode
+        self.interval_seconds = interval_seconds
+        self.stats_refresher = stats_refresher
+        self._clock = clock
+        self._task: Optional[asyncio.Task] = None
+
+    async def _partitions(self, session: AsyncSession) -> List[Dict[str, Any]]:
+        result = await session.execute(text(
+            "SELECT c.relname AS name, pg_get_expr(c.relpartbound, c.oid) AS bounds, "
+            "c.reltuples::bigint AS estimated_rows "
+            "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = CAST(:parent AS regclass) "
+            "ORDER BY c.relname"
+        ), {"parent": PARENT_TABLE})
+        return [dict(row) for row in result.mappings()]
+
+    async def list_partitions(self) -> List[Dict[str, Any]]:
+        async with self.session_factory() as session:
+            return await self._partitions(session)
+
+    async def _execute_ddl(self, statements: Sequence[Any]) -> bool:
+        # One transaction per partition: a failure leaves the others untouched
+        async with self.session_factory() as session:
+            try:
+                for statement in statements:
+                    await session.execute(text(statement) if isinstance(statement, str) else statement)
+                await session.commit()
+                return True
+            except SQLAlchemyError as e:
+                await session.rollback()
+                logger.warning("Partition maintenance statement failed: %s", e)
+                return False
+
+    async def ensure_partitions(self) -> Dict[str, List[str]]:
+        async with self.session_factory() as session:
+            existing = {partition["name"] for partition in await self._partitions(session)}
+
+        created, failed = [], []
+        for month in planned_partitions(self._clock(), self.premake_months):
+            name = partition_name(month)
+            if name in existing:
+                continue
+            # Fails if the default partition already holds rows of that month
+            ok = await self._execute_ddl([
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+            ])
+            (created if ok else failed).append(name)
+
+        # Catches rows outside the premade range instead of failing the insert
+        if DEFAULT_PARTITION not in existing:
+            ok = await self._execute_ddl([
+                f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {PARENT_TABLE} DEFAULT"
+            ])
+            (created if ok else failed).append(DEFAULT_PARTITION)
+
+        return {"created": created, "failed": failed}
+
+    async def apply_retention(self) -> Dict[str, List[str]]:
+        async with self.session_factory() as session:
+            names = [partition["name"] for partition in await self._partitions(session)]
+
+        removed, failed = [], []
+        for name, month in expired_partitions(names, self._clock(), self.retention_months):
+            statements = [
+                f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}",
+                # The registry is not partitioned: its narrow rows go by index range
+                delete(JobKeyModel).where(
+                    JobKeyModel.scraped_at >= month,
+                    JobKeyModel.scraped_at < add_months(month, 1)
+                ),
+            ]
+            if self.retention_mode == "drop":
+                statements.append(f"DROP TABLE {name}")
+            ok = await self._execute_ddl(statements)
+            (removed if ok else failed).append(name)
+
+        if removed and self.stats_refresher is not None:
+            self.stats_refresher.mark_dirty()
+        return {"removed": removed, "failed": failed}
+
+    async def run_maintenance(self) -> Dict[str, List[str]]:
+        ensured = await self.ensure_partitions()
+        retained = await self.apply_retention()
+        return {
+            "created": ensured["created"],
+            "removed": retained["removed"],
+            "failed": ensured["failed"] + retained["failed"],
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_maintenance()
+            except SQLAlchemyError as e:
+                logger.warning("Partition maintenance failed: %s", e)
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -0,0 +1,83 @@
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.metrics import MetricsRegistry
+
+
+class PoolMetrics:
+    def __init__(self):
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.total_checkout_seconds = 0.0
+        self.max_checkout_seconds = 0.0
+
+    def attach(self, engine: AsyncEngine) -> "PoolMetrics":
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "connect", self._on_connect)
+        event.listen(sync_engine, "checkout", self._on_checkout)
+        event.listen(sync_engine, "checkin", self._on_checkin)
+        event.listen(sync_engine, "invalidate", self._on_invalidate)
+        self._pool = sync_engine.pool
+        return self
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        self.checkouts += 1
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        self.checkins += 1
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            held = time.perf_counter() - checked_out_at
+            self.total_checkout_seconds += held
+            self.max_checkout_seconds = max(self.max_checkout_seconds, held)
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        self.invalidations += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        pool = self._pool
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "invalidations": self.invalidations,
+            "avg_checkout_seconds": (
+                self.total_checkout_seconds / self.checkins if self.checkins else 0.0
+            ),
+            "max_checkout_seconds": self.max_checkout_seconds,
+        }
+
+    def register(self, registry: MetricsRegistry) -> "PoolMetrics":
+        pool_gauges = {
+            "db_pool_size": ("Configured pool size", "size"),
+            "db_pool_checked_out": ("Connections currently checked out", "checked_out"),
+            "db_pool_checked_in": ("Idle connections in the pool", "checked_in"),
+            "db_pool_overflow": ("Connections opened beyond the pool size", "overflow"),
+        }
+        for name, (documentation, key) in pool_gauges.items():
+            registry.gauge(name, documentation, callback=lambda key=key: {(): self.snapshot()[key]})
+
+        registry.counter("db_pool_checkouts_total", "Connection checkouts", callback=lambda: {(): self.checkouts})
+        registry.counter("db_pool_connects_total", "New DBAPI connections", callback=lambda: {(): self.connects})
+        registry.counter(
+            "db_pool_invalidations_total", "Invalidated connections", callback=lambda: {(): self.invalidations}
+        )
+        registry.counter(
+            "db_pool_checkout_seconds_total",
+            "Time connections spent checked out",
+            callback=lambda: {(): self.total_checkout_seconds}
+        )
+        return self
@@ -0,0 +1,100 @@
+import functools
+import inspect
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.metrics import MetricsRegistry
+
+
+UNTAGGED_OPERATION = "other"
+
+# Repository method currently running in this task; set by track_operations
+current_operation: ContextVar[str] = ContextVar("current_operation", default=UNTAGGED_OPERATION)
+
+
+def _tag_coroutine(name: str, method):
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        token = current_operation.set(name)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            current_operation.reset(token)
+    return wrapper
+
+
+def _tag_async_generator(name: str, method):
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        # Re-set around each step: the consumer may interleave other queries
+        # between two chunks.
+        generator = method(*args, **kwargs)
+        try:
+            while True:
+                token = current_operation.set(name)
+                try:
+                    item = await generator.__anext__()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    current_operation.reset(token)
+                yield item
+        finally:
+            await generator.aclose()
+    return wrapper
+
+
+def track_operations(cls):
+    # Class decorator: every public async method labels the queries it runs
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_"):
+            continue
+        if inspect.isasyncgenfunction(method):
+            setattr(cls, name, _tag_async_generator(name, method))
+        elif inspect.iscoroutinefunction(method):
+            setattr(cls, name, _tag_coroutine(name, method))
+    return cls
+
+
+class QueryMetrics:
+    def __init__(self, registry: MetricsRegistry):
+        self.queries = registry.counter(
+            "db_queries_total",
+            "SQL statements executed, by repository operation",
+            ("operation",)
+        )
+        self.errors = registry.counter(
+            "db_query_errors_total",
+            "SQL statements that raised, by repository operation",
+            ("operation",)
+        )
+        self.duration = registry.histogram(
+            "db_query_duration_seconds",
+            "SQL statement execution time, by repository operation",
+            ("operation",)
+        )
+
+    def attach(self, engine: AsyncEngine) -> "QueryMetrics":
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(sync_engine, "handle_error", self._handle_error)
+        return self
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started_at"].pop()
+        operation = current_operation.get()
+        self.queries.inc(operation)
+        self.duration.observe(time.perf_counter() - started, operation)
+
+    def _handle_error(self, exception_context):
+        conn = exception_context.connection
+        if exception_context.cursor is not None and conn is not None and conn.info.get("query_started_at"):
+            conn.info["query_started_at"].pop()
+        self.errors.inc(current_operation.get())
@@ -0,0 +1,100 @@
+import asyncio
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.infrastructure.secondary.cache.ttl_cache import TTLCache, MISSING
+
+
+logger = logging.getLogger(__name__)
+
+PRIMARY = "primary"
+
+# Errors that mean "this server is unreachable", as opposed to a bad query
+CONNECTION_ERRORS = (DBAPIError, OSError, asyncio.TimeoutError)
+
+RECENT_WRITERS = "recent_writers"
+
+
+# Routes read-only sessions to replicas, round-robin. A replica that fails
+# to hand out a connection is skipped for failure_cooldown seconds and the
+# read falls through to the next one, then to the primary. Clients that
+# just wrote are pinned to the primary for read_your_writes_seconds.
+class ReplicaRouter:
+    def __init__(
+        self,
+        primary: async_sessionmaker,
+        replicas: Sequence[Tuple[str, async_sessionmaker]] = (),
+        failure_cooldown: float = 30.0,
+        read_your_writes_seconds: float = 0.0,
+        max_tracked_clients: int = 10000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.failure_cooldown = failure_cooldown
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self._clock = clock
+        self._failed_until: Dict[str, float] = {}
+        self._round_robin = itertools.cycle(range(len(self.replicas))) if self.replicas else None
+        self._recent_writers = TTLCache(max_entries=max_tracked_clients, clock=clock)
+
+    def mark_write(self, client_key: Optional[str]) -> None:
+        if client_key and self.replicas and self.read_your_writes_seconds > 0:
+            self._recent_writers.set(RECENT_WRITERS, client_key, True, self.read_your_writes_seconds)
+
+    def _pinned_to_primary(self, client_key: Optional[str]) -> bool:
+        return bool(client_key) and self._recent_writers.get(RECENT_WRITERS, client_key) is not MISSING
+
+    def is_healthy(self, name: str) -> bool:
+        return self._failed_until.get(name, 0.0) <= self._clock()
+
+    def mark_failed(self, name: str) -> None:
+        logger.warning("Read replica %s unavailable, skipped for %.0fs", name, self.failure_cooldown)
+        self._failed_until[name] = self._clock() + self.failure_cooldown
+
+    def candidates(self, client_key: Optional[str] = None) -> List[Tuple[str, async_sessionmaker]]:
+        if not self.replicas or self._pinned_to_primary(client_key):
+            return [(PRIMARY, self.primary)]
+
+        start = next(self._round_robin)
+        ordered = self.replicas[start:] + self.replicas[:start]
+        healthy = [(name, factory) for name, factory in ordered if self.is_healthy(name)]
+        return healthy + [(PRIMARY, self.primary)]
+
+    @asynccontextmanager
+    async def read_session(self, client_key: Optional[str] = None) -> AsyncIterator[AsyncSession]:
+        session = None
+        for name, factory in self.candidates(client_key):
+            session = factory()
+            if name == PRIMARY:
+                break
+            try:
+                # Check out the connection now so an unreachable replica can
+                # still fail over before the handler runs its first query.
+                await session.connection()
+                break
+            except CONNECTION_ERRORS:
+                await session.close()
+                self.mark_failed(name)
+
+        try:
+            yield session
+        finally:
+            await session.close()
+
+    def status(self) -> List[Dict[str, Any]]:
+        now = self._clock()
+        return [
+            {
+                "name": name,
+                "healthy": self.is_healthy(name),
+                "retry_in_seconds": round(max(self._failed_until.get(name, 0.0) - now, 0.0), 1),
+            }
+            for name, _ in self.replicas
+        ]
@@ -0,0 +1,131 @@
+import asyncio
+import itertools
+import random
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.infrastructure.secondary.persistence.query_metrics import current_operation
+
+
+# Execution option set on the connection running EXPLAIN so it is not recorded itself
+SKIP_OPTION = "skip_slow_query_log"
+
+MAX_PARAMETERS_LENGTH = 2000
+
+# Only statements without side effects are re-run under EXPLAIN ANALYZE
+EXPLAINABLE_PREFIXES = ("SELECT", "WITH")
+
+
+def _format_parameters(parameters: Any) -> str:
+    # Bulk inserts carry whole batches of descriptions: keep the log bounded
+    text = repr(parameters)
+    if len(text) > MAX_PARAMETERS_LENGTH:
+        return text[:MAX_PARAMETERS_LENGTH] + f"... ({len(text)} chars)"
+    return text
+
+
+class SlowQueryRecorder:
+    def __init__(
+        self,
+        threshold_ms: float,
+        capacity: int = 100,
+        explain_sample_rate: float = 0.0,
+        explain_timeout_ms: int = 10000,
+        random_source: Callable[[], float] = random.random
+    ):
+        if capacity < 1:
+            raise ValueError("Slow query log must hold at least one entry")
+        if not 0.0 <= explain_sample_rate <= 1.0:
+            raise ValueError("EXPLAIN sample rate must be between 0 and 1")
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self.explain_timeout_ms = explain_timeout_ms
+        self._random = random_source
+        self._entries: "deque[Dict[str, Any]]" = deque(maxlen=capacity)
+        self._ids = itertools.count(1)
+        self._engine: Optional[AsyncEngine] = None
+        self._explain_task: Optional[asyncio.Task] = None
+
+    def attach(self, engine: AsyncEngine) -> "SlowQueryRecorder":
+        # Plans are captured on the first engine attached (the primary)
+        if self._engine is None:
+            self._engine = engine
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+        return self
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_started_at", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        duration_ms = (time.perf_counter() - conn.info["slow_query_started_at"].pop()) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+        if context is not None and context.execution_options.get(SKIP_OPTION):
+            return
+
+        entry = self.record(statement, parameters, duration_ms, current_operation.get())
+        if self._should_explain(statement):
+            self._schedule_explain(entry, statement, parameters)
+
+    def record(self, statement: str, parameters: Any, duration_ms: float, operation: str) -> Dict[str, Any]:
+        entry = {
+            "id": next(self._ids),
+            "recorded_at": datetime.now(timezone.utc),
+            "duration_ms": round(duration_ms, 3),
+            "operation": operation,
+            "statement": statement,
+            "parameters": _format_parameters(parameters),
+            "plan": None,
+        }
+        self._entries.append(entry)
+        return entry
+
+    def _should_explain(self, statement: str) -> bool:
+        if self._engine is None or not self.explain_sample_rate:
+            return False
+        # One plan at a time: a slow database should not get a second copy of every slow query
+        if self._explain_task is not None and not self._explain_task.done():
+            return False
+        if not statement.lstrip().upper().startswith(EXPLAINABLE_PREFIXES):
+            return False
+        return self._random() < self.explain_sample_rate
+
+    def _schedule_explain(self, entry: Dict[str, Any], statement: str, parameters: Any) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._explain_task = loop.create_task(self.explain(entry, statement, parameters))
+
+    async def explain(self, entry: Dict[str, Any], statement: str, parameters: Any) -> None:
+        # On its own connection and transaction, rolled back on exit
+        try:
+            async with self._engine.connect() as conn:
+                conn = await conn.execution_options(**{SKIP_OPTION: True})
+                await conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(self.explain_timeout_ms)}")
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}",
+                    parameters
+                )
+                entry["plan"] = result.scalar_one()
+        except SQLAlchemyError as e:
+            entry["plan_error"] = str(e)
+
+    def entries(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        # Newest first
+        entries = list(reversed(self._entries))
+        return entries[:limit] if limit is not None else entries
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,23 +1,127 @@
-from typing import List, Optional, Dict, Any
-from sqlalchemy import select, func, distinct
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence, Set, Tuple
+from sqlalchemy import any_, case, cast, column, delete, literal, literal_column, null, or_, select, func, distinct, tuple_, text, update, values
+from sqlalchemy.dialects.postgresql import ARRAY, JSON, aggregate_order_by, array, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import defer
+from sqlalchemy.exc import DBAPIError, IntegrityError, ProgrammingError, SQLAlchemyError
 
 from app.domain.entities.job import Job
+from app.domain.entities.job_search_hit import JobSearchHit
 from app.domain.ports.job_repository import IJobRepository
+from app.domain.services.content_hash import hash_content, job_content_hash
+from app.domain.services.simhash import (
+    MAX_INDEXED_DISTANCE,
+    NearDuplicateIndex,
+    band_keys,
+    content_fingerprint,
+    job_fingerprint,
+    to_signed,
+    to_unsigned
+)
 from app.domain.exceptions.job_exceptions import (
     DuplicateJobError,
     JobNotFoundError,
+    PartialSaveError,
     RepositoryError
 )
-from app.infrastructure.secondary.persistence.models.job_model import JobModel
+from app.infrastructure.secondary.persistence.models.job_model import JobModel, PARTITIONED, SEARCH_CONFIG
+from app.infrastructure.secondary.persistence.models.job_key_model import JobKeyModel
+from app.infrastructure.secondary.persistence.query_metrics import track_operations
+from app.infrastructure.secondary.persistence.models.job_stats_view import (
+    STATS_VIEW_NAME,
+    TOTAL_SCOPE,
+    build_stats_query,
+    job_stats_view
+)
+
+
+DEFAULT_BATCH_SIZE = 500
+
+# Arbitrary application-wide key for pg_try_advisory_xact_lock
+STATS_REFRESH_LOCK_ID = 0x6A6F6273
+
+EXPORT_COLUMNS = (
+    JobModel.id,
+    JobModel.title,
+    JobModel.company,
+    JobModel.location,
+    JobModel.url,
+    JobModel.posted_date,
+    JobModel.description,
+    JobModel.source,
+    JobModel.scraped_at,
+    JobModel.created_at,
+    JobModel.updated_at,
+)
+
+# Shape of a search result row, served to the JSON fast path as-is
+RESPONSE_COLUMNS = EXPORT_COLUMNS + (JobModel.duplicate_of,)
+RESPONSE_COLUMNS_BY_NAME = {column.key: column for column in RESPONSE_COLUMNS}
 
+FACET_COLUMNS = {
+    "company": JobModel.company,
+    "location": JobModel.location,
+    "source": JobModel.source,
+}
+# Label of the empty grouping set: the number of matching jobs
+TOTAL_FACET = "__total__"
+# Column of a faceted page holding the facet counts, on one of its rows
+FACET_SUMMARY = "facet_summary"
+
+# Columns rewritten by update(), update_many() and upserts
+UPDATE_COLUMNS = (
+    "title", "company", "location", "url", "source", "posted_date", "description",
+    "scraped_at", "simhash", "simhash_bands", "content_hash",
+)
 
+# True on rows an INSERT ... ON CONFLICT DO UPDATE inserted, false on updated ones
+WAS_INSERTED = literal_column(f"({JobModel.__tablename__}.xmax = 0)").label("was_inserted")
+
+# deadlock_detected and serialization_failure: the statement lost a race with
+# a concurrent writer and succeeds if replayed
+TRANSIENT_SQLSTATES = frozenset({"40P01", "40001"})
+# Times a single job is replayed after a transient error before giving up
+ROW_ATTEMPTS = 3
+
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=30, MinWords=10"
+
+
+def _facet_summary(facets: Sequence[str], entries) -> Dict[str, Any]:
+    # (facet, value, count) rows, best first within a facet
+    summary = {"total": 0, "facets": {name: [] for name in facets}}
+    for name, value, count in entries:
+        if name == TOTAL_FACET:
+            summary["total"] = count
+        else:
+            summary["facets"][name].append({"value": value, "count": count})
+    return summary
+
+
+def _like_literal(value: str) -> str:
+    # LIKE pattern matching value itself, with backslash as the escape character
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+@track_operations
 class SQLAlchemyJobRepository(IJobRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        near_duplicate_distance: Optional[int] = MAX_INDEXED_DISTANCE
+    ):
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        if near_duplicate_distance is not None and not 0 <= near_duplicate_distance <= MAX_INDEXED_DISTANCE:
+            raise ValueError(f"Near-duplicate distance must be between 0 and {MAX_INDEXED_DISTANCE}")
         self.session = session
+        self.batch_size = batch_size
+        # None disables near-duplicate detection at ingestion
+        self.near_duplicate_distance = near_duplicate_distance
 
-    def _to_domain(self, model: JobModel) -> Job:
+    def _to_domain(self, model: JobModel, include_description: bool = True) -> Job:
+        # A deferred description must not be touched: it would lazy-load per row
         return Job(
             id=model.id,
             title=model.title,
@@ -26,10 +130,11 @@ class SQLAlchemyJobRepository(IJobRepository):
             url=model.url,
             source=model.source,
             posted_date=model.posted_date,
-            description=model.description,
+            description=model.description if include_description else None,
             scraped_at=model.scraped_at,
             created_at=model.created_at,
-            updated_at=model.updated_at
+            updated_at=model.updated_at,
+            duplicate_of=model.duplicate_of
         )
 
     def _to_model(self, entity: Job) -> JobModel:
@@ -44,15 +149,218 @@ class SQLAlchemyJobRepository(IJobRepository):
             description=entity.description,
             scraped_at=entity.scraped_at,
             created_at=entity.created_at,
-            updated_at=entity.updated_at
+            updated_at=entity.updated_at,
+            duplicate_of=entity.duplicate_of,
+            **self._fingerprint_fields(entity)
         )
 
+    def _fingerprint_fields(self, entity: Job, fingerprint: Optional[int] = None) -> Dict[str, Any]:
+        if fingerprint is None:
+            fingerprint = job_fingerprint(entity)
+        return {
+            "simhash": to_signed(fingerprint),
+            "simhash_bands": band_keys(fingerprint),
+            "content_hash": job_content_hash(entity),
+        }
+
+    def _to_row(self, entity: Job, fingerprint: Optional[int] = None) -> Dict[str, Any]:
+        # Same semantics as the ORM unit of work: a missing timestamp falls
+        # back to the server default instead of being written as NULL.
+        return {
+            "id": entity.id,
+            "title": entity.title,
+            "company": entity.company,
+            "location": entity.location,
+            "url": entity.url,
+            "source": entity.source,
+            "posted_date": entity.posted_date,
+            "description": entity.description,
+            "scraped_at": entity.scraped_at if entity.scraped_at is not None else func.now(),
+            "created_at": entity.created_at if entity.created_at is not None else func.now(),
+            "updated_at": entity.updated_at,
+            "duplicate_of": entity.duplicate_of,
+            **self._fingerprint_fields(entity, fingerprint),
+        }
+
+    def _chunks(self, items: List[Any]) -> List[List[Any]]:
+        return [items[i:i + self.batch_size] for i in range(0, len(items), self.batch_size)]
+
+    def _by_id(self, job_id: str) -> list:
+        if not PARTITIONED:
+            return [JobModel.id == job_id]
+        # The registry's scraped_at is an init plan parameter: the executor
+        # prunes every partition but one instead of probing each id index.
+        scraped_at = select(JobKeyModel.scraped_at).where(JobKeyModel.id == job_id).scalar_subquery()
+        return [JobModel.id == job_id, JobModel.scraped_at == scraped_at]
+
+    def _key_row(self, entity: Job) -> Dict[str, Any]:
+        # func.now() is the transaction timestamp: the same value as the job row's
+        return {
+            "id": entity.id,
+            "url": entity.url,
+            "scraped_at": entity.scraped_at if entity.scraped_at is not None else func.now(),
+        }
+
+    async def _detect_near_duplicates(
+        self,
+        jobs: List[Job],
+        fingerprints: Dict[str, int]
+    ) -> Dict[str, Tuple[str, int]]:
+        # Maps job id -> (canonical id, hamming distance). Candidates sharing at
+        # least one LSH band are fetched through the GIN index in one query;
+        # the exact distance is then checked in memory.
+        if self.near_duplicate_distance is None:
+            return {}
+
+        keys = sorted({key for fingerprint in fingerprints.values() for key in band_keys(fingerprint)})
+
+        stmt = (
+            select(JobModel.id, JobModel.simhash, JobModel.duplicate_of)
+            .where(JobModel.simhash_bands.overlap(array(keys)))
+        )
+        result = await self.session.execute(stmt)
+
+        index = NearDuplicateIndex(self.near_duplicate_distance)
+        for candidate_id, fingerprint, canonical_id in result.all():
+            index.add(candidate_id, to_unsigned(fingerprint), canonical_id)
+
+        matches = {}
+        for job in jobs:
+            match = index.find(job.id, fingerprints[job.id])
+            if match is not None:
+                matches[job.id] = match
+            # Later jobs of the same batch can cluster with this one
+            index.add(job.id, fingerprints[job.id], match[0] if match else None)
+
+        return matches
+
+    async def _claim_keys(self, jobs: List[Job]) -> List[Job]:
+        # Registry first: only the jobs whose id and url were free are inserted,
+        # each id once, at its first occurrence.
+        stmt = (
+            insert(JobKeyModel)
+            .values([self._key_row(job) for job in jobs])
+            .on_conflict_do_nothing()
+            .returning(JobKeyModel.id)
+        )
+        result = await self.session.execute(stmt)
+        claimed = set(result.scalars().all())
+
+        claimed_jobs = []
+        for job in jobs:
+            if job.id in claimed:
+                claimed.discard(job.id)
+                claimed_jobs.append(job)
+        return claimed_jobs
+
+    async def _insert_chunk(self, jobs: List[Job], fingerprints: Dict[str, int]) -> set:
+        if PARTITIONED:
+            jobs = await self._claim_keys(jobs)
+            if not jobs:
+                return set()
+
+        stmt = (
+            insert(JobModel)
+            .values([self._to_row(job, fingerprints[job.id]) for job in jobs])
+            .on_conflict_do_nothing()
+            .returning(JobModel.id)
+        )
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
+    async def _upsert_chunk(self, jobs: List[Job], fingerprints: Dict[str, int]) -> Tuple[set, set, set]:
+        # Returns (inserted ids, updated ids, unchanged ids). A statement can touch
+        # a row only once, so the last occurrence of a repeated id is the one written.
+        jobs = list({job.id: job for job in jobs}.values())
+
+        if PARTITIONED:
+            # No unique index on id to conflict on: new ids go through the
+            # registry, the others get a conditional UPDATE.
+            inserted_ids = await self._insert_chunk(jobs, fingerprints)
+            existing = [job for job in jobs if job.id not in inserted_ids]
+            updated_ids = await self._update_chunk(existing, only_changed=True) if existing else set()
+            # The others are either stored with the same hash, or lost their url
+            # to another id in the registry
+            remaining = [job.id for job in existing if job.id not in updated_ids]
+            unchanged_ids = set()
+            if remaining:
+                result = await self.session.execute(
+                    select(JobKeyModel.id).where(JobKeyModel.id.in_(remaining))
+                )
+                unchanged_ids = set(result.scalars().all())
+            return inserted_ids, updated_ids, unchanged_ids
+
+        # Rows whose content hash did not change are neither written nor returned,
+        # so every id missing from RETURNING is unchanged: a url already used by
+        # another id fails the statement instead (see save_many).
+        stmt = insert(JobModel).values([self._to_row(job, fingerprints[job.id]) for job in jobs])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobModel.id],
+            set_={**{name: stmt.excluded[name] for name in UPDATE_COLUMNS}, "updated_at": func.now()},
+            where=JobModel.content_hash.is_distinct_from(stmt.excluded.content_hash)
+        ).returning(JobModel.id, WAS_INSERTED)
+        result = await self.session.execute(stmt)
+
+        inserted_ids, updated_ids = set(), set()
+        for job_id, was_inserted in result.all():
+            (inserted_ids if was_inserted else updated_ids).add(job_id)
+        unchanged_ids = {job.id for job in jobs} - inserted_ids - updated_ids
+        return inserted_ids, updated_ids, unchanged_ids
+
+    async def _write_chunk(
+        self,
+        jobs: List[Job],
+        fingerprints: Dict[str, int],
+        upsert: bool
+    ) -> Tuple[set, set, set]:
+        # Conflicts on id or url are skipped by the database (or, when
+        # upserting, rewritten if the content changed); RETURNING tells
+        # us which rows actually landed.
+        if upsert:
+            return await self._upsert_chunk(jobs, fingerprints)
+        return await self._insert_chunk(jobs, fingerprints), set(), set()
+
+    async def _write_rows(
+        self,
+        jobs: List[Job],
+        fingerprints: Dict[str, int],
+        upsert: bool
+    ) -> Tuple[set, set, set]:
+        # Replay of a chunk that lost a race, one savepoint per job: a job
+        # whose id or url is still taken is skipped, the others are written.
+        if upsert:
+            jobs = list({job.id: job for job in jobs}.values())
+
+        inserted_ids, changed_ids, unchanged_ids = set(), set(), set()
+        for job in jobs:
+            for attempt in range(1, ROW_ATTEMPTS + 1):
+                try:
+                    async with self.session.begin_nested():
+                        inserted, changed, unchanged = await self._write_chunk([job], fingerprints, upsert)
+                    break
+                except IntegrityError:
+                    inserted, changed, unchanged = set(), set(), set()
+                    break
+                except DBAPIError as e:
+                    if not self._is_transient(e) or attempt == ROW_ATTEMPTS:
+                        raise
+            inserted_ids |= inserted
+            changed_ids |= changed
+            unchanged_ids |= unchanged
+        return inserted_ids, changed_ids, unchanged_ids
+
+    def _is_transient(self, error: DBAPIError) -> bool:
+        return getattr(error.orig, "sqlstate", None) in TRANSIENT_SQLSTATES
+
     async def save(self, job: Job) -> Job:
         try:
             existing = await self.exists_by_id(job.id)
             if existing:
                 raise DuplicateJobError(job.id)
 
+            if PARTITIONED:
+                self.session.add(JobKeyModel(**self._key_row(job)))
+                await self.session.flush()
             model = self._to_model(job)
             self.session.add(model)
             await self.session.commit()
@@ -69,49 +377,88 @@ class SQLAlchemyJobRepository(IJobRepository):
             await self.session.rollback()
             raise RepositoryError(f"Error saving job: {str(e)}", e)
 
-    async def save_many(self, jobs: List[Job]) -> Dict[str, Any]:
+    async def save_many(self, jobs: List[Job], upsert: bool = False) -> Dict[str, Any]:
         inserted = 0
         duplicates = 0
         duplicate_ids = []
-        total = len(jobs)
-
-        try:
-            for job in jobs:
-                try:
-                    existing = await self.exists_by_id(job.id)
-                    if existing:
-                        duplicates += 1
-                        duplicate_ids.append(job.id)
-                        continue
-
-                    model = self._to_model(job)
-                    self.session.add(model)
-                    inserted += 1
-
-                except IntegrityError:
-                    duplicates += 1
-                    duplicate_ids.append(job.id)
-                    await self.session.rollback()
-                    continue
-
-            # Commit all at once
-            await self.session.commit()
+        updated_ids = []
+        unchanged_ids = []
+        near_duplicates = []
+        # Jobs of the chunks committed so far, a prefix of the batch
+        saved = 0
 
+        def summary() -> Dict[str, Any]:
             return {
                 "inserted": inserted,
+                "updated": len(updated_ids),
+                "unchanged": len(unchanged_ids),
                 "duplicates": duplicates,
                 "duplicate_ids": duplicate_ids,
-                "failed": 0,
-                "total": total
+                "updated_ids": updated_ids,
+                "unchanged_ids": unchanged_ids,
+                "near_duplicates": near_duplicates,
+                "failed": len(jobs) - saved,
+                "failed_ids": [job.id for job in jobs[saved:]],
+                "total": len(jobs)
             }
 
+        try:
+            for chunk in self._chunks(jobs):
+                fingerprints = {job.id: job_fingerprint(job) for job in chunk}
+                matches = await self._detect_near_duplicates(chunk, fingerprints)
+                for job in chunk:
+                    if job.id in matches:
+                        job.duplicate_of = matches[job.id][0]
+
+                # A concurrent writer can still take an id or url between our
+                # statement's snapshot and its insert (unique violation), or lock
+                # the same keys in another order (deadlock). Only the chunk's
+                # savepoint is then rolled back, and the chunk replayed job by job.
+                try:
+                    async with self.session.begin_nested():
+                        inserted_ids, changed_ids, kept_ids = await self._write_chunk(
+                            chunk, fingerprints, upsert
+                        )
+                except DBAPIError as e:
+                    if not isinstance(e, IntegrityError) and not self._is_transient(e):
+                        raise
+                    inserted_ids, changed_ids, kept_ids = await self._write_rows(chunk, fingerprints, upsert)
+
+                # Committed chunk by chunk: locks are held for one chunk only, and
+                # a failure later in the batch keeps the chunks already written.
+                await self.session.commit()
+                saved += len(chunk)
+
+                for job in chunk:
+                    if job.id in changed_ids:
+                        changed_ids.discard(job.id)
+                        updated_ids.append(job.id)
+                    elif job.id in inserted_ids:
+                        # A repeated id within the batch only inserts once
+                        inserted_ids.discard(job.id)
+                        inserted += 1
+                        if job.id in matches:
+                            canonical_id, distance = matches[job.id]
+                            near_duplicates.append(
+                                {"id": job.id, "duplicate_of": canonical_id, "distance": distance}
+                            )
+                    elif job.id in kept_ids:
+                        # Stored with the same content hash: nothing was written
+                        kept_ids.discard(job.id)
+                        unchanged_ids.append(job.id)
+                    else:
+                        duplicates += 1
+                        duplicate_ids.append(job.id)
+
+            return summary()
+
         except SQLAlchemyError as e:
             await self.session.rollback()
-            raise RepositoryError(f"Error saving jobs: {str(e)}", e)
+            raise PartialSaveError(f"Error saving jobs: {str(e)}", summary(), e)
 
     async def find_by_id(self, job_id: str) -> Optional[Job]:
         try:
-            stmt = select(JobModel).where(JobModel.id == job_id)
+            stmt = select(JobModel).where(*self._by_id(job_id))
             result = await self.session.execute(stmt)
             model = result.scalar_one_or_none()
 
@@ -122,13 +469,110 @@ class SQLAlchemyJobRepository(IJobRepository):
 
     async def exists_by_id(self, job_id: str) -> bool:
         try:
-            stmt = select(JobModel.id).where(JobModel.id == job_id)
+            # The registry answers without touching the partitions
+            id_column = JobKeyModel.id if PARTITIONED else JobModel.id
+            stmt = select(id_column).where(id_column == job_id)
             result = await self.session.execute(stmt)
             return result.scalar_one_or_none() is not None
 
         except SQLAlchemyError as e:
             raise RepositoryError(f"Error checking job existence: {str(e)}", e)
 
+    async def find_existing_ids(self, job_ids: List[str]) -> Set[str]:
+        if not job_ids:
+            return set()
+        try:
+            # `= ANY(:ids)` binds the whole list as one array parameter: a single
+            # prepared statement and primary-key index probes, whatever the count.
+            id_column = JobKeyModel.id if PARTITIONED else JobModel.id
+            stmt = select(id_column).where(id_column == any_(literal(job_ids, ARRAY(id_column.type))))
+            result = await self.session.execute(stmt)
+            return set(result.scalars().all())
+
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Error checking job existence: {str(e)}", e)
+
+    async def find_content_hashes(self, job_ids: List[str]) -> Dict[str, Optional[str]]:
+        # Rows stored before content hashes existed map to None
+        if not job_ids:
+            return {}
+        try:
+            stmt = select(JobModel.id, JobModel.content_hash).where(
+                JobModel.id == any_(literal(job_ids, ARRAY(JobModel.id.type)))
+            )
+            result = await self.session.execute(stmt)
+            return {job_id: content_hash for job_id, content_hash in result.all()}
+
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Error checking job existence: {str(e)}", e)
+
+    def _apply_search_term(self, stmt, search_term: Optional[str], search_mode: str = "substring"):
+        if not search_term:
+            return stmt
+
+        if search_mode == "fulltext":
+            return stmt.where(
+                JobModel.search_vector.op("@@")(func.websearch_to_tsquery(SEARCH_CONFIG, search_term))
+            )
+
+        search_pattern = f"%{search_term}%"
+        return stmt.where(
+            (JobModel.title.ilike(search_pattern)) |
+            (JobModel.company.ilike(search_pattern)) |
+            (JobModel.description.ilike(search_pattern))
+        )
+
+    def _apply_filters(
+        self,
+        stmt,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        collapse_duplicates: bool = False,
+        scraped_since: Optional[datetime] = None
+    ):
+        if location:
+            stmt = stmt.where(JobModel.location.ilike(f"%{location}%"))
+
+        if company:
+            stmt = stmt.where(JobModel.company.ilike(f"%{company}%"))
+
+        if source:
+            stmt = stmt.where(JobModel.source == source)
+
+        # One row per near-duplicate cluster: its canonical posting
+        if collapse_duplicates:
+            stmt = stmt.where(JobModel.duplicate_of.is_(None))
+
+        # A bound on the partition key lets Postgres skip older partitions
+        if scraped_since is not None:
+            stmt = stmt.where(JobModel.scraped_at >= scraped_since)
+
+        return stmt
+
+    def _build_search(
+        self,
+        stmt,
+        search_term: Optional[str],
+        location: Optional[str],
+        company: Optional[str],
+        source: Optional[str],
+        limit: int,
+        offset: int,
+        after: Optional[Tuple[datetime, str]],
+        collapse_duplicates: bool,
+        scraped_since: Optional[datetime]
+    ):
+        stmt = self._apply_search_term(stmt, search_term)
+        stmt = self._apply_filters(stmt, location, company, source, collapse_duplicates, scraped_since)
+
+        # Newest first; (created_at, id) is unique so pages never overlap
+        if after is not None:
+            stmt = stmt.where(tuple_(JobModel.created_at, JobModel.id) < tuple_(*after))
+
+        stmt = stmt.order_by(JobModel.created_at.desc(), JobModel.id.desc())
+        return stmt.limit(limit).offset(offset)
+
     async def search(
         self,
         search_term: Optional[str] = None,
@@ -136,37 +580,451 @@ class SQLAlchemyJobRepository(IJobRepository):
         company: Optional[str] = None,
         source: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[Tuple[datetime, str]] = None,
+        collapse_duplicates: bool = False,
+        include_description: bool = True,
+        scraped_since: Optional[datetime] = None
     ) -> List[Job]:
         try:
             stmt = select(JobModel)
+            if not include_description:
+                # The description is the TOASTed bulk of the row
+                stmt = stmt.options(defer(JobModel.description))
+            stmt = self._build_search(
+                stmt, search_term, location, company, source,
+                limit, offset, after, collapse_duplicates, scraped_since
+            )
+            result = await self.session.execute(stmt)
+            models = result.scalars().all()
 
-            if search_term:
-                search_pattern = f"%{search_term}%"
-                stmt = stmt.where(
-                    (JobModel.title.ilike(search_pattern)) |
-                    (JobModel.company.ilike(search_pattern)) |
-                    (JobModel.description.ilike(search_pattern))
-                )
+            return [self._to_domain(model, include_description) for model in models]
 
-            if location:
-                stmt = stmt.where(JobModel.location.ilike(f"%{location}%"))
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Error searching jobs: {str(e)}", e)
 
-            if company:
-                stmt = stmt.where(JobModel.company.ilike(f"%{company}%"))
+    async def search_rows(
+        self,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, str]] = None,
+        collapse_duplicates: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        scraped_since: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        # Same query as search(), returned as plain column mappings: no ORM
+        # identity map, no JobModel or Job instances. Only the requested
+        # fields are selected, so unread columns are never fetched.
+        columns = self._response_columns(fields)
 
-            if source:
-                stmt = stmt.where(JobModel.source == source)
+        try:
+            stmt = self._build_search(
+                select(*columns), search_term, location, company, source,
+                limit, offset, after, collapse_duplicates, scraped_since
+            )
+            result = await self.session.execute(stmt)
+            return [dict(row) for row in result.mappings()]
+
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Error searching jobs: {str(e)}", e)
+
+    def _response_columns(self, fields: Optional[Sequence[str]]) -> Sequence:
+        if fields is None:
+            return RESPONSE_COLUMNS
+        unknown = [field for field in fields if field not in RESPONSE_COLUMNS_BY_NAME]
+        if unknown:
+            raise ValueError(f"Unknown job fields: {', '.join(unknown)}")
+        return [RESPONSE_COLUMNS_BY_NAME[field] for field in fields]
+
+    async def search_rows_with_facets(
+        self,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[Tuple[datetime, str]] = None,
+        collapse_duplicates: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        scraped_since: Optional[datetime] = None,
+        facets: Sequence[str] = ("company", "location", "source"),
+        facet_limit: int = 10
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        # search_rows() and search_facets() in one statement: the page is a
+        # subquery, re-sorted outside on its own keys, and one of its rows
+        # carries the facet counts.
+        columns = self._response_columns(fields)
+        facet_summary = self._facet_summary_column(
+            facets, facet_limit, search_term, "substring", location, company, source,
+            collapse_duplicates, scraped_since
+        )
 
-            stmt = stmt.limit(limit).offset(offset)
+        try:
+            page = self._build_search(
+                select(*columns, JobModel.created_at.label("page_created_at"), JobModel.id.label("page_id")),
+                search_term, location, company, source,
+                limit, offset, after, collapse_duplicates, scraped_since
+            ).subquery()
+            stmt = (
+                select(*[page.c[column.key] for column in columns], facet_summary)
+                .order_by(page.c.page_created_at.desc(), page.c.page_id.desc())
+            )
             result = await self.session.execute(stmt)
-            models = result.scalars().all()
 
-            return [self._to_domain(model) for model in models]
+            rows, entries = [], None
+            for row in result.mappings():
+                row = dict(row)
+                entries = row.pop(FACET_SUMMARY) or entries
+                rows.append(row)
+
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Error searching jobs: {str(e)}", e)
+
+        summary = await self._page_facets(
+            entries, facets, facet_limit, offset, after, search_term, "substring",
+            location, company, source, collapse_duplicates, scraped_since
+        )
+        return rows, summary
+
+    async def search_fulltext(
+        self,
+        query: str,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        collapse_duplicates: bool = False,
+        include_description: bool = True,
+        scraped_since: Optional[datetime] = None
+    ) -> List[JobSearchHit]:
+        try:
+            stmt = self._build_fulltext(
+                query, location, company, source, limit, offset,
+                collapse_duplicates, include_description, scraped_since
+            )
+            result = await self.session.execute(stmt)
+
+            return [
+                JobSearchHit(job=self._to_domain(model, include_description), rank=rank, snippet=snippet)
+                for model, rank, snippet in result.all()
+            ]
 
         except SQLAlchemyError as e:
             raise RepositoryError(f"Error searching jobs: {str(e)}", e)
 
+    async def search_fulltext_with_facets(
+        self,
+        query: str,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        collapse_duplicates: bool = False,
+        include_description: bool = True,
+        scraped_since: Optional[datetime] = None,
+        facets: Sequence[str] = ("company", "location", "source"),
+        facet_limit: int = 10
+    ) -> Tuple[List[JobSearchHit], Dict[str, Any]]:
+        # search_fulltext() and search_facets() in one statement
+        facet_summary = self._facet_summary_column(
+            facets, facet_limit, query, "fulltext", location, company, source,
+            collapse_duplicates, scraped_since
+        )
+
+        try:
+            stmt = self._build_fulltext(
+                query, location, company, source, limit, offset,
+                collapse_duplicates, include_description, scraped_since
+            ).add_columns(facet_summary)
+            result = await self.session.execute(stmt)
+
+            hits, entries = [], None
+            for model, rank, snippet, row_entries in result.all():
+                entries = row_entries or entries
+                hits.append(JobSearchHit(job=self._to_domain(model, include_description), rank=rank, snippet=snippet))
+
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Error searching jobs: {str(e)}", e)
+
+        summary = await self._page_facets(
+            entries, facets, facet_limit, offset, None, query, "fulltext",
+            location, company, source, collapse_duplicates, scraped_since
+        )
+        return hits, summary
+
+    def _build_fulltext(
+        self,
+        query: str,
+        location: Optional[str],
+        company: Optional[str],
+        source: Optional[str],
+        limit: int,
+        offset: int,
+        collapse_duplicates: bool,
+        include_description: bool,
+        scraped_since: Optional[datetime]
+    ):
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        rank = func.ts_rank_cd(JobModel.search_vector, ts_query).label("rank")
+
+        # Rank and paginate on the GIN-filtered ids first so ts_headline,
+        # which re-parses the description, only runs for the returned page.
+        page = (
+            select(JobModel.id, rank)
+            .where(JobModel.search_vector.op("@@")(ts_query))
+        )
+        page = self._apply_filters(page, location, company, source, collapse_duplicates, scraped_since)
+        page = (
+            page.order_by(rank.desc(), JobModel.id)
+            .limit(limit)
+            .offset(offset)
+            .subquery()
+        )
+
+        snippet = func.ts_headline(
+            SEARCH_CONFIG,
+            func.coalesce(JobModel.description, JobModel.title),
+            ts_query,
+            HEADLINE_OPTIONS
+        ).label("snippet")
+
+        stmt = (
+            select(JobModel, page.c.rank, snippet)
+            .join(page, page.c.id == JobModel.id)
+            .order_by(page.c.rank.desc(), JobModel.id)
+        )
+        if not include_description:
+            # The snippet still reads it server-side, it is just not sent back
+            stmt = stmt.options(defer(JobModel.description))
+        return stmt
+
+    async def export_rows(
+        self,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        search_mode: str = "substring",
+        chunk_size: int = 1000,
+        scraped_since: Optional[datetime] = None,
+        key_range: Optional[Tuple[Optional[Tuple[datetime, str]], Optional[Tuple[datetime, str]]]] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        # Server-side cursor: rows are fetched chunk by chunk as plain mappings,
+        # without building ORM objects or domain entities.
+        stmt = select(*EXPORT_COLUMNS)
+        stmt = self._apply_search_term(stmt, search_term, search_mode)
+        stmt = self._apply_filters(stmt, location, company, source, scraped_since=scraped_since)
+        if key_range is not None:
+            # [lower, upper) in export order: a parallel worker reads only its
+            # own range of idx_jobs_created_at_id
+            lower, upper = key_range
+            if lower is not None:
+                stmt = stmt.where(tuple_(JobModel.created_at, JobModel.id) >= tuple_(*lower))
+            if upper is not None:
+                stmt = stmt.where(tuple_(JobModel.created_at, JobModel.id) < tuple_(*upper))
+        stmt = stmt.order_by(JobModel.created_at, JobModel.id)
+        stmt = stmt.execution_options(yield_per=chunk_size)
+
+        try:
+            result = await self.session.stream(stmt)
+            async for partition in result.mappings().partitions():
+                yield [dict(row) for row in partition]
+
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Error exporting jobs: {str(e)}", e)
+
+    async def export_boundaries(
+        self,
+        count: int,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        search_mode: str = "substring",
+        scraped_since: Optional[datetime] = None
+    ) -> List[Tuple[datetime, str]]:
+        # (created_at, id) where each of count equal slices of the export
+        # starts, the first one excepted. Only the keys are read: without
+        # filters, an index-only scan of idx_jobs_created_at_id.
+        if count < 2:
+            return []
+
+        bucket = func.ntile(count).over(order_by=(JobModel.created_at, JobModel.id)).label("bucket")
+        keys = select(JobModel.created_at, JobModel.id, bucket)
+        keys = self._apply_search_term(keys, search_term, search_mode)
+        keys = self._apply_filters(keys, location, company, source, scraped_since=scraped_since).subquery()
+        stmt = (
+            select(keys.c.created_at, keys.c.id)
+            .distinct(keys.c.bucket)
+            .order_by(keys.c.bucket, keys.c.created_at, keys.c.id)
+        )
+
+        try:
+            result = await self.session.execute(stmt)
+            return [(created_at, job_id) for created_at, job_id in result.all()][1:]
+
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Error computing export boundaries: {str(e)}", e)
+
+    async def search_facets(
+        self,
+        search_term: Optional[str] = None,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        search_mode: str = "substring",
+        collapse_duplicates: bool = False,
+        scraped_since: Optional[datetime] = None,
+        facets: Sequence[str] = ("company", "location", "source"),
+        limit: int = 10
+    ) -> Dict[str, Any]:
+        top = self._build_facets(
+            facets, limit, search_term, search_mode, location, company, source,
+            collapse_duplicates, scraped_since
+        )
+        stmt = select(top.c.facet, top.c.value, top.c["count"]).order_by(top.c.facet, top.c.position)
+
+        try:
+            result = await self.session.execute(stmt)
+            return _facet_summary(facets, result.all())
+
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Error computing search facets: {str(e)}", e)
+
+    def _build_facets(
+        self,
+        facets: Sequence[str],
+        limit: int,
+        search_term: Optional[str],
+        search_mode: str,
+        location: Optional[str],
+        company: Optional[str],
+        source: Optional[str],
+        collapse_duplicates: bool,
+        scraped_since: Optional[datetime]
+    ):
+        # A single GROUPING SETS scan counts every requested facet plus the
+        # total; row_number() keeps the top `limit` values of each facet.
+        unknown = [facet for facet in facets if facet not in FACET_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown facets: {', '.join(unknown)}")
+        columns = {facet: FACET_COLUMNS[facet] for facet in facets}
+
+        facet = case(
+            *[(func.grouping(facet_column) == 0, name) for name, facet_column in columns.items()],
+            else_=TOTAL_FACET
+        ).label("facet")
+        counts = select(
+            facet,
+            func.coalesce(*columns.values()).label("value"),
+            func.count().label("count"),
+        )
+        counts = self._apply_search_term(counts, search_term, search_mode)
+        counts = self._apply_filters(counts, location, company, source, collapse_duplicates, scraped_since)
+        counts = counts.group_by(
+            func.grouping_sets(*[tuple_(facet_column) for facet_column in columns.values()], tuple_())
+        ).subquery()
+
+        position = func.row_number().over(
+            partition_by=counts.c.facet,
+            order_by=(counts.c["count"].desc(), counts.c.value)
+        ).label("position")
+        ranked = select(counts.c.facet, counts.c.value, counts.c["count"], position).subquery()
+        return (
+            select(ranked)
+            .where((ranked.c.position <= limit) | (ranked.c.facet == TOTAL_FACET))
+            .subquery()
+        )
+
+    def _facet_summary_column(
+        self,
+        facets: Sequence[str],
+        limit: int,
+        search_term: Optional[str],
+        search_mode: str,
+        location: Optional[str],
+        company: Optional[str],
+        source: Optional[str],
+        collapse_duplicates: bool,
+        scraped_since: Optional[datetime]
+    ):
+        # The facet rows folded into one JSON array, set on a single row of the
+        # page (row_number() over the already limited page is cheap); the
+        # uncorrelated subquery is evaluated once.
+        top = self._build_facets(
+            facets, limit, search_term, search_mode, location, company, source,
+            collapse_duplicates, scraped_since
+        )
+        entries = func.json_agg(
+            aggregate_order_by(
+                func.json_build_array(top.c.facet, top.c.value, top.c["count"]),
+                top.c.facet,
+                top.c.position
+            ),
+            type_=JSON
+        )
+        return case(
+            (func.row_number().over() == 1, select(entries).scalar_subquery())
+        ).label(FACET_SUMMARY)
+
+    async def _page_facets(
+        self,
+        entries: Optional[List[List[Any]]],
+        facets: Sequence[str],
+        limit: int,
+        offset: int,
+        after: Optional[Tuple[datetime, str]],
+        search_term: Optional[str],
+        search_mode: str,
+        location: Optional[str],
+        company: Optional[str],
+        source: Optional[str],
+        collapse_duplicates: bool,
+        scraped_since: Optional[datetime]
+    ) -> Dict[str, Any]:
+        if entries is not None:
+            return _facet_summary(facets, entries)
+        # No row to carry the counts: an empty first page means nothing
+        # matched; past the last page they take a query of their own
+        if not offset and after is None:
+            return _facet_summary(facets, [])
+        return await self.search_facets(
+            search_term=search_term,
+            location=location,
+            company=company,
+            source=source,
+            search_mode=search_mode,
+            collapse_duplicates=collapse_duplicates,
+            scraped_since=scraped_since,
+            facets=facets,
+            limit=limit
+        )
+
+    async def suggest_companies(self, name: str, limit: int = 5) -> List[Tuple[str, float]]:
+        try:
+            similarity = func.similarity(JobModel.company, name).label("similarity")
+            # `%` is the pg_trgm similarity operator, served by idx_jobs_company_trgm
+            stmt = (
+                select(JobModel.company, similarity)
+                .where(JobModel.company.op("%")(name))
+                .group_by(JobModel.company)
+                .order_by(similarity.desc(), JobModel.company)
+                .limit(limit)
+            )
+            result = await self.session.execute(stmt)
+
+            return [(company, float(score)) for company, score in result.all()]
+
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Error suggesting companies: {str(e)}", e)
+
     async def count_total(self) -> int:
         try:
             stmt = select(func.count(JobModel.id))
@@ -209,9 +1067,70 @@ class SQLAlchemyJobRepository(IJobRepository):
         except SQLAlchemyError as e:
             raise RepositoryError(f"Error counting by source: {str(e)}", e)
 
+    def _rows_to_stats(self, rows) -> Dict[str, Any]:
+        stats = {
+            "total_jobs": 0,
+            "total_companies": 0,
+            "total_locations": 0,
+            "jobs_by_source": {},
+            "refreshed_at": None
+        }
+
+        for row in rows:
+            if row.scope == TOTAL_SCOPE:
+                stats["total_jobs"] = row.total_jobs
+                stats["total_companies"] = row.total_companies
+                stats["total_locations"] = row.total_locations
+                stats["refreshed_at"] = row.refreshed_at
+            else:
+                stats["jobs_by_source"][row.source] = row.total_jobs
+
+        return stats
+
+    async def get_stats(self) -> Dict[str, Any]:
+        try:
+            result = await self.session.execute(build_stats_query())
+            return self._rows_to_stats(result.all())
+
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Error computing stats: {str(e)}", e)
+
+    async def get_stats_snapshot(self) -> Optional[Dict[str, Any]]:
+        try:
+            result = await self.session.execute(select(job_stats_view))
+            rows = result.all()
+            return self._rows_to_stats(rows) if rows else None
+
+        except ProgrammingError:
+            # The view has not been created on this database yet
+            await self.session.rollback()
+            return None
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Error reading stats snapshot: {str(e)}", e)
+
+    async def refresh_stats_snapshot(self) -> bool:
+        try:
+            # Only one worker refreshes at a time, the others skip instead of queueing
+            result = await self.session.execute(
+                select(func.pg_try_advisory_xact_lock(STATS_REFRESH_LOCK_ID))
+            )
+            if not result.scalar_one():
+                await self.session.rollback()
+                return False
+
+            await self.session.execute(
+                text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {STATS_VIEW_NAME}")
+            )
+            await self.session.commit()
+            return True
+
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise RepositoryError(f"Error refreshing stats snapshot: {str(e)}", e)
+
     async def delete_by_id(self, job_id: str) -> bool:
         try:
-            stmt = select(JobModel).where(JobModel.id == job_id)
+            stmt = select(JobModel).where(*self._by_id(job_id))
             result = await self.session.execute(stmt)
             model = result.scalar_one_or_none()
 
@@ -219,6 +1138,8 @@ class SQLAlchemyJobRepository(IJobRepository):
                 return False
 
             await self.session.delete(model)
+            if PARTITIONED:
+                await self.session.execute(delete(JobKeyModel).where(JobKeyModel.id == job_id))
             await self.session.commit()
             return True
 
@@ -228,13 +1149,23 @@ class SQLAlchemyJobRepository(IJobRepository):
 
     async def update(self, job: Job) -> Job:
         try:
-            stmt = select(JobModel).where(JobModel.id == job.id)
+            stmt = select(JobModel).where(*self._by_id(job.id))
             result = await self.session.execute(stmt)
             model = result.scalar_one_or_none()
 
             if not model:
                 raise JobNotFoundError(job.id)
 
+            # A missing scraped_at keeps the stored one, as in update_many()
+            scraped_at = job.scraped_at or model.scraped_at
+            if PARTITIONED:
+                # A new scraped_at moves the row to another partition; the registry follows
+                await self.session.execute(
+                    update(JobKeyModel)
+                    .where(JobKeyModel.id == job.id)
+                    .values(url=job.url, scraped_at=scraped_at)
+                )
+
             model.title = job.title
             model.company = job.company
             model.location = job.location
@@ -242,7 +1173,9 @@ class SQLAlchemyJobRepository(IJobRepository):
             model.source = job.source
             model.posted_date = job.posted_date
             model.description = job.description
-            model.scraped_at = job.scraped_at
+            model.scraped_at = scraped_at
+            for field, value in self._fingerprint_fields(job).items():
+                setattr(model, field, value)
 
             await self.session.commit()
             await self.session.refresh(model)
@@ -254,3 +1187,195 @@ class SQLAlchemyJobRepository(IJobRepository):
         except SQLAlchemyError as e:
             await self.session.rollback()
             raise RepositoryError(f"Error updating job: {str(e)}", e)
+
+    async def _delete_ids(self, ids) -> int:
+        # ids is a list or a SELECT of ids; one DELETE per chunk either way
+        result = await self.session.execute(
+            delete(JobModel).where(JobModel.id.in_(ids)).returning(JobModel.id)
+        )
+        deleted = list(result.scalars().all())
+        if not deleted:
+            return 0
+
+        # An orphaned cluster keeps one canonical posting, its oldest member,
+        # and the others point to it: collapsed searches would otherwise hide
+        # the whole cluster, or show every member of it.
+        heirs = (
+            select(JobModel.duplicate_of.label("canonical"), JobModel.id.label("heir"))
+            .where(JobModel.duplicate_of.in_(deleted))
+            .distinct(JobModel.duplicate_of)
+            .order_by(JobModel.duplicate_of, JobModel.created_at, JobModel.id)
+            .cte("heirs")
+        )
+        await self.session.execute(
+            update(JobModel)
+            .where(JobModel.duplicate_of == heirs.c.canonical)
+            .values(duplicate_of=case((JobModel.id == heirs.c.heir, null()), else_=heirs.c.heir))
+            .execution_options(synchronize_session=False)
+        )
+        if PARTITIONED:
+            await self.session.execute(delete(JobKeyModel).where(JobKeyModel.id.in_(deleted)))
+        return len(deleted)
+
+    async def delete_many(self, job_ids: List[str]) -> int:
+        deleted = 0
+        try:
+            for chunk in self._chunks(list(dict.fromkeys(job_ids))):
+                deleted += await self._delete_ids(chunk)
+            await self.session.commit()
+            return deleted
+
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise RepositoryError(f"Error deleting jobs: {str(e)}", e)
+
+    async def delete_where(
+        self,
+        location: Optional[str] = None,
+        company: Optional[str] = None,
+        source: Optional[str] = None,
+        scraped_before: Optional[datetime] = None,
+        duplicates_only: bool = False
+    ) -> int:
+        if not (location or company or source or scraped_before or duplicates_only):
+            raise ValueError("Refusing to delete jobs without any criteria")
+
+        # Exact (case-insensitive) matches only: search's substring match
+        # would let "a" or "%" reach far more rows than intended
+        matching = select(JobModel.id)
+        if location:
+            matching = matching.where(JobModel.location.ilike(_like_literal(location), escape="\\"))
+        if company:
+            matching = matching.where(JobModel.company.ilike(_like_literal(company), escape="\\"))
+        if source:
+            matching = matching.where(JobModel.source == source)
+        if scraped_before is not None:
+            matching = matching.where(JobModel.scraped_at < scraped_before)
+        if duplicates_only:
+            matching = matching.where(JobModel.duplicate_of.is_not(None))
+
+        deleted = 0
+        try:
+            # One short transaction per chunk: row locks are held briefly and
+            # an interrupted cleanup keeps what it already removed.
+            while True:
+                count = await self._delete_ids(matching.limit(self.batch_size).scalar_subquery())
+                await self.session.commit()
+                if not count:
+                    return deleted
+                deleted += count
+
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise RepositoryError(f"Error deleting jobs: {str(e)}", e)
+
+    async def _update_chunk(self, jobs: List[Job], only_changed: bool = False) -> set:
+        # Last occurrence of an id wins, as with successive update() calls
+        latest = {job.id: job for job in jobs}
+        rows = []
+        for job in latest.values():
+            fingerprint = self._fingerprint_fields(job)
+            rows.append((
+                job.id, job.title, job.company, job.location, job.url, job.source,
+                job.posted_date, job.description, job.scraped_at,
+                fingerprint["simhash"], fingerprint["simhash_bands"], fingerprint["content_hash"],
+            ))
+
+        table = JobModel.__table__
+        changes = values(
+            *(column(name, table.c[name].type) for name in ("id",) + UPDATE_COLUMNS),
+            name="changes"
+        ).data(rows)
+
+        # One UPDATE ... FROM (VALUES ...) for the whole chunk; a missing
+        # scraped_at keeps the stored one. NULLs are sent as untyped literals,
+        # hence the cast.
+        scraped_at = cast(changes.c.scraped_at, table.c.scraped_at.type)
+        assignments = {name: changes.c[name] for name in UPDATE_COLUMNS}
+        assignments["scraped_at"] = func.coalesce(scraped_at, JobModel.scraped_at)
+        stmt = update(JobModel).where(JobModel.id == changes.c.id)
+        if only_changed:
+            stmt = stmt.where(JobModel.content_hash.is_distinct_from(changes.c.content_hash))
+        result = await self.session.execute(
+            stmt.values(assignments)
+            .returning(JobModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        updated_ids = set(result.scalars().all())
+
+        if PARTITIONED and updated_ids:
+            await self.session.execute(
+                update(JobKeyModel)
+                .where(JobKeyModel.id == changes.c.id, JobKeyModel.id.in_(updated_ids))
+                .values(url=changes.c.url, scraped_at=func.coalesce(scraped_at, JobKeyModel.scraped_at))
+                .execution_options(synchronize_session=False)
+            )
+        return updated_ids
+
+    async def backfill_fingerprints(self, limit: int = DEFAULT_BATCH_SIZE) -> int:
+        # Rows stored before SimHash or content hashes existed. SKIP LOCKED
+        # lets several workers backfill side by side without waiting.
+        try:
+            stmt = (
+                select(
+                    JobModel.id, JobModel.title, JobModel.company, JobModel.location, JobModel.url,
+                    JobModel.source, JobModel.posted_date, JobModel.description
+                )
+                .where(or_(JobModel.simhash.is_(None), JobModel.content_hash.is_(None)))
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            result = await self.session.execute(stmt)
+            rows = result.mappings().all()
+            if not rows:
+                await self.session.rollback()
+                return 0
+
+            data = []
+            for row in rows:
+                value = content_fingerprint(row["title"], row["company"], row["description"])
+                data.append((row["id"], to_signed(value), band_keys(value), hash_content(row)))
+
+            table = JobModel.__table__
+            names = ("id", "simhash", "simhash_bands", "content_hash")
+            changes = values(*(column(name, table.c[name].type) for name in names), name="changes").data(data)
+            await self.session.execute(
+                update(JobModel)
+                .where(JobModel.id == changes.c.id)
+                # Derived columns only: not an update of the posting itself
+                .values(
+                    simhash=changes.c.simhash,
+                    simhash_bands=changes.c.simhash_bands,
+                    content_hash=changes.c.content_hash,
+                    updated_at=JobModel.updated_at
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.commit()
+            return len(rows)
+
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise RepositoryError(f"Error backfilling fingerprints: {str(e)}", e)
+
+    async def rebuild_indexes(self) -> None:
+        # REINDEX CONCURRENTLY cannot run in a transaction block: this must be
+        # the first statement of the session.
+        try:
+            connection = await self.session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+            await connection.execute(text(f"REINDEX TABLE CONCURRENTLY {JobModel.__tablename__}"))
+
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Error rebuilding indexes: {str(e)}", e)
+
+    async def update_many(self, jobs: List[Job]) -> int:
+        updated = 0
+        try:
+            for chunk in self._chunks(jobs):
+                updated += len(await self._update_chunk(chunk))
+            await self.session.commit()
+            return updated
+
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise RepositoryError(f"Error updating jobs: {str(e)}", e)
@@ -0,0 +1,74 @@
+import asyncio
+import logging
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.exceptions.job_exceptions import RepositoryError
+from app.domain.ports.job_repository import IJobRepository
+from app.domain.ports.stats_refresher import IStatsRefresher
+from app.infrastructure.secondary.persistence.sqlalchemy_job_repository import SQLAlchemyJobRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+# Submits only flag the snapshot as dirty; at most one refresh runs per
+# interval, so a burst of small submits costs a single recomputation.
+class StatsSnapshotRefresher(IStatsRefresher):
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        interval_seconds: float = 30.0,
+        repository_factory: Callable[[AsyncSession], IJobRepository] = SQLAlchemyJobRepository
+    ):
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.repository_factory = repository_factory
+        self._dirty = False
+        self._task: Optional[asyncio.Task] = None
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    async def refresh(self) -> bool:
+        async with self.session_factory() as session:
+            return await self.repository_factory(session).refresh_stats_snapshot()
+
+    async def refresh_if_dirty(self) -> bool:
+        if not self._dirty:
+            return False
+
+        # Cleared before refreshing so submits landing meanwhile flag it again;
+        # restored when the refresh failed or another worker held the lock
+        self._dirty = False
+        try:
+            refreshed = await self.refresh()
+        except RepositoryError as e:
+            self._dirty = True
+            logger.warning("Stats snapshot refresh failed: %s", e)
+            return False
+
+        if not refreshed:
+            self._dirty = True
+        return refreshed
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            await self.refresh_if_dirty()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -0,0 +1,244 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import Counter, OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.domain.entities.job import Job
+from app.domain.exceptions.job_exceptions import IngestQueueFullError, PartialSaveError
+from app.domain.ports.job_ingest_queue import IJobIngestQueue
+from app.domain.ports.job_repository import IJobRepository
+from app.domain.ports.stats_refresher import IStatsRefresher
+
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+# Submits only append to an in-process buffer and get a ticket back; a single
+# flusher drains the buffer into save_many batches of up to batch_size jobs,
+# as soon as a batch is full or the oldest job has waited flush_interval.
+# Hundreds of 20-job requests then cost a handful of transactions.
+class WriteBehindIngestQueue(IJobIngestQueue):
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        repository_factory: Callable[[AsyncSession], IJobRepository],
+        stats_refresher: Optional[IStatsRefresher] = None,
+        batch_size: int = 2000,
+        flush_interval: float = 0.5,
+        max_pending: int = 50000,
+        ticket_retention: int = 10000,
+        upsert: bool = False,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        if max_pending < batch_size:
+            raise ValueError("Queue capacity must hold at least one batch")
+        self.session_factory = session_factory
+        self.repository_factory = repository_factory
+        self.stats_refresher = stats_refresher
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.ticket_retention = ticket_retention
+        self.upsert = upsert
+        self._clock = clock
+        self._pending: Deque[Tuple[str, Job, float]] = deque()
+        self._tickets: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._closing = False
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def enqueue(self, jobs: List[Job]) -> Dict[str, Any]:
+        if self._closing:
+            raise IngestQueueFullError("Ingest queue is shutting down", retry_after=self.flush_interval)
+        if len(self._pending) + len(jobs) > self.max_pending:
+            # Backpressure: callers retry instead of growing the buffer unboundedly
+            raise IngestQueueFullError(
+                f"Ingest queue is full ({len(self._pending)} jobs pending)",
+                retry_after=self.flush_interval
+            )
+
+        ticket_id = uuid.uuid4().hex
+        ticket = {
+            "ticket": ticket_id,
+            "status": PENDING if jobs else COMPLETED,
+            "total": len(jobs),
+            "processed": 0,
+            "inserted": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "duplicates": 0,
+            "duplicate_ids": [],
+            "near_duplicates": [],
+            "error": None,
+            "created_at": datetime.now(timezone.utc),
+            "completed_at": None if jobs else datetime.now(timezone.utc),
+        }
+        self._tickets[ticket_id] = ticket
+        self._evict_tickets()
+
+        now = self._clock()
+        self._pending.extend((ticket_id, job, now) for job in jobs)
+        self._wakeup.set()
+        return dict(ticket)
+
+    def get_ticket(self, ticket_id: str) -> Optional[Dict[str, Any]]:
+        ticket = self._tickets.get(ticket_id)
+        return dict(ticket) if ticket is not None else None
+
+    def _evict_tickets(self) -> None:
+        # Oldest finished tickets go first; pending ones are always kept
+        excess = len(self._tickets) - self.ticket_retention
+        if excess <= 0:
+            return
+        finished = [ticket_id for ticket_id, ticket in self._tickets.items() if ticket["status"] != PENDING]
+        for ticket_id in finished[:excess]:
+            del self._tickets[ticket_id]
+
+    def _take_batch(self) -> List[Tuple[str, Job, float]]:
+        count = min(self.batch_size, len(self._pending))
+        return [self._pending.popleft() for _ in range(count)]
+
+    def _apply_result(self, batch: List[Tuple[str, Job, float]], result: Dict[str, Any]) -> None:
+        # save_many inserts an id at most once, at its first occurrence in the
+        # batch; every other occurrence is reported in duplicate_ids. In upsert
+        # mode an occurrence that rewrote a stored row is in updated_ids, one
+        # resubmitted with the same content in unchanged_ids.
+        outcomes = {
+            "updated": Counter(result.get("updated_ids", [])),
+            "unchanged": Counter(result.get("unchanged_ids", [])),
+        }
+        occurrences = Counter(job.id for _, job, _ in batch)
+        for counts in outcomes.values():
+            occurrences.subtract(counts)
+        duplicate_counts = Counter(result["duplicate_ids"])
+        inserted_by: Dict[str, str] = {}
+
+        for ticket_id, job, _ in batch:
+            ticket = self._tickets.get(ticket_id)
+            outcome = next((name for name, counts in outcomes.items() if counts[job.id]), None)
+            if outcome is not None:
+                outcomes[outcome][job.id] -= 1
+                if ticket is not None:
+                    ticket[outcome] += 1
+                continue
+            inserted = (
+                job.id not in inserted_by
+                and occurrences[job.id] > duplicate_counts[job.id]
+            )
+            if inserted:
+                inserted_by[job.id] = ticket_id
+            if ticket is None:
+                continue
+            if inserted:
+                ticket["inserted"] += 1
+            else:
+                ticket["duplicates"] += 1
+                ticket["duplicate_ids"].append(job.id)
+
+        for match in result.get("near_duplicates", []):
+            ticket = self._tickets.get(inserted_by.get(match["id"]))
+            if ticket is not None:
+                ticket["near_duplicates"].append(match)
+
+    def _complete(self, batch: List[Tuple[str, Job, float]], error: Optional[str] = None) -> None:
+        for ticket_id, _, _ in batch:
+            ticket = self._tickets.get(ticket_id)
+            if ticket is None:
+                continue
+            ticket["processed"] += 1
+            if error is not None:
+                ticket["status"] = FAILED
+                ticket["error"] = error
+            if ticket["processed"] == ticket["total"]:
+                if ticket["status"] == PENDING:
+                    ticket["status"] = COMPLETED
+                ticket["completed_at"] = datetime.now(timezone.utc)
+
+    async def flush(self) -> int:
+        batch = self._take_batch()
+        if not batch:
+            return 0
+
+        error = None
+        try:
+            async with self.session_factory() as session:
+                result = await self.repository_factory(session).save_many(
+                    [job for _, job, _ in batch],
+                    upsert=self.upsert
+                )
+        except PartialSaveError as e:
+            # Chunks committed before the failure are settled; only the tickets
+            # of the jobs after them are failed
+            result, error = e.result, str(e)
+        except Exception as e:
+            # The flusher must survive a failed batch; the tickets carry the error
+            logger.warning("Write-behind flush of %d jobs failed: %s", len(batch), e)
+            self._complete(batch, error=str(e))
+            return 0
+
+        settled = len(batch) - result.get("failed", 0)
+        if error is not None:
+            logger.warning(
+                "Write-behind flush failed after %d of %d jobs: %s", settled, len(batch), error
+            )
+        self._apply_result(batch[:settled], result)
+        self._complete(batch[:settled])
+        self._complete(batch[settled:], error=error)
+        if (result["inserted"] or result.get("updated")) and self.stats_refresher is not None:
+            self.stats_refresher.mark_dirty()
+        return result["inserted"]
+
+    async def _run(self) -> None:
+        while True:
+            if not self._pending:
+                if self._closing:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            if len(self._pending) < self.batch_size and not self._closing:
+                delay = self._pending[0][2] + self.flush_interval - self._clock()
+                if delay > 0:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._closing = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: Optional[float] = 30.0) -> None:
+        # Stop accepting jobs, then let the flusher drain what is buffered
+        self._closing = True
+        self._wakeup.set()
+        if self._task is None:
+            while self._pending:
+                await self.flush()
+            return
+
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Write-behind queue stopped with %d jobs not flushed", len(self._pending))
+        self._task = None
@@ -1,7 +1,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.infrastructure.primary.http.routes import job_routes
-from app.infrastructure.secondary.persistence.database import engine, Base
+from fastapi.responses import PlainTextResponse
+from app.infrastructure.config import get_settings
+from app.infrastructure.metrics import metrics_registry, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from app.infrastructure.primary.http.metrics_middleware import MetricsMiddleware
+from app.infrastructure.primary.http.routes import job_routes, admin_routes
+from app.infrastructure.secondary.persistence.database import init_db, pool_metrics, replica_router
+from app.infrastructure.dependencies import stats_refresher, job_cache, ingest_queue, partition_manager
 import os
 
 app = FastAPI(
@@ -13,7 +18,20 @@ app = FastAPI(
 @app.on_event("startup")
 async def startup_event():
     if os.getenv("SKIP_DB_INIT") != "true":
-        Base.metadata.create_all(bind=engine)
+        await init_db()
+    stats_refresher.start()
+    if partition_manager is not None:
+        partition_manager.start()
+    if ingest_queue is not None:
+        ingest_queue.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if ingest_queue is not None:
+        await ingest_queue.stop()
+    await stats_refresher.stop()
+    if partition_manager is not None:
+        await partition_manager.stop()
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,9 +39,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[job_routes.NEXT_CURSOR_HEADER],
 )
 
+if get_settings().metrics_enabled:
+    app.add_middleware(MetricsMiddleware, registry=metrics_registry)
+
 app.include_router(job_routes.router)
+app.include_router(admin_routes.router)
 
 @app.get("/")
 def root():
@@ -32,3 +55,15 @@ def root():
 @app.get("/health")
 def health():
     return {"status": "healthy"}
+
+@app.get("/health/cache")
+def cache_health():
+    return job_cache.stats()
+
+@app.get("/health/db")
+def db_health():
+    return {**pool_metrics.snapshot(), "replicas": replica_router.status()}
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics():
+    return PlainTextResponse(metrics_registry.render(), media_type=METRICS_CONTENT_TYPE)
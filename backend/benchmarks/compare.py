@@ -0,0 +1,75 @@
+"""Compare two benchmark result files.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json --threshold 10
+
+Exits with status 1 when a latency metric regressed by more than the
+threshold (in percent), so the script can gate a CI job.
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, Iterator, Tuple
+
+
+LATENCY_KEYS = ("p50_ms", "p95_ms", "p99_ms")
+THROUGHPUT_KEYS = ("rows_per_s", "requests_per_s")
+
+
+def flatten(node: Any, prefix: str = "") -> Iterator[Tuple[str, float]]:
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from flatten(value, f"{prefix}.{key}" if prefix else key)
+    elif isinstance(node, (int, float)) and not isinstance(node, bool):
+        yield prefix, float(node)
+
+
+def compare(baseline: Dict[str, Any], candidate: Dict[str, Any], threshold: float):
+    base_metrics = dict(flatten(baseline.get("scales", {})))
+    rows = []
+    regressions = 0
+
+    for path, new_value in flatten(candidate.get("scales", {})):
+        metric = path.rsplit(".", 1)[-1]
+        if metric not in LATENCY_KEYS + THROUGHPUT_KEYS or path not in base_metrics:
+            continue
+
+        old_value = base_metrics[path]
+        if not old_value:
+            continue
+
+        change = (new_value - old_value) / old_value * 100
+        # Higher latency is worse, lower throughput is worse
+        worse = change if metric in LATENCY_KEYS else -change
+        regressed = worse > threshold
+        regressions += regressed
+        rows.append((path, old_value, new_value, change, regressed))
+
+    return rows, regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Allowed regression in percent before failing")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        baseline = json.load(handle)
+    with open(args.candidate, encoding="utf-8") as handle:
+        candidate = json.load(handle)
+
+    rows, regressions = compare(baseline, candidate, args.threshold)
+
+    print(f"baseline {baseline['meta']['git_commit']} -> candidate {candidate['meta']['git_commit']}")
+    for path, old_value, new_value, change, regressed in rows:
+        marker = "REGRESSION" if regressed else ""
+        print(f"{path:<60} {old_value:>12.3f} {new_value:>12.3f} {change:>+8.1f}% {marker}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List
+
+from app.domain.entities.job import Job
+
+
+COMPANIES = [
+    "Google", "Microsoft", "Amazon", "Datadog", "Doctolib", "BlaBlaCar", "Criteo",
+    "Ubisoft", "Capgemini", "Thales", "Airbus", "Decathlon", "Qonto", "Alan", "Mirakl",
+]
+LOCATIONS = [
+    "Paris, France", "Lyon, France", "Nantes, France", "Bordeaux, France", "Lille, France",
+    "Toulouse, France", "Berlin, Germany", "London, United Kingdom", "Remote", "Amsterdam, Netherlands",
+]
+TITLES = [
+    "Backend Engineer", "Python Developer", "Data Engineer", "Frontend Developer",
+    "DevOps Engineer", "Machine Learning Engineer", "Product Manager", "QA Engineer",
+    "Site Reliability Engineer", "Full Stack Developer",
+]
+SKILLS = [
+    "python", "fastapi", "postgresql", "kubernetes", "react", "typescript", "airflow",
+    "spark", "terraform", "aws", "gcp", "django", "kafka", "redis", "docker",
+]
+SOURCES = ["linkedin"] * 8 + ["indeed", "welcometothejungle"]
+
+
+class JobFactory:
+    # Deterministic synthetic postings: the same seed always yields the same table
+    def __init__(self, seed: int = 42):
+        self.random = random.Random(seed)
+        self.base_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def _description(self) -> str:
+        skills = self.random.sample(SKILLS, 5)
+        sentences = [
+            f"We are looking for someone fluent in {skills[0]} and {skills[1]}.",
+            f"You will build services with {skills[2]} running on {skills[3]}.",
+            f"Experience with {skills[4]} is a plus.",
+        ]
+        return " ".join(sentences * self.random.randint(3, 12))
+
+    def build(self, index: int, prefix: str = "bench") -> Job:
+        company = self.random.choice(COMPANIES)
+        return Job(
+            id=f"{prefix}-{index}",
+            title=f"{self.random.choice(['Senior ', 'Junior ', ''])}{self.random.choice(TITLES)}",
+            company=company,
+            location=self.random.choice(LOCATIONS),
+            url=f"https://example.com/{prefix}/{index}",
+            source=self.random.choice(SOURCES),
+            posted_date=f"{self.random.randint(1, 30)} days ago",
+            description=self._description(),
+            scraped_at=self.base_time + timedelta(minutes=index),
+            created_at=self.base_time + timedelta(minutes=index),
+        )
+
+    def batches(self, count: int, batch_size: int, start: int = 0, prefix: str = "bench") -> Iterator[List[Job]]:
+        for batch_start in range(start, start + count, batch_size):
+            batch_end = min(batch_start + batch_size, start + count)
+            yield [self.build(i, prefix) for i in range(batch_start, batch_end)]
@@ -0,0 +1,265 @@
+"""Benchmark the repository and API hot paths against a disposable database.
+
+Usage:
+    python -m benchmarks.run --rows 10000 100000 --output results.json
+
+The target database is dropped and recreated for every scale: never point
+BENCH_DATABASE_URL at a database holding real data.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+
+DEFAULT_BENCH_DATABASE_URL = "postgresql+asyncpg://offeruser:offerpass@db:5432/offer_search_test"
+
+SEARCH_SCENARIOS = {
+    "no_filter": {},
+    "search_term": {"search_term": "python"},
+    "location": {"location": "Paris"},
+    "company": {"company": "Datadog"},
+    "source": {"source": "indeed"},
+    "term_location_company": {"search_term": "engineer", "location": "Lyon", "company": "Doctolib"},
+}
+
+
+def _configure_environment(database_url: str) -> None:
+    # Must run before any app module is imported: settings are read at import time
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["SKIP_DB_INIT"] = "1"
+    os.environ["CACHE_ENABLED"] = "false"
+    os.environ.setdefault("STATS_REFRESH_INTERVAL", "0")
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def _reset_schema(engine) -> None:
+    from app.infrastructure.secondary.persistence.database import Base
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def bench_save_many(session_factory, rows: int, batch_size: int) -> Dict[str, Any]:
+    from app.infrastructure.secondary.persistence.sqlalchemy_job_repository import SQLAlchemyJobRepository
+    from benchmarks.datasets import JobFactory
+    from benchmarks.timing import summarize
+
+    factory = JobFactory()
+    batch_samples = []
+    started = time.perf_counter()
+
+    for batch in factory.batches(rows, batch_size):
+        async with session_factory() as session:
+            repository = SQLAlchemyJobRepository(session)
+            batch_started = time.perf_counter()
+            await repository.save_many(batch)
+            batch_samples.append(time.perf_counter() - batch_started)
+
+    elapsed = time.perf_counter() - started
+    return {
+        "rows": rows,
+        "batch_size": batch_size,
+        "elapsed_s": round(elapsed, 3),
+        "rows_per_s": round(rows / elapsed, 1) if elapsed else 0.0,
+        "batch_latency": summarize(batch_samples),
+    }
+
+
+async def bench_search(session_factory, iterations: int) -> Dict[str, Any]:
+    from app.infrastructure.secondary.persistence.sqlalchemy_job_repository import SQLAlchemyJobRepository
+    from benchmarks.timing import measure
+
+    results = {}
+    async with session_factory() as session:
+        repository = SQLAlchemyJobRepository(session)
+
+        for name, filters in SEARCH_SCENARIOS.items():
+            results[name] = await measure(lambda: repository.search(**filters, limit=50), iterations)
+
+        results["fulltext"] = await measure(
+            lambda: repository.search_fulltext("python kubernetes", limit=50), iterations
+        )
+
+        # Deep pages: OFFSET scans everything it skips, the keyset cursor does not
+        deep_offset = 5000
+        results["deep_offset"] = await measure(
+            lambda: repository.search(limit=50, offset=deep_offset), iterations
+        )
+        skipped = await repository.search(limit=1, offset=deep_offset - 1)
+        if skipped:
+            after = (skipped[0].created_at, skipped[0].id)
+            results["deep_cursor"] = await measure(
+                lambda: repository.search(limit=50, after=after), iterations
+            )
+
+    return results
+
+
+async def bench_stats(session_factory, iterations: int) -> Dict[str, Any]:
+    from app.infrastructure.secondary.persistence.sqlalchemy_job_repository import SQLAlchemyJobRepository
+    from benchmarks.timing import measure
+
+    async with session_factory() as session:
+        repository = SQLAlchemyJobRepository(session)
+        refresh_started = time.perf_counter()
+        await repository.refresh_stats_snapshot()
+        refresh_ms = (time.perf_counter() - refresh_started) * 1000
+
+        return {
+            "live": await measure(repository.get_stats, iterations),
+            "snapshot": await measure(repository.get_stats_snapshot, iterations),
+            "refresh_ms": round(refresh_ms, 3),
+        }
+
+
+async def bench_serialization(page_size: int, iterations: int) -> Dict[str, Any]:
+    # Search response encoding alone, without the database: the DTO path with
+    # response_model validation versus rows encoded straight to JSON bytes
+    import dataclasses
+    from pydantic import TypeAdapter
+    from app.application.dto.job_dto import JobResponseDTO
+    from app.infrastructure.primary.http.json_encoding import rows_response
+    from app.infrastructure.primary.http.routes.job_routes import _job_to_response_dto
+    from benchmarks.datasets import JobFactory
+    from benchmarks.timing import measure
+
+    jobs = [JobFactory().build(i) for i in range(page_size)]
+    rows = [dataclasses.asdict(job) for job in jobs]
+    adapter = TypeAdapter(List[JobResponseDTO])
+
+    async def dto_path():
+        dtos = [_job_to_response_dto(job) for job in jobs]
+        content = adapter.dump_python(adapter.validate_python(dtos), mode="json")
+        json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    async def fast_path():
+        rows_response(rows)
+
+    return {
+        "page_size": page_size,
+        "dto_validated": await measure(dto_path, iterations),
+        "rows_fast_path": await measure(fast_path, iterations),
+    }
+
+
+async def bench_http(requests: int, concurrency: int) -> Dict[str, Any]:
+    import httpx
+    from app.main import app
+    from benchmarks.timing import summarize
+
+    calls = {
+        "search": ("POST", "/api/jobs/search", {"json": {"search": "python", "limit": 50}}),
+        "stats": ("GET", "/api/jobs/stats", {}),
+    }
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, (method, path, kwargs) in calls.items():
+            semaphore = asyncio.Semaphore(concurrency)
+            samples: List[float] = []
+            errors = 0
+
+            async def call():
+                nonlocal errors
+                async with semaphore:
+                    call_started = time.perf_counter()
+                    response = await client.request(method, path, **kwargs)
+                    samples.append(time.perf_counter() - call_started)
+                    if response.status_code != 200:
+                        errors += 1
+
+            started = time.perf_counter()
+            await asyncio.gather(*(call() for _ in range(requests)))
+            elapsed = time.perf_counter() - started
+
+            results[name] = {
+                **summarize(samples),
+                "concurrency": concurrency,
+                "errors": errors,
+                "requests_per_s": round(requests / elapsed, 1) if elapsed else 0.0,
+            }
+
+    return results
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.infrastructure.secondary.persistence.database import AsyncSessionLocal, async_engine
+
+    report: Dict[str, Any] = {
+        "meta": {
+            "git_commit": _git_commit(),
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "iterations": args.iterations,
+            "batch_size": args.batch_size,
+            "http_requests": args.http_requests,
+            "http_concurrency": args.concurrency,
+        },
+        "scales": {},
+    }
+
+    try:
+        for rows in args.rows:
+            print(f"[bench] {rows} rows: seeding", file=sys.stderr)
+            await _reset_schema(async_engine)
+            scale = {"save_many": await bench_save_many(AsyncSessionLocal, rows, args.batch_size)}
+
+            print(f"[bench] {rows} rows: search / stats / http", file=sys.stderr)
+            scale["search"] = await bench_search(AsyncSessionLocal, args.iterations)
+            scale["stats"] = await bench_stats(AsyncSessionLocal, args.iterations)
+            scale["http"] = await bench_http(args.http_requests, args.concurrency)
+            scale["serialization"] = await bench_serialization(args.page_size, args.iterations)
+            report["scales"][str(rows)] = scale
+    finally:
+        await async_engine.dispose()
+
+    return report
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Offer Search performance benchmarks")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000],
+                        help="Dataset sizes to benchmark (e.g. 10000 100000 1000000)")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL", DEFAULT_BENCH_DATABASE_URL),
+                        help="Disposable database, dropped and recreated for every scale")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--http-requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--page-size", type=int, default=1000,
+                        help="Search page size for the response serialization benchmark")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+    _configure_environment(args.database_url)
+
+    report = asyncio.run(run(args))
+
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"[bench] results written to {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(samples_seconds: List[float]) -> Dict[str, Any]:
+    samples_ms = [sample * 1000 for sample in samples_seconds]
+    return {
+        "iterations": len(samples_ms),
+        "mean_ms": round(statistics.fmean(samples_ms), 3) if samples_ms else 0.0,
+        "p50_ms": round(percentile(samples_ms, 50), 3),
+        "p95_ms": round(percentile(samples_ms, 95), 3),
+        "p99_ms": round(percentile(samples_ms, 99), 3),
+        "max_ms": round(max(samples_ms), 3) if samples_ms else 0.0,
+    }
+
+
+async def measure(
+    operation: Callable[[], Awaitable[Any]],
+    iterations: int,
+    warmup: int = 3
+) -> Dict[str, Any]:
+    for _ in range(warmup):
+        await operation()
+
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await operation()
+        samples.append(time.perf_counter() - started)
+
+    return summarize(samples)
@@ -1,9 +1,22 @@
+import asyncio
+import random
+
 import pytest
+from datetime import datetime, timedelta, timezone
 from typing import List
 
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
 from app.domain.entities.job import Job
 from app.domain.exceptions.job_exceptions import JobNotFoundError
 from app.domain.ports.job_repository import IJobRepository
+from app.domain.services.content_hash import job_content_hash
+from app.domain.services.job_validation import validate_job_records
+from app.infrastructure.secondary.persistence.bulk_loader import CopyJobBulkLoader
+from app.infrastructure.secondary.persistence.models.job_key_model import JobKeyModel
+from app.infrastructure.secondary.persistence.models.job_model import JobModel, PARTITIONED
+from app.infrastructure.secondary.persistence.sqlalchemy_job_repository import SQLAlchemyJobRepository
 
 
 @pytest.mark.integration
@@ -38,6 +51,123 @@ class TestSQLAlchemyJobRepositorySave:
         assert result["duplicates"] == 2
         assert valid_job.id in result["duplicate_ids"]
 
+    async def test_save_many_counts_repeated_ids_within_batch(
+        self, job_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        result = await job_repository.save_many(multiple_jobs + [multiple_jobs[0]])
+
+        assert result["inserted"] == 3
+        assert result["duplicates"] == 1
+        assert result["duplicate_ids"] == [multiple_jobs[0].id]
+        assert result["total"] == 4
+
+    async def test_save_many_treats_url_conflict_as_duplicate(
+        self, job_repository: IJobRepository, valid_job: Job
+    ):
+        await job_repository.save(valid_job)
+
+        same_url = Job(
+            id="job-reposted",
+            title=valid_job.title,
+            company=valid_job.company,
+            location=valid_job.location,
+            url=valid_job.url,
+            source=valid_job.source,
+        )
+        result = await job_repository.save_many([same_url])
+
+        assert result["inserted"] == 0
+        assert result["duplicate_ids"] == ["job-reposted"]
+
+    async def test_save_many_splits_into_batches(self, async_session, multiple_jobs: List[Job]):
+        repository = SQLAlchemyJobRepository(async_session, batch_size=2)
+        await repository.save(multiple_jobs[2])
+
+        result = await repository.save_many(multiple_jobs)
+
+        assert result["inserted"] == 2
+        assert result["duplicate_ids"] == [multiple_jobs[2].id]
+        assert await repository.count_total() == 3
+
+    async def test_save_many_applies_server_default_timestamps(
+        self, job_repository: IJobRepository, minimal_job: Job
+    ):
+        await job_repository.save_many([minimal_job])
+
+        saved = await job_repository.find_by_id(minimal_job.id)
+
+        assert saved.scraped_at is not None
+        assert saved.created_at is not None
+
+    async def test_save_many_upsert_rewrites_only_changed_jobs(
+        self, job_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        await job_repository.save_many(multiple_jobs)
+
+        multiple_jobs[0].title = "Senior Engineer"
+        result = await job_repository.save_many(multiple_jobs, upsert=True)
+
+        assert result["inserted"] == 0
+        assert result["updated"] == 1
+        assert result["updated_ids"] == [multiple_jobs[0].id]
+        assert result["unchanged_ids"] == [multiple_jobs[1].id, multiple_jobs[2].id]
+        assert result["duplicate_ids"] == []
+        saved = await job_repository.find_by_id(multiple_jobs[0].id)
+        assert saved.title == "Senior Engineer"
+
+    async def test_save_many_upsert_reports_inserted_updated_and_unchanged(
+        self, job_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        await job_repository.save_many(multiple_jobs[:2])
+
+        multiple_jobs[0].title = "Senior Engineer"
+        result = await job_repository.save_many(multiple_jobs, upsert=True)
+
+        assert result["inserted"] == 1
+        assert result["updated"] == 1
+        assert result["unchanged"] == 1
+        assert result["updated_ids"] == [multiple_jobs[0].id]
+        assert result["unchanged_ids"] == [multiple_jobs[1].id]
+        assert result["duplicates"] == 0
+
+    async def test_save_many_without_upsert_keeps_stored_content(
+        self, job_repository: IJobRepository, valid_job: Job
+    ):
+        await job_repository.save_many([valid_job])
+
+        valid_job.title = "Changed Title"
+        result = await job_repository.save_many([valid_job])
+
+        assert result["updated"] == 0
+        assert result["duplicate_ids"] == [valid_job.id]
+        assert (await job_repository.find_by_id(valid_job.id)).title != "Changed Title"
+
+    async def test_save_many_upsert_skips_only_url_conflicts(
+        self, job_repository: IJobRepository, valid_job: Job, multiple_jobs: List[Job]
+    ):
+        await job_repository.save(valid_job)
+
+        same_url = Job(
+            id="job-reposted",
+            title=valid_job.title,
+            company=valid_job.company,
+            location=valid_job.location,
+            url=valid_job.url,
+            source=valid_job.source,
+        )
+        result = await job_repository.save_many([multiple_jobs[0], same_url, multiple_jobs[1]], upsert=True)
+
+        assert result["inserted"] == 2
+        assert result["duplicate_ids"] == ["job-reposted"]
+        assert await job_repository.count_total() == 3
+
+    async def test_find_content_hashes(self, job_repository: IJobRepository, valid_job: Job):
+        await job_repository.save_many([valid_job])
+
+        hashes = await job_repository.find_content_hashes([valid_job.id, "unknown"])
+
+        assert hashes == {valid_job.id: job_content_hash(valid_job)}
+
     async def test_save_updates_existing_job(self, job_repository: IJobRepository, valid_job: Job):
         await job_repository.save(valid_job)
 
@@ -46,6 +176,19 @@ class TestSQLAlchemyJobRepositorySave:
 
         assert updated_job.title == "Updated Title"
 
+    async def test_update_without_scraped_at_keeps_the_stored_one(
+        self, job_repository: IJobRepository, valid_job: Job
+    ):
+        await job_repository.save(valid_job)
+        stored = await job_repository.find_by_id(valid_job.id)
+
+        valid_job.title = "Updated Title"
+        valid_job.scraped_at = None
+        updated_job = await job_repository.update(valid_job)
+
+        assert updated_job.title == "Updated Title"
+        assert updated_job.scraped_at == stored.scraped_at
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -85,6 +228,18 @@ class TestSQLAlchemyJobRepositoryFind:
 
         assert exists is False
 
+    async def test_find_existing_ids_returns_known_subset(
+        self, job_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        await job_repository.save_many(multiple_jobs)
+
+        existing = await job_repository.find_existing_ids(["job-1", "job-3", "nonexistent"])
+
+        assert existing == {"job-1", "job-3"}
+
+    async def test_find_existing_ids_with_no_ids(self, job_repository: IJobRepository):
+        assert await job_repository.find_existing_ids([]) == set()
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -168,6 +323,98 @@ class TestSQLAlchemyJobRepositorySearch:
         assert len(results) == 2
 
 
+    async def test_search_rows_returns_same_page_as_search(
+        self, job_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        await job_repository.save_many(multiple_jobs)
+
+        jobs = await job_repository.search(limit=2)
+        rows = await job_repository.search_rows(limit=2)
+
+        assert [row["id"] for row in rows] == [job.id for job in jobs]
+        assert rows[0]["title"] == jobs[0].title
+        assert rows[0]["created_at"] == jobs[0].created_at
+
+
+    async def test_search_rows_selects_only_requested_fields(
+        self, job_repository: IJobRepository, valid_job: Job
+    ):
+        await job_repository.save(valid_job)
+
+        rows = await job_repository.search_rows(fields=["id", "title"])
+
+        assert rows == [{"id": valid_job.id, "title": valid_job.title}]
+
+    async def test_search_without_description_defers_it(
+        self, job_repository: IJobRepository, valid_job: Job
+    ):
+        await job_repository.save(valid_job)
+
+        jobs = await job_repository.search(include_description=False)
+
+        assert jobs[0].id == valid_job.id
+        assert jobs[0].description is None
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLAlchemyJobRepositoryKeysetPagination:
+
+    @pytest.fixture
+    def timeline_jobs(self) -> List[Job]:
+        base = datetime(2025, 12, 1, tzinfo=timezone.utc)
+        return [
+            Job(
+                id=f"page-{i:02d}",
+                title=f"Job {i}",
+                company="Company",
+                location="Location",
+                url=f"https://example.com/page/{i}",
+                source="linkedin",
+                # Two jobs share each timestamp so the id tie-breaker matters
+                created_at=base + timedelta(hours=i // 2),
+            )
+            for i in range(7)
+        ]
+
+    async def test_search_orders_newest_first(
+        self, job_repository: IJobRepository, timeline_jobs: List[Job]
+    ):
+        await job_repository.save_many(timeline_jobs)
+
+        results = await job_repository.search()
+
+        assert [job.id for job in results] == [f"page-{i:02d}" for i in reversed(range(7))]
+
+    async def test_keyset_pages_cover_all_rows_without_overlap(
+        self, job_repository: IJobRepository, timeline_jobs: List[Job]
+    ):
+        await job_repository.save_many(timeline_jobs)
+
+        seen = []
+        after = None
+        while True:
+            page = await job_repository.search(limit=3, after=after)
+            if not page:
+                break
+            seen.extend(job.id for job in page)
+            after = (page[-1].created_at, page[-1].id)
+
+        assert seen == [f"page-{i:02d}" for i in reversed(range(7))]
+
+    async def test_keyset_respects_filters(
+        self, job_repository: IJobRepository, timeline_jobs: List[Job]
+    ):
+        await job_repository.save_many(timeline_jobs)
+        newest = timeline_jobs[-1]
+
+        results = await job_repository.search(
+            search_term="Job 1", after=(newest.created_at, newest.id)
+        )
+
+        assert [job.id for job in results] == ["page-01"]
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 class TestSQLAlchemyJobRepositoryDelete:
@@ -188,6 +435,120 @@ class TestSQLAlchemyJobRepositoryDelete:
         assert result is False
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLAlchemyJobRepositoryBulkOperations:
+
+    @pytest.fixture
+    def chunked_repository(self, async_session) -> IJobRepository:
+        # Small chunks so every operation spans several statements
+        return SQLAlchemyJobRepository(async_session, batch_size=2)
+
+    async def test_delete_many_counts_deleted_rows(
+        self, chunked_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        await chunked_repository.save_many(multiple_jobs)
+
+        deleted = await chunked_repository.delete_many(["job-1", "job-2", "job-2", "nonexistent"])
+
+        assert deleted == 2
+        assert await chunked_repository.count_total() == 1
+
+    async def test_delete_where_removes_matching_jobs_in_chunks(
+        self, chunked_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        old = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for job in multiple_jobs:
+            job.scraped_at = old
+        fresh = Job(
+            id="job-fresh",
+            title="Fresh",
+            company="Company",
+            location="Location",
+            url="https://example.com/job/fresh",
+            source="linkedin",
+            scraped_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+        await chunked_repository.save_many(multiple_jobs + [fresh])
+
+        deleted = await chunked_repository.delete_where(scraped_before=datetime(2025, 6, 1, tzinfo=timezone.utc))
+
+        assert deleted == 3
+        assert [job.id for job in await chunked_repository.search()] == ["job-fresh"]
+
+    async def test_delete_where_matches_company_exactly(
+        self, job_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        await job_repository.save_many(multiple_jobs)
+
+        assert await job_repository.delete_where(company="%") == 0
+        assert await job_repository.delete_where(company="_ompany 1") == 0
+        assert await job_repository.delete_where(company="Company") == 0
+        assert await job_repository.delete_where(company="company 2") == 1
+        assert sorted(job.id for job in await job_repository.search()) == ["job-1", "job-3"]
+
+    async def test_delete_where_requires_criteria(self, job_repository: IJobRepository):
+        with pytest.raises(ValueError):
+            await job_repository.delete_where()
+
+    async def test_deleting_canonical_job_releases_its_duplicates(
+        self, job_repository: IJobRepository, valid_job: Job
+    ):
+        repost = Job(
+            id="job-reposted",
+            title=valid_job.title,
+            company=valid_job.company,
+            location=valid_job.location,
+            url=f"{valid_job.url}?trk=public_jobs_topcard",
+            source=valid_job.source,
+            description=valid_job.description,
+        )
+        await job_repository.save_many([valid_job, repost])
+
+        await job_repository.delete_many([valid_job.id])
+
+        collapsed = await job_repository.search(collapse_duplicates=True)
+        assert [job.id for job in collapsed] == ["job-reposted"]
+
+    async def test_deleting_canonical_job_promotes_one_survivor(
+        self, job_repository: IJobRepository, valid_job: Job
+    ):
+        reposts = [
+            Job(
+                id=f"job-reposted-{i}",
+                title=valid_job.title,
+                company=valid_job.company,
+                location=valid_job.location,
+                url=f"{valid_job.url}?trk={i}",
+                source=valid_job.source,
+                description=valid_job.description,
+            )
+            for i in range(1, 4)
+        ]
+        await job_repository.save_many([valid_job] + reposts)
+
+        await job_repository.delete_many([valid_job.id])
+
+        collapsed = await job_repository.search(collapse_duplicates=True)
+        assert [job.id for job in collapsed] == ["job-reposted-1"]
+        for repost in reposts[1:]:
+            assert (await job_repository.find_by_id(repost.id)).duplicate_of == "job-reposted-1"
+
+    async def test_update_many_rewrites_jobs(
+        self, chunked_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        await chunked_repository.save_many(multiple_jobs)
+        for job in multiple_jobs:
+            job.title = f"{job.title} (updated)"
+
+        updated = await chunked_repository.update_many(multiple_jobs)
+
+        assert updated == 3
+        stored = await chunked_repository.find_by_id("job-3")
+        assert stored.title == "Job Title 3 (updated)"
+        assert stored.updated_at is not None
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 class TestSQLAlchemyJobRepositoryCount:
@@ -233,3 +594,518 @@ class TestSQLAlchemyJobRepositoryCount:
         count = await job_repository.count_total()
 
         assert count == 0
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLAlchemyJobRepositoryFullTextSearch:
+
+    @pytest.fixture
+    def searchable_jobs(self) -> List[Job]:
+        return [
+            Job(
+                id="fts-title",
+                title="Python Backend Engineer",
+                company="Acme",
+                location="Paris",
+                url="https://example.com/fts/1",
+                source="linkedin",
+                description="Build APIs with FastAPI.",
+            ),
+            Job(
+                id="fts-description",
+                title="Data Engineer",
+                company="Globex",
+                location="Lyon",
+                url="https://example.com/fts/2",
+                source="linkedin",
+                description="Pipelines written in Python and SQL.",
+            ),
+            Job(
+                id="fts-other",
+                title="Java Developer",
+                company="Initech",
+                location="Paris",
+                url="https://example.com/fts/3",
+                source="indeed",
+                description="Spring Boot services.",
+            ),
+        ]
+
+    async def test_fulltext_matches_words_in_any_weighted_column(
+        self, job_repository: IJobRepository, searchable_jobs: List[Job]
+    ):
+        await job_repository.save_many(searchable_jobs)
+
+        hits = await job_repository.search_fulltext("python")
+
+        assert {hit.job.id for hit in hits} == {"fts-title", "fts-description"}
+
+    async def test_fulltext_ranks_title_matches_first(
+        self, job_repository: IJobRepository, searchable_jobs: List[Job]
+    ):
+        await job_repository.save_many(searchable_jobs)
+
+        hits = await job_repository.search_fulltext("python")
+
+        assert hits[0].job.id == "fts-title"
+        assert hits[0].rank >= hits[1].rank
+
+    async def test_fulltext_supports_websearch_syntax(
+        self, job_repository: IJobRepository, searchable_jobs: List[Job]
+    ):
+        await job_repository.save_many(searchable_jobs)
+
+        hits = await job_repository.search_fulltext("python -fastapi")
+
+        assert [hit.job.id for hit in hits] == ["fts-description"]
+
+    async def test_fulltext_returns_highlighted_snippet(
+        self, job_repository: IJobRepository, searchable_jobs: List[Job]
+    ):
+        await job_repository.save_many(searchable_jobs)
+
+        hits = await job_repository.search_fulltext("pipelines")
+
+        assert "<mark>Pipelines</mark>" in hits[0].snippet
+
+    async def test_fulltext_combines_with_filters(
+        self, job_repository: IJobRepository, searchable_jobs: List[Job]
+    ):
+        await job_repository.save_many(searchable_jobs)
+
+        hits = await job_repository.search_fulltext("python", location="Lyon")
+
+        assert [hit.job.id for hit in hits] == ["fts-description"]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLAlchemyJobRepositoryTrigram:
+
+    @pytest.fixture
+    def company_jobs(self) -> List[Job]:
+        return [
+            Job(
+                id=f"trgm-{i}",
+                title="Developer",
+                company=company,
+                location=location,
+                url=f"https://example.com/trgm/{i}",
+                source="linkedin",
+            )
+            for i, (company, location) in enumerate([
+                ("Google", "Paris, France"),
+                ("Google", "Zurich, Switzerland"),
+                ("Globex", "Lyon, France"),
+                ("Microsoft", "Dublin, Ireland"),
+            ])
+        ]
+
+    async def test_suggest_companies_corrects_typo(
+        self, job_repository: IJobRepository, company_jobs: List[Job]
+    ):
+        await job_repository.save_many(company_jobs)
+
+        suggestions = await job_repository.suggest_companies("Gogle")
+
+        assert suggestions[0][0] == "Google"
+        assert 0 < suggestions[0][1] <= 1
+
+    async def test_suggest_companies_groups_duplicates(
+        self, job_repository: IJobRepository, company_jobs: List[Job]
+    ):
+        await job_repository.save_many(company_jobs)
+
+        suggestions = await job_repository.suggest_companies("Google")
+
+        assert [company for company, _ in suggestions].count("Google") == 1
+
+    async def test_suggest_companies_returns_empty_when_nothing_close(
+        self, job_repository: IJobRepository, company_jobs: List[Job]
+    ):
+        await job_repository.save_many(company_jobs)
+
+        suggestions = await job_repository.suggest_companies("Zzyzx")
+
+        assert suggestions == []
+
+    async def test_location_substring_filter_still_matches_mid_string(
+        self, job_repository: IJobRepository, company_jobs: List[Job]
+    ):
+        await job_repository.save_many(company_jobs)
+
+        results = await job_repository.search(location="france")
+
+        assert {job.id for job in results} == {"trgm-0", "trgm-2"}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLAlchemyJobRepositoryStats:
+
+    @pytest.fixture
+    def stats_jobs(self, multiple_jobs: List[Job]) -> List[Job]:
+        return multiple_jobs + [
+            Job(
+                id="stats-indeed",
+                title="Indeed Job",
+                company="Company 1",
+                location="Location 1",
+                url="https://indeed.com/job/stats",
+                source="indeed",
+            )
+        ]
+
+    async def test_get_stats_computes_everything_in_one_query(
+        self, job_repository: IJobRepository, stats_jobs: List[Job]
+    ):
+        await job_repository.save_many(stats_jobs)
+
+        stats = await job_repository.get_stats()
+
+        assert stats["total_jobs"] == 4
+        assert stats["total_companies"] == 3
+        assert stats["total_locations"] == 3
+        assert stats["jobs_by_source"] == {"linkedin": 3, "indeed": 1}
+        assert stats["refreshed_at"] is not None
+
+    async def test_get_stats_on_empty_table(self, job_repository: IJobRepository):
+        stats = await job_repository.get_stats()
+
+        assert stats["total_jobs"] == 0
+        assert stats["jobs_by_source"] == {}
+
+    async def test_snapshot_reflects_data_after_refresh(
+        self, job_repository: IJobRepository, stats_jobs: List[Job]
+    ):
+        await job_repository.save_many(stats_jobs)
+
+        refreshed = await job_repository.refresh_stats_snapshot()
+        snapshot = await job_repository.get_stats_snapshot()
+
+        assert refreshed is True
+        assert snapshot["total_jobs"] == 4
+        assert snapshot["jobs_by_source"] == {"linkedin": 3, "indeed": 1}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLAlchemyJobRepositoryFacets:
+
+    @pytest.fixture
+    async def faceted_jobs(self, job_repository: IJobRepository) -> None:
+        companies = ["Acme", "Acme", "Acme", "Globex", "Globex", "Initech"]
+        await job_repository.save_many([
+            Job(
+                id=f"job-{i}",
+                title=f"Python Developer {i}",
+                company=company,
+                location="Paris" if i % 2 else "Lyon",
+                url=f"https://example.com/job/{i}",
+                source="indeed" if company == "Initech" else "linkedin",
+            )
+            for i, company in enumerate(companies)
+        ])
+
+    async def test_counts_every_facet_for_the_filter(self, job_repository: IJobRepository, faceted_jobs):
+        result = await job_repository.search_facets(search_term="python")
+
+        assert result["total"] == 6
+        assert result["facets"]["company"] == [
+            {"value": "Acme", "count": 3},
+            {"value": "Globex", "count": 2},
+            {"value": "Initech", "count": 1},
+        ]
+        assert result["facets"]["source"] == [
+            {"value": "linkedin", "count": 5},
+            {"value": "indeed", "count": 1},
+        ]
+        assert sum(entry["count"] for entry in result["facets"]["location"]) == 6
+
+    async def test_keeps_top_values_per_facet(self, job_repository: IJobRepository, faceted_jobs):
+        result = await job_repository.search_facets(facets=["company"], limit=2)
+
+        assert [entry["value"] for entry in result["facets"]["company"]] == ["Acme", "Globex"]
+        assert result["total"] == 6
+
+    async def test_applies_filters(self, job_repository: IJobRepository, faceted_jobs):
+        result = await job_repository.search_facets(source="indeed", facets=["company"])
+
+        assert result == {"total": 1, "facets": {"company": [{"value": "Initech", "count": 1}]}}
+
+    async def test_empty_match_reports_zero(self, job_repository: IJobRepository):
+        result = await job_repository.search_facets(search_term="cobol", facets=["source"])
+
+        assert result == {"total": 0, "facets": {"source": []}}
+
+    async def test_page_and_facets_in_one_statement(self, job_repository: IJobRepository, faceted_jobs):
+        rows, summary = await job_repository.search_rows_with_facets(
+            search_term="python", limit=2, fields=["id", "company"], facets=["company"], facet_limit=2
+        )
+
+        assert rows == await job_repository.search_rows(search_term="python", limit=2, fields=["id", "company"])
+        assert summary == await job_repository.search_facets(search_term="python", facets=["company"], limit=2)
+
+    async def test_page_past_the_end_still_has_facets(self, job_repository: IJobRepository, faceted_jobs):
+        rows, summary = await job_repository.search_rows_with_facets(offset=10, facets=["source"])
+
+        assert rows == []
+        assert summary["total"] == 6
+
+    async def test_fulltext_hits_and_facets_in_one_statement(self, job_repository: IJobRepository, faceted_jobs):
+        hits, summary = await job_repository.search_fulltext_with_facets(
+            "python", source="indeed", facets=["company"]
+        )
+
+        assert [hit.job.id for hit in hits] == [hit.job.id for hit in await job_repository.search_fulltext("python", source="indeed")]
+        assert summary == {"total": 1, "facets": {"company": [{"value": "Initech", "count": 1}]}}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLAlchemyJobRepositoryExport:
+
+    async def test_export_streams_all_rows_in_chunks(
+        self, job_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        await job_repository.save_many(multiple_jobs)
+
+        batches = [rows async for rows in job_repository.export_rows(chunk_size=2)]
+
+        assert [len(rows) for rows in batches] == [2, 1]
+        assert {row["id"] for rows in batches for row in rows} == {"job-1", "job-2", "job-3"}
+        assert "search_vector" not in batches[0][0]
+
+    async def test_export_applies_filters(
+        self, job_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        await job_repository.save_many(multiple_jobs)
+
+        batches = [rows async for rows in job_repository.export_rows(company="Company 2")]
+
+        assert [row["id"] for rows in batches for row in rows] == ["job-2"]
+
+    async def test_export_key_ranges_are_disjoint_and_complete(
+        self, job_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        await job_repository.save_many(multiple_jobs)
+
+        boundaries = await job_repository.export_boundaries(2)
+        edges = [None, *boundaries, None]
+        ranges = [
+            [row["id"] async for rows in job_repository.export_rows(key_range=key_range) for row in rows]
+            for key_range in zip(edges, edges[1:])
+        ]
+
+        assert len(boundaries) == 1
+        assert [len(ids) for ids in ranges] == [2, 1]
+        assert sorted(ranges[0] + ranges[1]) == ["job-1", "job-2", "job-3"]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLAlchemyJobRepositoryMaintenance:
+
+    async def test_backfill_fingerprints_fills_missing_columns(
+        self, async_session, job_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        await job_repository.save_many(multiple_jobs)
+        await async_session.execute(
+            update(JobModel).values(simhash=None, content_hash=None).execution_options(synchronize_session=False)
+        )
+
+        first = await job_repository.backfill_fingerprints(limit=2)
+        second = await job_repository.backfill_fingerprints(limit=2)
+        third = await job_repository.backfill_fingerprints(limit=2)
+
+        assert (first, second, third) == (2, 1, 0)
+        hashes = await job_repository.find_content_hashes([job.id for job in multiple_jobs])
+        assert hashes == {job.id: job_content_hash(job) for job in multiple_jobs}
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestSQLAlchemyJobRepositoryNearDuplicates:
+
+    @pytest.fixture
+    def repost_job(self, valid_job: Job) -> Job:
+        return Job(
+            id="job-reposted",
+            title=valid_job.title,
+            company=valid_job.company,
+            location=valid_job.location,
+            url=f"{valid_job.url}?trk=public_jobs_topcard",
+            source=valid_job.source,
+            description=valid_job.description,
+        )
+
+    async def test_save_many_reports_repost_as_near_duplicate(
+        self, job_repository: IJobRepository, valid_job: Job, repost_job: Job
+    ):
+        await job_repository.save_many([valid_job])
+
+        result = await job_repository.save_many([repost_job])
+
+        assert result["inserted"] == 1
+        assert result["near_duplicates"] == [
+            {"id": "job-reposted", "duplicate_of": valid_job.id, "distance": 0}
+        ]
+        stored = await job_repository.find_by_id("job-reposted")
+        assert stored.duplicate_of == valid_job.id
+
+    async def test_save_many_detects_near_duplicates_within_batch(
+        self, job_repository: IJobRepository, valid_job: Job, repost_job: Job
+    ):
+        result = await job_repository.save_many([valid_job, repost_job])
+
+        assert [match["id"] for match in result["near_duplicates"]] == ["job-reposted"]
+
+    async def test_distinct_postings_are_not_near_duplicates(
+        self, job_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        result = await job_repository.save_many(multiple_jobs)
+
+        assert result["near_duplicates"] == []
+
+    async def test_search_collapses_clusters_to_canonical_posting(
+        self, job_repository: IJobRepository, valid_job: Job, repost_job: Job
+    ):
+        await job_repository.save_many([valid_job, repost_job])
+
+        all_jobs = await job_repository.search()
+        collapsed = await job_repository.search(collapse_duplicates=True)
+
+        assert len(all_jobs) == 2
+        assert [job.id for job in collapsed] == [valid_job.id]
+
+    async def test_detection_can_be_disabled(self, async_session, valid_job: Job, repost_job: Job):
+        repository = SQLAlchemyJobRepository(async_session, near_duplicate_distance=None)
+
+        result = await repository.save_many([valid_job, repost_job])
+
+        assert result["inserted"] == 2
+        assert result["near_duplicates"] == []
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestCopyJobBulkLoader:
+
+    @pytest.fixture
+    def loader(self, async_session):
+        # Commits become savepoints of the test transaction
+        session_factory = async_sessionmaker(
+            bind=async_session.bind,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        )
+        return CopyJobBulkLoader(session_factory)
+
+    def _records(self, jobs: List[Job]) -> List[dict]:
+        valid, errors = validate_job_records([
+            {field: getattr(job, field) for field in ("id", "title", "company", "location", "url", "source", "posted_date", "description")}
+            for job in jobs
+        ])
+        assert errors == {}
+        return valid
+
+    async def test_load_chunk_copies_and_merges(
+        self, loader, job_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        result = await loader.load_chunk(self._records(multiple_jobs))
+
+        assert result == {"inserted": 3, "duplicates": 0}
+        saved = await job_repository.find_by_id(multiple_jobs[0].id)
+        assert saved.title == multiple_jobs[0].title
+        assert saved.scraped_at is not None
+        hashes = await job_repository.find_content_hashes([multiple_jobs[0].id])
+        assert hashes[multiple_jobs[0].id] == job_content_hash(multiple_jobs[0])
+
+    async def test_load_chunk_skips_stored_and_repeated_keys(
+        self, loader, job_repository: IJobRepository, multiple_jobs: List[Job]
+    ):
+        await job_repository.save(multiple_jobs[0])
+        records = self._records(multiple_jobs + [multiple_jobs[1]])
+
+        result = await loader.load_chunk(records)
+        again = await loader.load_chunk(records)
+
+        assert result == {"inserted": 2, "duplicates": 2}
+        assert again == {"inserted": 0, "duplicates": 4}
+        assert await job_repository.count_total() == 3
+
+
+RACE_PREFIX = "race-"
+RACE_WRITERS = 4
+RACE_JOBS = 60
+
+
+def race_job(job_id: str, url_key: int) -> Job:
+    return Job(
+        id=job_id,
+        title=f"Race title {url_key}",
+        company=f"Race company {url_key}",
+        location="Paris",
+        url=f"https://example.com/race/{url_key}",
+        source="linkedin",
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestConcurrentSaveMany:
+    # Real commits on one connection per writer, as with concurrent requests;
+    # the rows are deleted afterwards instead of being rolled back.
+
+    @pytest.fixture
+    async def session_factory(self, async_engine):
+        factory = async_sessionmaker(bind=async_engine, class_=AsyncSession, expire_on_commit=False)
+        yield factory
+        async with factory() as session:
+            await session.execute(delete(JobModel).where(JobModel.id.startswith(RACE_PREFIX)))
+            if PARTITIONED:
+                await session.execute(delete(JobKeyModel).where(JobKeyModel.id.startswith(RACE_PREFIX)))
+            await session.commit()
+
+    async def _race(self, session_factory, batches: List[List[Job]], upsert: bool = False) -> List[dict]:
+        async def write(batch: List[Job]) -> dict:
+            async with session_factory() as session:
+                repository = SQLAlchemyJobRepository(session, batch_size=10, near_duplicate_distance=None)
+                return await repository.save_many(batch, upsert=upsert)
+
+        return await asyncio.gather(*(write(batch) for batch in batches))
+
+    async def _stored(self, session_factory) -> int:
+        async with session_factory() as session:
+            stmt = select(func.count()).select_from(JobModel).where(JobModel.id.startswith(RACE_PREFIX))
+            return (await session.execute(stmt)).scalar_one()
+
+    async def test_overlapping_batches_skip_only_conflicting_ids(self, session_factory):
+        # Same jobs, each writer in its own order: the keys are locked in
+        # crossing orders, which provokes deadlocks between chunks.
+        batches = [
+            [race_job(f"{RACE_PREFIX}{k}", k) for k in random.Random(writer).sample(range(RACE_JOBS), RACE_JOBS)]
+            for writer in range(RACE_WRITERS)
+        ]
+
+        results = await self._race(session_factory, batches)
+
+        assert sum(result["inserted"] for result in results) == RACE_JOBS
+        assert all(result["inserted"] + result["duplicates"] == RACE_JOBS for result in results)
+        assert await self._stored(session_factory) == RACE_JOBS
+
+    async def test_overlapping_upserts_skip_only_conflicting_urls(self, session_factory):
+        # Different ids per writer on shared urls: ON CONFLICT (id) does not
+        # cover the url, so the losing rows raise a unique violation.
+        batches = [
+            [race_job(f"{RACE_PREFIX}{writer}-{k}", k) for k in range(RACE_JOBS)]
+            for writer in range(RACE_WRITERS)
+        ]
+
+        results = await self._race(session_factory, batches, upsert=True)
+
+        assert sum(result["inserted"] for result in results) == RACE_JOBS
+        assert all(result["inserted"] + result["duplicates"] == RACE_JOBS for result in results)
+        assert await self._stored(session_factory) == RACE_JOBS
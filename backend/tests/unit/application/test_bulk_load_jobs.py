@@ -0,0 +1,132 @@
+import asyncio
+import json
+import pytest
+from typing import AsyncIterator, List, Tuple
+from unittest.mock import AsyncMock, Mock
+
+from app.application.use_cases.bulk_load_jobs import BulkLoadJobsUseCase
+from app.domain.exceptions.job_exceptions import PartialSaveError, RepositoryError
+from app.domain.ports.job_bulk_loader import IJobBulkLoader
+
+
+def _line(i: int, **overrides) -> bytes:
+    data = {
+        "id": f"job-{i}",
+        "title": f"Job {i}",
+        "company": "Company",
+        "location": "Location",
+        "url": f"https://example.com/job/{i}",
+    }
+    data.update(overrides)
+    return json.dumps(data).encode()
+
+
+async def _lines(lines: List[bytes]) -> AsyncIterator[Tuple[int, bytes]]:
+    for number, line in enumerate(lines, start=1):
+        yield number, line
+
+
+@pytest.fixture
+def loader() -> AsyncMock:
+    loader = AsyncMock(spec=IJobBulkLoader)
+
+    async def load_chunk(records):
+        return {"inserted": len(records), "duplicates": 0}
+
+    loader.load_chunk.side_effect = load_chunk
+    return loader
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBulkLoadJobsUseCase:
+
+    async def test_loads_in_chunks_and_reports_progress(self, loader):
+        progress = []
+        stats_refresher = Mock()
+        use_case = BulkLoadJobsUseCase(loader, stats_refresher=stats_refresher, chunk_size=2)
+
+        result = await use_case.execute(_lines([_line(i) for i in range(5)]), on_progress=progress.append)
+
+        assert [len(call.args[0]) for call in loader.load_chunk.await_args_list] == [2, 2, 1]
+        assert result["inserted"] == 5
+        assert result["total"] == 5
+        assert [chunk["last_line"] for chunk in result["chunks"]] == [2, 4, 5]
+        assert result["committed_line"] == 5
+        assert [event["loaded"] for event in progress] == [2, 4, 5]
+        stats_refresher.mark_dirty.assert_called_once()
+
+    async def test_invalid_lines_are_reported_and_skipped(self, loader):
+        use_case = BulkLoadJobsUseCase(loader, chunk_size=10)
+
+        result = await use_case.execute(_lines([
+            _line(1),
+            b"{not json",
+            b"[1, 2]",
+            _line(4, title=""),
+            _line(5),
+        ]))
+
+        loaded = loader.load_chunk.await_args.args[0]
+        assert [record["id"] for record in loaded] == ["job-1", "job-5"]
+        assert result["invalid"] == 3
+        assert [error["line"] for error in result["errors"]] == [2, 3, 4]
+        assert result["errors"][2]["error"] == "Job title cannot be empty"
+        assert result["chunks"][0]["invalid"] == 1
+
+    async def test_nothing_inserted_leaves_stats_alone(self, loader):
+        loader.load_chunk.side_effect = None
+        loader.load_chunk.return_value = {"inserted": 0, "duplicates": 1}
+        stats_refresher = Mock()
+
+        result = await BulkLoadJobsUseCase(loader, stats_refresher=stats_refresher).execute(_lines([_line(1)]))
+
+        assert result["duplicates"] == 1
+        stats_refresher.mark_dirty.assert_not_called()
+
+    async def test_concurrent_chunks_overlap_and_are_reported_in_order(self, loader):
+        running = {"now": 0, "peak": 0}
+
+        async def load_chunk(records):
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0.01 if records[0]["id"] == "job-0" else 0)
+            running["now"] -= 1
+            return {"inserted": len(records), "duplicates": 0}
+
+        loader.load_chunk.side_effect = load_chunk
+        use_case = BulkLoadJobsUseCase(loader, chunk_size=2, concurrency=3)
+
+        result = await use_case.execute(_lines([_line(i) for i in range(6)]))
+
+        assert running["peak"] == 3
+        assert result["inserted"] == 6
+        assert [chunk["chunk"] for chunk in result["chunks"]] == [1, 2, 3]
+
+    async def test_failed_chunk_stops_the_load(self, loader):
+        loader.load_chunk.side_effect = RepositoryError("boom")
+
+        with pytest.raises(RepositoryError):
+            await BulkLoadJobsUseCase(loader, chunk_size=1, concurrency=2).execute(
+                _lines([_line(i) for i in range(5)])
+            )
+
+    async def test_failed_chunk_reports_what_was_loaded(self, loader):
+        async def load_chunk(records):
+            if records[0]["id"] == "job-2":
+                raise RepositoryError("boom")
+            return {"inserted": len(records), "duplicates": 0}
+
+        loader.load_chunk.side_effect = load_chunk
+        stats_refresher = Mock()
+        use_case = BulkLoadJobsUseCase(loader, stats_refresher=stats_refresher, chunk_size=2)
+
+        with pytest.raises(PartialSaveError) as error:
+            await use_case.execute(_lines([_line(i) for i in range(6)]))
+
+        result = error.value.result
+        assert result["success"] is False
+        assert result["inserted"] == 2
+        assert result["committed_line"] == 2
+        assert [chunk["chunk"] for chunk in result["chunks"]] == [1]
+        stats_refresher.mark_dirty.assert_called_once()
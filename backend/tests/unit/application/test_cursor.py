@@ -0,0 +1,26 @@
+import pytest
+from datetime import datetime, timezone
+
+from app.application.services.cursor import encode_cursor, decode_cursor
+from app.domain.exceptions.job_exceptions import InvalidSearchCriteriaError
+
+
+@pytest.mark.unit
+class TestPaginationCursor:
+
+    def test_cursor_round_trip(self):
+        created_at = datetime(2025, 12, 12, 10, 30, 0, 123456, tzinfo=timezone.utc)
+
+        cursor = encode_cursor(created_at, "job-123")
+
+        assert decode_cursor(cursor) == (created_at, "job-123")
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor(datetime(2025, 1, 1, tzinfo=timezone.utc), "id/with+chars?")
+
+        assert all(c.isalnum() or c in "-_" for c in cursor)
+
+    @pytest.mark.parametrize("cursor", ["", "not-a-cursor", "e30", "WyJ4Il0"])
+    def test_invalid_cursor_raises_search_criteria_error(self, cursor):
+        with pytest.raises(InvalidSearchCriteriaError, match="Invalid pagination cursor"):
+            decode_cursor(cursor)
@@ -0,0 +1,19 @@
+import pytest
+from unittest.mock import Mock
+
+from app.application.use_cases.get_submit_ticket import GetSubmitTicketUseCase
+from app.domain.ports.job_ingest_queue import IJobIngestQueue
+
+
+@pytest.mark.unit
+class TestGetSubmitTicket:
+
+    def test_reads_ticket_from_queue(self):
+        queue = Mock(spec=IJobIngestQueue)
+        queue.get_ticket.return_value = {"ticket": "abc", "status": "pending"}
+
+        assert GetSubmitTicketUseCase(queue).execute("abc") == {"ticket": "abc", "status": "pending"}
+        queue.get_ticket.assert_called_once_with("abc")
+
+    def test_no_ticket_without_queue(self):
+        assert GetSubmitTicketUseCase(None).execute("abc") is None
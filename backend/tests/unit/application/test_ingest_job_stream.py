@@ -0,0 +1,137 @@
+import gzip
+import json
+import pytest
+import tracemalloc
+from typing import AsyncIterator, List
+from unittest.mock import AsyncMock
+
+from app.domain.exceptions.job_exceptions import JobValidationError
+from app.domain.ports.job_repository import IJobRepository
+from app.application.use_cases.submit_jobs import SubmitJobsUseCase
+from app.application.use_cases.ingest_job_stream import IngestJobStreamUseCase
+from app.infrastructure.primary.http.ndjson import iter_ndjson_lines
+
+
+def _job_line(i: int) -> bytes:
+    return json.dumps({
+        "id": f"job-{i}",
+        "title": f"Job {i}",
+        "company": "Company",
+        "location": "Location",
+        "url": f"https://example.com/job/{i}",
+    }).encode()
+
+
+async def _stream(chunks: List[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def _collect(lines) -> list:
+    return [item async for item in lines]
+
+
+def _split(payload: bytes, size: int) -> List[bytes]:
+    return [payload[i:i + size] for i in range(0, len(payload), size)]
+
+
+@pytest.fixture
+def repository() -> AsyncMock:
+    repository = AsyncMock(spec=IJobRepository)
+
+    async def save_many(jobs, upsert=False):
+        return {"inserted": len(jobs), "duplicates": 0, "duplicate_ids": [], "total": len(jobs)}
+
+    repository.save_many.side_effect = save_many
+    return repository
+
+
+@pytest.fixture
+def use_case(repository: AsyncMock) -> IngestJobStreamUseCase:
+    return IngestJobStreamUseCase(SubmitJobsUseCase(repository), chunk_size=2)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestNdjsonLines:
+
+    async def test_lines_split_across_network_chunks(self):
+        payload = b"\n".join(_job_line(i) for i in range(3)) + b"\n"
+
+        lines = await _collect(iter_ndjson_lines(_stream(_split(payload, 7))))
+
+        assert [number for number, _ in lines] == [1, 2, 3]
+        assert json.loads(lines[2][1])["id"] == "job-2"
+
+    async def test_last_line_without_newline_and_blank_lines(self):
+        payload = _job_line(1) + b"\n\n" + _job_line(2)
+
+        lines = await _collect(iter_ndjson_lines(_stream([payload])))
+
+        assert [number for number, _ in lines] == [1, 3]
+
+    async def test_gzip_payload_is_decompressed_incrementally(self):
+        payload = gzip.compress(b"\n".join(_job_line(i) for i in range(5)))
+
+        lines = await _collect(iter_ndjson_lines(_stream(_split(payload, 16)), gzip=True))
+
+        assert len(lines) == 5
+
+    async def test_invalid_gzip_is_rejected(self):
+        with pytest.raises(JobValidationError, match="Invalid gzip payload"):
+            await _collect(iter_ndjson_lines(_stream([b"not gzip at all"]), gzip=True))
+
+    async def test_gzip_bomb_is_rejected_without_full_inflation(self):
+        # 64 MiB of a single line compress to about 64 KiB, sent as one chunk
+        payload = gzip.compress(b"x" * (64 * 1024 * 1024))
+
+        tracemalloc.start()
+        try:
+            with pytest.raises(JobValidationError, match="exceeds"):
+                await _collect(iter_ndjson_lines(_stream([payload]), gzip=True))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 8 * 1024 * 1024
+
+    async def test_oversized_line_is_rejected(self):
+        with pytest.raises(JobValidationError, match="exceeds"):
+            await _collect(iter_ndjson_lines(_stream([b"x" * 50]), max_line_bytes=10))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestIngestJobStreamUseCase:
+
+    async def test_flushes_fixed_size_chunks(
+        self, use_case: IngestJobStreamUseCase, repository: AsyncMock
+    ):
+        payload = b"\n".join(_job_line(i) for i in range(5))
+
+        summary = await use_case.execute(iter_ndjson_lines(_stream([payload])))
+
+        assert [len(call.args[0]) for call in repository.save_many.await_args_list] == [2, 2, 1]
+        assert [chunk["last_line"] for chunk in summary["chunks"]] == [2, 4, 5]
+        assert summary["inserted"] == 5
+        assert summary["total"] == 5
+
+    async def test_invalid_lines_are_reported_and_skipped(
+        self, use_case: IngestJobStreamUseCase
+    ):
+        payload = b"\n".join([_job_line(1), b"{not json", b'{"id": "missing-fields"}', _job_line(2)])
+
+        summary = await use_case.execute(iter_ndjson_lines(_stream([payload])))
+
+        assert summary["inserted"] == 2
+        assert summary["invalid"] == 2
+        assert [error["line"] for error in summary["errors"]] == [2, 3]
+
+    async def test_chunk_size_can_be_overridden_per_call(
+        self, use_case: IngestJobStreamUseCase, repository: AsyncMock
+    ):
+        payload = b"\n".join(_job_line(i) for i in range(5))
+
+        await use_case.execute(iter_ndjson_lines(_stream([payload])), chunk_size=10)
+
+        assert repository.save_many.await_count == 1
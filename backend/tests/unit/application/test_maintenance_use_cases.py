@@ -0,0 +1,113 @@
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+from app.application.dto.job_dto import JobExportFilterDTO
+from app.application.use_cases.export_jobs import ExportJobsUseCase
+from app.application.use_cases.reindex_jobs import ReindexJobsUseCase
+from app.domain.exceptions.job_exceptions import RepositoryError
+from app.domain.ports.job_repository import IJobRepository
+
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _scope(repository):
+    @asynccontextmanager
+    async def scope():
+        yield repository
+    return scope
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestParallelExport:
+
+    @pytest.fixture
+    def repository(self) -> AsyncMock:
+        repository = AsyncMock(spec=IJobRepository)
+        repository.export_boundaries.return_value = [(NOW, "job-b"), (NOW, "job-d")]
+
+        async def export_rows(key_range=None, **kwargs):
+            lower, upper = key_range or (None, None)
+            name = f"{lower[1] if lower else '-'}:{upper[1] if upper else '-'}"
+            for chunk in range(2):
+                await asyncio.sleep(0)
+                yield [{"id": f"{name}-{chunk}"}]
+
+        repository.export_rows = export_rows
+        return repository
+
+    async def test_reads_each_key_range_once(self, repository):
+        use_case = ExportJobsUseCase(_scope(repository))
+
+        batches = [rows async for rows in use_case.execute_parallel(JobExportFilterDTO(source="indeed"), concurrency=3)]
+
+        ids = sorted(row["id"] for rows in batches for row in rows)
+        ranges = ("-:job-b", "job-b:job-d", "job-d:-")
+        assert ids == sorted(f"{name}-{chunk}" for name in ranges for chunk in range(2))
+        assert repository.export_boundaries.await_args.args == (3,)
+        assert repository.export_boundaries.await_args.kwargs["source"] == "indeed"
+
+    async def test_small_exports_use_fewer_ranges(self, repository):
+        repository.export_boundaries.return_value = []
+        use_case = ExportJobsUseCase(_scope(repository))
+
+        batches = [rows async for rows in use_case.execute_parallel(JobExportFilterDTO(), concurrency=4)]
+
+        assert [rows[0]["id"] for rows in batches] == ["-:--0", "-:--1"]
+
+    async def test_single_worker_reads_without_range(self, repository):
+        use_case = ExportJobsUseCase(_scope(repository))
+
+        batches = [rows async for rows in use_case.execute_parallel(JobExportFilterDTO(), concurrency=1)]
+
+        assert [rows[0]["id"] for rows in batches] == ["-:--0", "-:--1"]
+        repository.export_boundaries.assert_not_awaited()
+
+    async def test_range_failure_is_raised(self, repository):
+        async def export_rows(key_range=None, **kwargs):
+            if key_range[0] is not None:
+                raise RepositoryError("boom")
+            yield [{"id": "ok"}]
+
+        repository.export_rows = export_rows
+        use_case = ExportJobsUseCase(_scope(repository))
+
+        with pytest.raises(RepositoryError):
+            async for _ in use_case.execute_parallel(JobExportFilterDTO(), concurrency=2):
+                pass
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReindexJobs:
+
+    async def test_workers_backfill_until_empty_then_rebuild(self):
+        repository = AsyncMock(spec=IJobRepository)
+        remaining = [250]
+
+        async def backfill_fingerprints(limit):
+            count = min(limit, remaining[0])
+            remaining[0] -= count
+            await asyncio.sleep(0)
+            return count
+
+        repository.backfill_fingerprints.side_effect = backfill_fingerprints
+        progress = []
+
+        result = await ReindexJobsUseCase(_scope(repository), batch_size=100).execute(
+            concurrency=2, rebuild_indexes=True, on_progress=progress.append
+        )
+
+        assert result["backfilled"] == 250
+        assert result["batches"] == 3
+        assert result["indexes_rebuilt"] is True
+        assert progress[-1]["backfilled"] == 250
+        repository.rebuild_indexes.assert_awaited_once()
+
+    async def test_rejects_zero_concurrency(self):
+        with pytest.raises(ValueError):
+            await ReindexJobsUseCase(_scope(AsyncMock(spec=IJobRepository))).execute(concurrency=0)
@@ -0,0 +1,85 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+from app.application.dto.job_dto import JobCreateDTO, JobDeleteFilterDTO
+from app.application.use_cases.manage_jobs import ManageJobsUseCase
+from app.domain.exceptions.job_exceptions import InvalidSearchCriteriaError, JobValidationError
+from app.domain.ports.job_repository import IJobRepository
+
+
+@pytest.fixture
+def repository() -> AsyncMock:
+    repository = AsyncMock(spec=IJobRepository)
+    repository.delete_many.return_value = 2
+    repository.update_many.return_value = 1
+    repository.delete_where.return_value = 0
+    return repository
+
+
+@pytest.fixture
+def stats_refresher() -> Mock:
+    return Mock()
+
+
+@pytest.fixture
+def use_case(repository, stats_refresher) -> ManageJobsUseCase:
+    return ManageJobsUseCase(repository, stats_refresher=stats_refresher)
+
+
+def _job_dto(job_id: str, **overrides) -> JobCreateDTO:
+    data = {
+        "id": job_id,
+        "title": "Python Developer",
+        "company": "TechCorp",
+        "location": "Paris",
+        "url": f"https://example.com/jobs/{job_id}",
+    }
+    data.update(overrides)
+    return JobCreateDTO(**data)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestManageJobs:
+
+    async def test_delete_many_reports_counts_and_marks_stats(self, use_case, repository, stats_refresher):
+        result = await use_case.delete_many(["a", "b", "b", "c"])
+
+        assert result == {"deleted": 2, "requested": 3}
+        repository.delete_many.assert_awaited_once_with(["a", "b", "b", "c"])
+        stats_refresher.mark_dirty.assert_called_once()
+
+    async def test_update_many_converts_dtos(self, use_case, repository):
+        result = await use_case.update_many([_job_dto("a", scraped_at="2026-10-01T08:00:00+00:00")])
+
+        assert result == {"updated": 1, "requested": 1}
+        job = repository.update_many.await_args.args[0][0]
+        assert job.scraped_at == datetime(2026, 10, 1, 8, tzinfo=timezone.utc)
+
+    async def test_update_many_rejects_invalid_jobs(self, use_case, repository):
+        with pytest.raises(JobValidationError):
+            await use_case.update_many([_job_dto("a", scraped_at="yesterday")])
+
+        repository.update_many.assert_not_awaited()
+
+    async def test_delete_where_requires_a_criterion(self, use_case, repository):
+        with pytest.raises(InvalidSearchCriteriaError):
+            await use_case.delete_where(JobDeleteFilterDTO())
+
+        repository.delete_where.assert_not_awaited()
+
+    async def test_delete_where_passes_filters(self, use_case, repository, stats_refresher):
+        cutoff = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        result = await use_case.delete_where(JobDeleteFilterDTO(source="indeed", scraped_before=cutoff))
+
+        assert result == {"deleted": 0}
+        repository.delete_where.assert_awaited_once_with(
+            location=None,
+            company=None,
+            source="indeed",
+            scraped_before=cutoff,
+            duplicates_only=False
+        )
+        stats_refresher.mark_dirty.assert_not_called()
@@ -0,0 +1,117 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+from app.application.dto.job_dto import JobFilterDTO, SUMMARY_FIELDS
+from app.application.use_cases.search_jobs import SearchJobsUseCase
+from app.domain.exceptions.job_exceptions import InvalidSearchCriteriaError
+from app.domain.ports.job_repository import IJobRepository
+
+
+@pytest.fixture
+def repository() -> AsyncMock:
+    repository = AsyncMock(spec=IJobRepository)
+    repository.search_rows.return_value = []
+    repository.search.return_value = []
+    return repository
+
+
+@pytest.fixture
+def use_case(repository: AsyncMock) -> SearchJobsUseCase:
+    return SearchJobsUseCase(repository)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSearchProjection:
+
+    async def test_full_view_selects_every_column(self, use_case, repository):
+        await use_case.execute_rows(JobFilterDTO())
+
+        assert repository.search_rows.await_args.kwargs["fields"] is None
+
+    async def test_summary_view_skips_description(self, use_case, repository):
+        await use_case.execute_rows(JobFilterDTO(view="summary"))
+
+        fields = repository.search_rows.await_args.kwargs["fields"]
+        assert fields == list(SUMMARY_FIELDS)
+        assert "description" not in fields
+
+    async def test_fields_always_include_id(self, use_case, repository):
+        await use_case.execute_rows(JobFilterDTO(fields=["title", "company", "title"]))
+
+        assert repository.search_rows.await_args.kwargs["fields"] == ["id", "title", "company"]
+
+    async def test_cursor_pagination_also_needs_created_at(self, use_case, repository):
+        await use_case.execute_rows(JobFilterDTO(fields=["title"], pagination="cursor"))
+
+        assert repository.search_rows.await_args.kwargs["fields"] == ["id", "created_at", "title"]
+
+    async def test_unknown_field_is_rejected(self, use_case):
+        with pytest.raises(InvalidSearchCriteriaError, match="Unknown fields: salary"):
+            await use_case.execute_rows(JobFilterDTO(fields=["title", "salary"]))
+
+    async def test_orm_search_defers_description_in_summary_view(self, use_case, repository):
+        await use_case.execute(JobFilterDTO(view="summary"))
+
+        assert repository.search.await_args.kwargs["include_description"] is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSearchFacets:
+
+    async def test_no_facets_requested_reads_the_page_only(self, use_case, repository):
+        rows, _, facets = await use_case.execute_rows(JobFilterDTO())
+
+        assert facets is None
+        repository.search_rows_with_facets.assert_not_awaited()
+        repository.search_facets.assert_not_awaited()
+
+    async def test_facets_come_with_the_page(self, use_case, repository):
+        summary = {"total": 1, "facets": {"company": [{"value": "Acme", "count": 1}], "source": []}}
+        repository.search_rows_with_facets.return_value = ([{"id": "job-1"}], summary)
+
+        rows, _, facets = await use_case.execute_rows(JobFilterDTO(
+            search="python",
+            source="linkedin",
+            facets=["company", "source", "company"],
+            facet_limit=5
+        ))
+
+        kwargs = repository.search_rows_with_facets.await_args.kwargs
+        assert kwargs["search_term"] == "python"
+        assert kwargs["source"] == "linkedin"
+        assert kwargs["facets"] == ["company", "source"]
+        assert kwargs["facet_limit"] == 5
+        assert rows == [{"id": "job-1"}]
+        assert facets == summary
+        repository.search_rows.assert_not_awaited()
+        repository.search_facets.assert_not_awaited()
+
+    async def test_cursor_pages_keep_their_facets(self, use_case, repository):
+        summary = {"total": 3, "facets": {"source": []}}
+        rows = [{"id": f"job-{i}", "created_at": datetime(2026, 1, 1, tzinfo=timezone.utc)} for i in range(3)]
+        repository.search_rows_with_facets.return_value = (rows, summary)
+
+        page, cursor, facets = await use_case.execute_rows(
+            JobFilterDTO(pagination="cursor", limit=2, facets=["source"])
+        )
+
+        assert [row["id"] for row in page] == ["job-0", "job-1"]
+        assert cursor is not None
+        assert facets == summary
+
+    async def test_fulltext_facets_come_with_the_hits(self, use_case, repository):
+        summary = {"total": 0, "facets": {"company": []}}
+        repository.search_fulltext_with_facets.return_value = ([], summary)
+
+        hits, facets = await use_case.execute_fulltext(
+            JobFilterDTO(search="python", search_mode="fulltext", facets=["company"])
+        )
+
+        assert hits == []
+        assert facets == summary
+        assert repository.search_fulltext_with_facets.await_args.kwargs["query"] == "python"
+        repository.search_fulltext.assert_not_awaited()
+        repository.search_facets.assert_not_awaited()
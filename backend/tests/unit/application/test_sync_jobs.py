@@ -0,0 +1,52 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from app.application.use_cases.sync_jobs import SyncJobsUseCase
+from app.domain.ports.job_repository import IJobRepository
+
+
+@pytest.fixture
+def repository() -> AsyncMock:
+    repository = AsyncMock(spec=IJobRepository)
+    repository.find_existing_ids.return_value = {"job-2"}
+    return repository
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSyncJobs:
+
+    async def test_reports_missing_ids_in_request_order(self, repository):
+        result = await SyncJobsUseCase(repository).execute(["job-3", "job-2", "job-1"])
+
+        assert result == {"missing": ["job-3", "job-1"], "changed": [], "known": 1, "total": 3}
+
+    async def test_repeated_ids_are_looked_up_once(self, repository):
+        result = await SyncJobsUseCase(repository).execute(["job-1", "job-2", "job-1"])
+
+        repository.find_existing_ids.assert_awaited_once_with(["job-1", "job-2"])
+        assert result["missing"] == ["job-1"]
+        assert result["total"] == 2
+
+    async def test_hashes_report_changed_postings(self, repository):
+        repository.find_content_hashes.return_value = {"job-1": "aaa", "job-2": "bbb", "job-3": None}
+
+        result = await SyncJobsUseCase(repository, upsert=True).execute(
+            ["job-1", "job-2", "job-3", "job-4"],
+            {"job-1": "aaa", "job-2": "ccc", "job-3": "ddd"}
+        )
+
+        repository.find_existing_ids.assert_not_awaited()
+        assert result["missing"] == ["job-4"]
+        assert result["changed"] == ["job-2", "job-3"]
+        assert result["known"] == 3
+
+    async def test_hashes_are_ignored_without_upsert(self, repository):
+        # Resubmitted postings would only count as duplicates, forever
+        result = await SyncJobsUseCase(repository).execute(
+            ["job-1", "job-2"],
+            {"job-2": "ccc"}
+        )
+
+        repository.find_content_hashes.assert_not_awaited()
+        assert result == {"missing": ["job-1"], "changed": [], "known": 1, "total": 2}
@@ -0,0 +1,44 @@
+import hashlib
+import pytest
+from datetime import datetime, timezone
+
+from app.domain.entities.job import Job
+from app.domain.services.content_hash import job_content_hash
+
+
+def _job(**overrides) -> Job:
+    data = {
+        "id": "job-1",
+        "title": "Python Developer",
+        "company": "TechCorp",
+        "location": "Paris",
+        "url": "https://example.com/jobs/1",
+        "source": "linkedin",
+        "description": "Build APIs",
+    }
+    data.update(overrides)
+    return Job(**data)
+
+
+@pytest.mark.unit
+class TestJobContentHash:
+
+    def test_is_stable_and_documented(self):
+        expected = hashlib.sha256(
+            "\x1f".join(["Python Developer", "TechCorp", "Paris", "https://example.com/jobs/1",
+                         "linkedin", "", "Build APIs"]).encode("utf-8")
+        ).hexdigest()
+
+        assert job_content_hash(_job()) == expected
+
+    def test_changes_with_content(self):
+        assert job_content_hash(_job()) != job_content_hash(_job(location="Lyon"))
+        assert job_content_hash(_job()) != job_content_hash(_job(description="Build APIs!"))
+
+    def test_ignores_scrape_metadata(self):
+        rescraped = _job(id="job-1", scraped_at=datetime(2026, 10, 1, tzinfo=timezone.utc))
+
+        assert job_content_hash(rescraped) == job_content_hash(_job())
+
+    def test_fields_do_not_bleed_into_each_other(self):
+        assert job_content_hash(_job(title="A B", company="C")) != job_content_hash(_job(title="A", company="B C"))
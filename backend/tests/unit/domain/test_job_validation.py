@@ -0,0 +1,59 @@
+import pytest
+from datetime import datetime, timezone
+
+from app.domain.entities.job import Job
+from app.domain.services.job_validation import validate_job_records
+
+
+def _record(**overrides) -> dict:
+    data = {
+        "id": "job-1",
+        "title": "Python Developer",
+        "company": "TechCorp",
+        "location": "Paris",
+        "url": "https://example.com/jobs/1",
+    }
+    data.update(overrides)
+    return data
+
+
+@pytest.mark.unit
+class TestValidateJobRecords:
+
+    def test_valid_records_are_normalized(self):
+        valid, errors = validate_job_records([_record(scraped_at="2026-10-01T08:00:00+00:00")])
+
+        assert errors == {}
+        assert valid[0]["source"] == "linkedin"
+        assert valid[0]["description"] is None
+        assert valid[0]["scraped_at"] == datetime(2026, 10, 1, 8, tzinfo=timezone.utc)
+
+    @pytest.mark.parametrize("overrides", [
+        {"id": ""},
+        {"title": "   "},
+        {"url": "https://example.com/" + "x" * 500},
+        {"source": "s" * 51},
+        {"company": None},
+    ])
+    def test_rejects_what_the_entity_rejects(self, overrides):
+        record = _record(**overrides)
+        _, errors = validate_job_records([record])
+
+        with pytest.raises(ValueError) as entity_error:
+            Job(**{"source": "linkedin", **record})
+        assert errors == {0: str(entity_error.value)}
+
+    def test_reports_first_error_per_record_by_index(self):
+        valid, errors = validate_job_records([
+            _record(id="ok-1"),
+            _record(id="", title=""),
+            _record(id="ok-2", posted_date="d" * 101),
+            _record(id="ok-3", scraped_at="yesterday"),
+            _record(id="ok-4", title=42),
+        ])
+
+        assert [record["id"] for record in valid] == ["ok-1"]
+        assert errors[1] == "Job ID cannot be empty"
+        assert errors[2] == "Job posted_date cannot exceed 100 characters"
+        assert errors[3].startswith("Invalid job data")
+        assert errors[4] == "Job title must be a string"
@@ -0,0 +1,120 @@
+import random
+
+import pytest
+
+from app.domain.entities.job import Job
+from app.domain.services.simhash import (
+    BAND_COUNT,
+    MAX_INDEXED_DISTANCE,
+    NearDuplicateIndex,
+    band_keys,
+    hamming_distance,
+    job_fingerprint,
+    simhash,
+    to_signed,
+    to_unsigned
+)
+
+
+DESCRIPTION = (
+    "We are looking for a senior Python developer to join our data platform team. "
+    "You will design and build APIs with FastAPI, model data in PostgreSQL and "
+    "deploy services on Kubernetes. Five years of experience are required, remote "
+    "work is possible two days per week and the position is based in Paris."
+)
+
+
+def _job(job_id: str, description: str = DESCRIPTION, url: str = None) -> Job:
+    return Job(
+        id=job_id,
+        title="Senior Python Developer",
+        company="TechCorp",
+        location="Paris, France",
+        url=url or f"https://linkedin.com/jobs/view/{job_id}",
+        source="linkedin",
+        description=description
+    )
+
+
+@pytest.mark.unit
+class TestSimHash:
+
+    def test_fingerprint_is_deterministic_and_64_bits(self):
+        fingerprint = simhash(DESCRIPTION)
+
+        assert fingerprint == simhash(DESCRIPTION)
+        assert 0 <= fingerprint < 1 << 64
+
+    def test_repost_with_new_id_and_tracking_url_has_same_fingerprint(self):
+        original = _job("111")
+        repost = _job("222", url="https://linkedin.com/jobs/view/222?trk=public_jobs")
+
+        assert job_fingerprint(original) == job_fingerprint(repost)
+
+    def test_case_and_punctuation_are_ignored(self):
+        assert simhash(DESCRIPTION) == simhash(DESCRIPTION.upper().replace(",", " ;"))
+
+    def test_unrelated_postings_are_far_apart(self):
+        other = _job("333", description=(
+            "Boulangerie artisanale recherche un apprenti pâtissier motivé pour la "
+            "saison d'été, horaires du matin, formation assurée sur place à Lyon."
+        ))
+
+        assert hamming_distance(job_fingerprint(_job("111")), job_fingerprint(other)) > MAX_INDEXED_DISTANCE
+
+    def test_signed_round_trip(self):
+        for fingerprint in (0, 1, (1 << 63) - 1, 1 << 63, (1 << 64) - 1):
+            signed = to_signed(fingerprint)
+
+            assert -(1 << 63) <= signed < 1 << 63
+            assert to_unsigned(signed) == fingerprint
+
+    def test_close_fingerprints_share_a_band(self):
+        fingerprint = simhash(DESCRIPTION)
+        # Flip one bit in three different bands: one band stays intact
+        close = fingerprint ^ (1 << 3) ^ (1 << 20) ^ (1 << 40)
+
+        assert set(band_keys(fingerprint)) & set(band_keys(close))
+
+    def test_every_fingerprint_within_indexed_distance_shares_a_band(self):
+        rng = random.Random(7)
+        for _ in range(2000):
+            fingerprint = rng.getrandbits(64)
+            close = fingerprint
+            for bit in rng.sample(range(64), MAX_INDEXED_DISTANCE):
+                close ^= 1 << bit
+
+            assert set(band_keys(fingerprint)) & set(band_keys(close))
+
+    def test_band_keys_fit_a_postgres_integer(self):
+        keys = band_keys((1 << 64) - 1)
+
+        assert len(keys) == BAND_COUNT
+        assert all(-(1 << 31) <= key < 1 << 31 for key in keys)
+
+
+@pytest.mark.unit
+class TestNearDuplicateIndex:
+
+    def test_finds_closest_cluster_within_distance(self):
+        index = NearDuplicateIndex(max_distance=2)
+        index.add("a", 0b0000)
+        index.add("b", 0b1111, canonical_id="a")
+
+        assert index.find("c", 0b0001) == ("a", 1)
+
+    def test_ignores_matches_beyond_distance(self):
+        index = NearDuplicateIndex(max_distance=1)
+        index.add("a", 0b0000)
+
+        assert index.find("c", 0b0011) is None
+
+    def test_does_not_match_itself(self):
+        index = NearDuplicateIndex()
+        index.add("a", 42)
+
+        assert index.find("a", 42) is None
+
+    def test_rejects_distance_the_bands_cannot_guarantee(self):
+        with pytest.raises(ValueError, match="Near-duplicate distance"):
+            NearDuplicateIndex(max_distance=MAX_INDEXED_DISTANCE + 1)
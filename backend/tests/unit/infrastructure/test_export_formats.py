@@ -0,0 +1,84 @@
+import csv
+import io
+import json
+import pytest
+from datetime import datetime, timezone
+
+from app.domain.exceptions.job_exceptions import InvalidSearchCriteriaError
+from app.infrastructure.primary.http.export_formats import (
+    encode_csv,
+    encode_ndjson,
+    encode_parquet,
+    ensure_format_available
+)
+
+
+def _row(i: int) -> dict:
+    return {
+        "id": f"job-{i}",
+        "title": f"Développeur {i}",
+        "company": "Company, Inc.",
+        "location": "Paris",
+        "url": f"https://example.com/job/{i}",
+        "posted_date": None,
+        "description": "Line one\nline two",
+        "source": "linkedin",
+        "scraped_at": datetime(2025, 12, 12, 10, 30, tzinfo=timezone.utc),
+        "created_at": datetime(2025, 12, 12, 10, 31, tzinfo=timezone.utc),
+        "updated_at": None,
+    }
+
+
+async def _batches(*batches):
+    for batch in batches:
+        yield batch
+
+
+async def _read(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestExportFormats:
+
+    async def test_ndjson_writes_one_object_per_line(self):
+        payload = await _read(encode_ndjson(_batches([_row(1), _row(2)], [_row(3)])))
+
+        lines = payload.decode("utf-8").splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["job-1", "job-2", "job-3"]
+        assert json.loads(lines[0])["scraped_at"] == "2025-12-12T10:30:00+00:00"
+        assert json.loads(lines[0])["title"] == "Développeur 1"
+
+    async def test_csv_writes_header_once_and_quotes_values(self):
+        payload = await _read(encode_csv(_batches([_row(1)], [_row(2)])))
+
+        rows = list(csv.DictReader(io.StringIO(payload.decode("utf-8"))))
+        assert [row["id"] for row in rows] == ["job-1", "job-2"]
+        assert rows[0]["company"] == "Company, Inc."
+        assert rows[0]["description"] == "Line one\nline two"
+        assert rows[0]["updated_at"] == ""
+
+    async def test_csv_of_empty_export_has_only_header(self):
+        payload = await _read(encode_csv(_batches()))
+
+        assert payload.decode("utf-8").strip().startswith("id,title,company")
+
+    async def test_parquet_round_trip(self):
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        payload = await _read(encode_parquet(_batches([_row(1), _row(2)], [_row(3)])))
+
+        table = pq.read_table(io.BytesIO(payload))
+        assert table.num_rows == 3
+        assert table.column("id").to_pylist() == ["job-1", "job-2", "job-3"]
+
+    async def test_parquet_without_pyarrow_is_rejected_upfront(self):
+        try:
+            import pyarrow  # noqa: F401
+            pytest.skip("pyarrow is installed")
+        except ImportError:
+            pass
+
+        with pytest.raises(InvalidSearchCriteriaError, match="pyarrow"):
+            ensure_format_available("parquet")
@@ -0,0 +1,206 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from app.domain.exceptions.job_exceptions import RepositoryError
+from app.domain.ports.job_repository import IJobRepository
+from app.infrastructure.secondary.cache.ttl_cache import TTLCache, MISSING
+from app.infrastructure.secondary.cache.cached_job_repository import CachedJobRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock: FakeClock) -> TTLCache:
+    return TTLCache(max_entries=3, clock=clock)
+
+
+@pytest.fixture
+def inner_repository(multiple_jobs) -> AsyncMock:
+    repository = AsyncMock(spec=IJobRepository)
+    repository.search.return_value = multiple_jobs
+    repository.get_stats_snapshot.return_value = None
+    repository.save_many.return_value = {"inserted": 1, "duplicates": 0, "duplicate_ids": [], "total": 1}
+    repository.delete_by_id.return_value = False
+    return repository
+
+
+@pytest.fixture
+def cached_repository(inner_repository: AsyncMock, cache: TTLCache) -> CachedJobRepository:
+    return CachedJobRepository(inner_repository, cache)
+
+
+@pytest.mark.unit
+class TestTTLCache:
+
+    def test_returns_missing_for_unknown_key(self, cache: TTLCache):
+        assert cache.get("search", "key") is MISSING
+
+    def test_returns_value_before_expiry(self, cache: TTLCache, clock: FakeClock):
+        cache.set("search", "key", [], ttl=10)
+        clock.now = 9.9
+
+        assert cache.get("search", "key") == []
+
+    def test_entry_expires_after_ttl(self, cache: TTLCache, clock: FakeClock):
+        cache.set("search", "key", "value", ttl=10)
+        clock.now = 10
+
+        assert cache.get("search", "key") is MISSING
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used_entry(self, cache: TTLCache):
+        for key in ("a", "b", "c"):
+            cache.set("search", key, key, ttl=60)
+        cache.get("search", "a")
+
+        cache.set("search", "d", "d", ttl=60)
+
+        assert cache.get("search", "b") is MISSING
+        assert cache.get("search", "a") == "a"
+        assert cache.stats()["namespaces"]["search"]["evictions"] == 1
+
+    def test_invalidate_only_affects_given_namespace(self, cache: TTLCache):
+        cache.set("search", "key", "search-value", ttl=60)
+        cache.set("stats", "key", "stats-value", ttl=60)
+
+        cache.invalidate("search")
+
+        assert cache.get("search", "key") is MISSING
+        assert cache.get("stats", "key") == "stats-value"
+
+    def test_drops_value_loaded_before_an_invalidation(self, cache: TTLCache):
+        generation = cache.generation("search")
+        cache.invalidate("search")
+        cache.set("search", "key", "stale", ttl=60, generation=generation)
+
+        assert cache.get("search", "key") is MISSING
+
+    def test_counts_hits_and_misses(self, cache: TTLCache):
+        cache.get("stats", "key")
+        cache.set("stats", "key", 1, ttl=60)
+        cache.get("stats", "key")
+
+        counters = cache.stats()["namespaces"]["stats"]
+        assert counters["hits"] == 1
+        assert counters["misses"] == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCachedJobRepository:
+
+    async def test_identical_searches_hit_the_database_once(
+        self, cached_repository: CachedJobRepository, inner_repository: AsyncMock
+    ):
+        await cached_repository.search(location="Paris", limit=10)
+        await cached_repository.search(location="paris", limit=10)
+
+        assert inner_repository.search.await_count == 1
+
+    async def test_whitespace_is_part_of_the_key(
+        self, cached_repository: CachedJobRepository, inner_repository: AsyncMock
+    ):
+        await cached_repository.search(location="Paris")
+        await cached_repository.search(location="Paris ")
+        await cached_repository.search(location="   ")
+        await cached_repository.search()
+
+        assert inner_repository.search.await_count == 4
+        assert inner_repository.search.await_args_list[1].kwargs["location"] == "Paris "
+
+    async def test_different_filters_are_cached_separately(
+        self, cached_repository: CachedJobRepository, inner_repository: AsyncMock
+    ):
+        await cached_repository.search(location="Paris")
+        await cached_repository.search(location="Lyon")
+
+        assert inner_repository.search.await_count == 2
+
+    async def test_none_results_are_cached(
+        self, cached_repository: CachedJobRepository, inner_repository: AsyncMock
+    ):
+        assert await cached_repository.get_stats_snapshot() is None
+        assert await cached_repository.get_stats_snapshot() is None
+
+        assert inner_repository.get_stats_snapshot.await_count == 1
+
+    async def test_inserting_jobs_invalidates_reads(
+        self, cached_repository: CachedJobRepository, inner_repository: AsyncMock, multiple_jobs
+    ):
+        await cached_repository.search()
+        await cached_repository.save_many(multiple_jobs)
+        await cached_repository.search()
+
+        assert inner_repository.search.await_count == 2
+
+    async def test_read_overlapping_a_write_is_not_cached(
+        self, cached_repository: CachedJobRepository, inner_repository: AsyncMock, multiple_jobs
+    ):
+        loading, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_search(**kwargs):
+            loading.set()
+            await release.wait()
+            return ["old"]
+
+        inner_repository.search.side_effect = slow_search
+        read = asyncio.create_task(cached_repository.search())
+        await loading.wait()
+        await cached_repository.save_many(multiple_jobs)
+        release.set()
+        assert await read == ["old"]
+
+        inner_repository.search.side_effect = None
+        inner_repository.search.return_value = ["new"]
+        assert await cached_repository.search() == ["new"]
+
+    async def test_failed_batch_still_invalidates_reads(
+        self, cached_repository: CachedJobRepository, inner_repository: AsyncMock, multiple_jobs
+    ):
+        # Chunks committed before the failure are visible to later reads
+        inner_repository.save_many.side_effect = RepositoryError("Error saving jobs: timeout")
+
+        await cached_repository.search()
+        with pytest.raises(RepositoryError):
+            await cached_repository.save_many(multiple_jobs)
+        await cached_repository.search()
+
+        assert inner_repository.search.await_count == 2
+
+    async def test_write_without_effect_keeps_cache(
+        self, cached_repository: CachedJobRepository, inner_repository: AsyncMock
+    ):
+        await cached_repository.search()
+        await cached_repository.delete_by_id("nonexistent")
+        await cached_repository.search()
+
+        assert inner_repository.search.await_count == 1
+
+    async def test_live_stats_are_never_cached(
+        self, cached_repository: CachedJobRepository, inner_repository: AsyncMock
+    ):
+        inner_repository.get_stats.return_value = {"total_jobs": 1}
+        await cached_repository.get_stats()
+        await cached_repository.get_stats()
+
+        assert inner_repository.get_stats.await_count == 2
+
+    async def test_existence_checks_are_never_cached(
+        self, cached_repository: CachedJobRepository, inner_repository: AsyncMock
+    ):
+        await cached_repository.exists_by_id("job-1")
+        await cached_repository.exists_by_id("job-1")
+
+        assert inner_repository.exists_by_id.await_count == 2
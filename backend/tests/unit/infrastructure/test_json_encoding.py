@@ -0,0 +1,71 @@
+import json
+import pytest
+from datetime import datetime, timezone
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.application.dto.job_dto import JobResponseDTO, JobSearchFacetsResponseDTO
+from app.infrastructure.primary.http import json_encoding
+from app.infrastructure.primary.http.json_encoding import rows_response
+
+
+ROW = {
+    "id": "job-1",
+    "title": "Développeur Python",
+    "company": "TechCorp",
+    "location": "Paris, France",
+    "url": "https://example.com/job/1",
+    "posted_date": "2 days ago",
+    "description": "Description",
+    "source": "linkedin",
+    "scraped_at": datetime(2025, 12, 12, 10, 30, 0, tzinfo=timezone.utc),
+    "created_at": datetime(2025, 12, 12, 10, 30, 0, 123456, tzinfo=timezone.utc),
+    "updated_at": None,
+    "duplicate_of": None,
+}
+
+
+def _validated_json(rows) -> list:
+    # What FastAPI produces through response_model=List[JobResponseDTO]
+    adapter = TypeAdapter(List[JobResponseDTO])
+    return json.loads(adapter.dump_json(adapter.validate_python(rows)))
+
+
+@pytest.mark.unit
+class TestRowsResponse:
+
+    def test_matches_response_model_serialization(self):
+        response = rows_response([ROW])
+
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == _validated_json([ROW])
+
+    def test_stdlib_fallback_matches_response_model_serialization(self, monkeypatch):
+        monkeypatch.setattr(json_encoding, "orjson", None)
+
+        response = rows_response([ROW])
+
+        assert json.loads(response.body) == _validated_json([ROW])
+
+    def test_does_not_mutate_cached_rows(self):
+        row = dict(ROW)
+
+        rows_response([row])
+
+        assert "rank" not in row
+
+    def test_passes_headers(self):
+        response = rows_response([], headers={"X-Next-Cursor": "abc"})
+
+        assert response.headers["X-Next-Cursor"] == "abc"
+        assert response.body == b"[]"
+
+    def test_facets_wrap_the_page(self):
+        facets = {"total": 1, "facets": {"company": [{"value": "TechCorp", "count": 1}]}}
+
+        response = rows_response([ROW], facets=facets)
+
+        body = json.loads(response.body)
+        validated = JobSearchFacetsResponseDTO(results=[ROW], **facets)
+        assert body == json.loads(validated.model_dump_json())
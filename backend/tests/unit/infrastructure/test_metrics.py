@@ -0,0 +1,102 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.infrastructure.metrics import MetricsRegistry
+from app.infrastructure.primary.http.metrics_middleware import MetricsMiddleware
+from app.infrastructure.secondary.cache.ttl_cache import TTLCache
+from app.infrastructure.secondary.persistence.query_metrics import current_operation, track_operations
+
+
+@pytest.fixture
+def registry() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+@pytest.mark.unit
+class TestMetricsRegistry:
+
+    def test_histogram_renders_cumulative_buckets(self, registry: MetricsRegistry):
+        histogram = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+        histogram.observe(0.05, "/a")
+        histogram.observe(0.5, "/a")
+        histogram.observe(3.0, "/a")
+
+        text = registry.render()
+
+        assert '# TYPE latency_seconds histogram' in text
+        assert 'latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{route="/a",le="1.0"} 2' in text
+        assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+        assert 'latency_seconds_count{route="/a"} 3' in text
+        assert 'latency_seconds_sum{route="/a"} 3.55' in text
+
+    def test_counter_escapes_label_values(self, registry: MetricsRegistry):
+        counter = registry.counter("events_total", "Events", ("name",))
+        counter.inc('a"b')
+        counter.inc('a"b', amount=2)
+
+        assert 'events_total{name="a\\"b"} 3' in registry.render()
+
+    def test_callback_metrics_are_read_at_scrape_time(self, registry: MetricsRegistry):
+        cache = TTLCache().register_metrics(registry)
+        cache.get("search", "missing")
+
+        text = registry.render()
+
+        assert 'cache_misses_total{namespace="search"} 1' in text
+        assert "cache_entries 0" in text
+
+    def test_duplicate_metric_name_is_rejected(self, registry: MetricsRegistry):
+        registry.counter("events_total", "Events")
+
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("events_total", "Events")
+
+
+@pytest.mark.unit
+class TestMetricsMiddleware:
+
+    @pytest.fixture
+    def client(self, registry: MetricsRegistry) -> TestClient:
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware, registry=registry)
+
+        @app.get("/items/{item_id}")
+        def get_item(item_id: str):
+            return {"id": item_id}
+
+        return TestClient(app)
+
+    def test_requests_are_labelled_by_route_template(self, client: TestClient, registry: MetricsRegistry):
+        client.get("/items/1")
+        client.get("/items/2")
+
+        assert registry.get("http_requests_total").value("GET", "/items/{item_id}", "200") == 2
+        assert registry.get("http_request_duration_seconds").count("GET", "/items/{item_id}", "200") == 2
+
+    def test_unknown_paths_share_one_label(self, client: TestClient, registry: MetricsRegistry):
+        client.get("/nope/1")
+        client.get("/nope/2")
+
+        assert registry.get("http_requests_total").value("GET", "unmatched", "404") == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestTrackOperations:
+
+    async def test_public_methods_set_the_current_operation(self):
+        @track_operations
+        class Repository:
+            async def search(self):
+                return current_operation.get()
+
+            async def export_rows(self):
+                yield current_operation.get()
+
+        repository = Repository()
+
+        assert await repository.search() == "search"
+        assert [op async for op in repository.export_rows()] == ["export_rows"]
+        assert current_operation.get() == "other"
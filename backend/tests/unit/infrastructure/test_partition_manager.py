@@ -0,0 +1,138 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.infrastructure.secondary.persistence.partition_manager import (
+    DEFAULT_PARTITION,
+    JobPartitionManager,
+    add_months,
+    expired_partitions,
+    month_start,
+    partition_month,
+    partition_name,
+    planned_partitions
+)
+
+
+NOW = datetime(2026, 10, 17, 12, 30, tzinfo=timezone.utc)
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, database):
+        self.database = database
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, parameters=None):
+        sql = str(statement)
+        if sql.startswith("SELECT c.relname"):
+            return FakeResult([{"name": name, "bounds": None, "estimated_rows": 0} for name in self.database.partitions])
+        self.database.statements.append(sql)
+        if sql.startswith("CREATE TABLE"):
+            self.database.partitions.add(sql.split()[5])
+        return FakeResult([])
+
+    async def commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+class FakeDatabase:
+    def __init__(self, partitions=()):
+        self.partitions = set(partitions)
+        self.statements = []
+
+    def __call__(self):
+        return FakeSession(self)
+
+
+@pytest.mark.unit
+class TestPartitionCalendar:
+
+    def test_month_start_normalizes_to_utc(self):
+        moment = datetime(2026, 11, 1, 0, 30, tzinfo=timezone(timedelta(hours=2)))
+        assert month_start(moment) == datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+    def test_add_months_crosses_years(self):
+        december = datetime(2026, 12, 1, tzinfo=timezone.utc)
+        assert add_months(december, 1) == datetime(2027, 1, 1, tzinfo=timezone.utc)
+        assert add_months(december, -12) == datetime(2025, 12, 1, tzinfo=timezone.utc)
+
+    def test_partition_name_round_trips(self):
+        month = datetime(2026, 3, 1, tzinfo=timezone.utc)
+        assert partition_name(month) == "jobs_p202603"
+        assert partition_month("jobs_p202603") == month
+        assert partition_month(DEFAULT_PARTITION) is None
+
+    def test_planned_partitions_start_at_current_month(self):
+        assert [partition_name(month) for month in planned_partitions(NOW, 2)] == [
+            "jobs_p202610", "jobs_p202611", "jobs_p202612"
+        ]
+
+    def test_expired_partitions_only_whole_months_past_cutoff(self):
+        names = ["jobs_p202607", "jobs_p202608", "jobs_p202609", "jobs_p202610", DEFAULT_PARTITION]
+
+        expired = expired_partitions(names, NOW, retention_months=2)
+
+        assert [name for name, _ in expired] == ["jobs_p202607"]
+
+    def test_no_retention_keeps_everything(self):
+        assert expired_partitions(["jobs_p200001"], NOW, retention_months=0) == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestJobPartitionManager:
+
+    async def test_creates_missing_partitions_and_default(self):
+        database = FakeDatabase(["jobs_p202610"])
+        manager = JobPartitionManager(database, premake_months=1, clock=lambda: NOW)
+
+        result = await manager.ensure_partitions()
+
+        assert result == {"created": ["jobs_p202611", DEFAULT_PARTITION], "failed": []}
+        assert "FOR VALUES FROM ('2026-11-01T00:00:00+00:00') TO ('2026-12-01T00:00:00+00:00')" in database.statements[0]
+
+    async def test_existing_partitions_are_left_alone(self):
+        database = FakeDatabase(["jobs_p202610", DEFAULT_PARTITION])
+        manager = JobPartitionManager(database, premake_months=0, clock=lambda: NOW)
+
+        assert await manager.ensure_partitions() == {"created": [], "failed": []}
+        assert database.statements == []
+
+    async def test_retention_detaches_and_clears_keys(self):
+        database = FakeDatabase(["jobs_p202601", "jobs_p202610"])
+        manager = JobPartitionManager(database, retention_months=6, clock=lambda: NOW)
+
+        result = await manager.apply_retention()
+
+        assert result == {"removed": ["jobs_p202601"], "failed": []}
+        assert database.statements[0] == "ALTER TABLE jobs DETACH PARTITION jobs_p202601"
+        assert database.statements[1].startswith("DELETE FROM job_keys")
+        assert len(database.statements) == 2
+
+    async def test_drop_mode_drops_detached_partition(self):
+        database = FakeDatabase(["jobs_p202601"])
+        manager = JobPartitionManager(database, retention_months=6, retention_mode="drop", clock=lambda: NOW)
+
+        await manager.apply_retention()
+
+        assert database.statements[-1] == "DROP TABLE jobs_p202601"
+
+    async def test_rejects_unknown_retention_mode(self):
+        with pytest.raises(ValueError):
+            JobPartitionManager(FakeDatabase(), retention_mode="truncate")
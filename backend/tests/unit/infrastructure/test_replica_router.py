@@ -0,0 +1,110 @@
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.infrastructure.secondary.persistence.replica_router import PRIMARY, ReplicaRouter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSession:
+    def __init__(self, name: str, reachable: bool = True):
+        self.name = name
+        self.reachable = reachable
+        self.closed = False
+
+    async def connection(self):
+        if not self.reachable:
+            raise OperationalError("SELECT 1", {}, ConnectionRefusedError())
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeFactory:
+    def __init__(self, name: str, reachable: bool = True):
+        self.name = name
+        self.reachable = reachable
+        self.sessions = []
+
+    def __call__(self) -> FakeSession:
+        session = FakeSession(self.name, self.reachable)
+        self.sessions.append(session)
+        return session
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def _router(clock, *replicas, **kwargs) -> ReplicaRouter:
+    return ReplicaRouter(
+        FakeFactory(PRIMARY),
+        replicas=[(factory.name, factory) for factory in replicas],
+        clock=clock,
+        **kwargs
+    )
+
+
+async def _read_from(router: ReplicaRouter, client_key=None) -> str:
+    async with router.read_session(client_key) as session:
+        return session.name
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReplicaRouter:
+
+    async def test_without_replicas_reads_go_to_primary(self, clock):
+        assert await _read_from(_router(clock)) == PRIMARY
+
+    async def test_reads_are_spread_across_replicas(self, clock):
+        router = _router(clock, FakeFactory("a"), FakeFactory("b"))
+
+        assert {await _read_from(router) for _ in range(4)} == {"a", "b"}
+
+    async def test_unreachable_replica_fails_over_and_is_skipped(self, clock):
+        down = FakeFactory("a", reachable=False)
+        router = _router(clock, down, failure_cooldown=30)
+
+        assert await _read_from(router) == PRIMARY
+        assert down.sessions[0].closed
+        assert router.status() == [{"name": "a", "healthy": False, "retry_in_seconds": 30.0}]
+
+        await _read_from(router)
+        assert len(down.sessions) == 1
+
+    async def test_failed_replica_is_retried_after_cooldown(self, clock):
+        replica = FakeFactory("a", reachable=False)
+        router = _router(clock, replica, failure_cooldown=30)
+        await _read_from(router)
+
+        replica.reachable = True
+        clock.now = 31
+
+        assert await _read_from(router) == "a"
+
+    async def test_recent_writer_reads_from_primary(self, clock):
+        router = _router(clock, FakeFactory("a"), read_your_writes_seconds=5)
+
+        router.mark_write("client-1")
+
+        assert await _read_from(router, "client-1") == PRIMARY
+        assert await _read_from(router, "client-2") == "a"
+
+        clock.now = 6
+        assert await _read_from(router, "client-1") == "a"
+
+    async def test_session_is_closed_after_use(self, clock):
+        replica = FakeFactory("a")
+        router = _router(clock, replica)
+
+        await _read_from(router)
+
+        assert replica.sessions[0].closed
@@ -0,0 +1,77 @@
+import pytest
+from types import SimpleNamespace
+
+from app.infrastructure.secondary.persistence.slow_query_log import (
+    MAX_PARAMETERS_LENGTH,
+    SKIP_OPTION,
+    SlowQueryRecorder
+)
+
+
+def _run(recorder: SlowQueryRecorder, statement: str, parameters=(), context=None, clock=None):
+    conn = SimpleNamespace(info={})
+    recorder._before_cursor_execute(conn, None, statement, parameters, context, False)
+    if clock is not None:
+        conn.info["slow_query_started_at"][-1] -= clock
+    recorder._after_cursor_execute(conn, None, statement, parameters, context, False)
+
+
+@pytest.mark.unit
+class TestSlowQueryRecorder:
+
+    def test_keeps_only_statements_over_threshold(self):
+        recorder = SlowQueryRecorder(threshold_ms=100)
+
+        _run(recorder, "SELECT fast")
+        _run(recorder, "SELECT slow FROM jobs WHERE location ILIKE $1", ("%Paris%",), clock=0.25)
+
+        entries = recorder.entries()
+        assert [entry["statement"] for entry in entries] == ["SELECT slow FROM jobs WHERE location ILIKE $1"]
+        assert entries[0]["parameters"] == "('%Paris%',)"
+        assert entries[0]["duration_ms"] >= 250
+
+    def test_ring_buffer_keeps_newest_entries_first(self):
+        recorder = SlowQueryRecorder(threshold_ms=0, capacity=2)
+
+        for i in range(3):
+            recorder.record(f"SELECT {i}", (), 1.0, "search")
+
+        assert [entry["statement"] for entry in recorder.entries()] == ["SELECT 2", "SELECT 1"]
+        assert [entry["statement"] for entry in recorder.entries(limit=1)] == ["SELECT 2"]
+
+    def test_truncates_large_parameter_sets(self):
+        recorder = SlowQueryRecorder(threshold_ms=0)
+
+        entry = recorder.record("INSERT INTO jobs ...", ("x" * 10000,), 1.0, "save_many")
+
+        assert len(entry["parameters"]) < MAX_PARAMETERS_LENGTH + 50
+
+    def test_skips_statements_issued_by_explain(self):
+        recorder = SlowQueryRecorder(threshold_ms=0)
+        context = SimpleNamespace(execution_options={SKIP_OPTION: True})
+
+        _run(recorder, "EXPLAIN SELECT 1", context=context)
+
+        assert len(recorder) == 0
+
+    @pytest.mark.parametrize("statement, expected", [
+        ("SELECT * FROM jobs", True),
+        ("  with page AS (SELECT 1) SELECT * FROM page", True),
+        ("INSERT INTO jobs VALUES ($1)", False),
+        ("UPDATE jobs SET title = $1", False),
+    ])
+    def test_only_read_statements_are_explained(self, statement, expected):
+        recorder = SlowQueryRecorder(threshold_ms=0, explain_sample_rate=1.0)
+        recorder._engine = object()
+
+        assert recorder._should_explain(statement) is expected
+
+    def test_explain_is_sampled(self):
+        recorder = SlowQueryRecorder(threshold_ms=0, explain_sample_rate=0.1, random_source=lambda: 0.5)
+        recorder._engine = object()
+
+        assert recorder._should_explain("SELECT 1") is False
+
+    def test_rejects_invalid_sample_rate(self):
+        with pytest.raises(ValueError, match="sample rate"):
+            SlowQueryRecorder(threshold_ms=0, explain_sample_rate=2.0)
@@ -0,0 +1,63 @@
+import pytest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+from app.domain.exceptions.job_exceptions import RepositoryError
+from app.domain.ports.job_repository import IJobRepository
+from app.infrastructure.secondary.persistence.stats_refresher import StatsSnapshotRefresher
+
+
+@asynccontextmanager
+async def _session_factory():
+    yield object()
+
+
+@pytest.fixture
+def repository() -> AsyncMock:
+    repository = AsyncMock(spec=IJobRepository)
+    repository.refresh_stats_snapshot.return_value = True
+    return repository
+
+
+def _refresher(repository) -> StatsSnapshotRefresher:
+    return StatsSnapshotRefresher(_session_factory, repository_factory=lambda session: repository)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestStatsSnapshotRefresher:
+
+    async def test_skips_refresh_when_clean(self, repository: AsyncMock):
+        refresher = _refresher(repository)
+
+        assert await refresher.refresh_if_dirty() is False
+        repository.refresh_stats_snapshot.assert_not_awaited()
+
+    async def test_refresh_clears_dirty_flag(self, repository: AsyncMock):
+        refresher = _refresher(repository)
+        refresher.mark_dirty()
+
+        assert await refresher.refresh_if_dirty() is True
+        assert await refresher.refresh_if_dirty() is False
+        repository.refresh_stats_snapshot.assert_awaited_once()
+
+    async def test_stays_dirty_when_lock_is_held_elsewhere(self, repository: AsyncMock):
+        repository.refresh_stats_snapshot.return_value = False
+        refresher = _refresher(repository)
+        refresher.mark_dirty()
+
+        assert await refresher.refresh_if_dirty() is False
+
+        repository.refresh_stats_snapshot.return_value = True
+        assert await refresher.refresh_if_dirty() is True
+        assert repository.refresh_stats_snapshot.await_count == 2
+
+    async def test_stays_dirty_when_refresh_fails(self, repository: AsyncMock):
+        repository.refresh_stats_snapshot.side_effect = RepositoryError("boom")
+        refresher = _refresher(repository)
+        refresher.mark_dirty()
+
+        assert await refresher.refresh_if_dirty() is False
+
+        repository.refresh_stats_snapshot.side_effect = None
+        assert await refresher.refresh_if_dirty() is True
@@ -0,0 +1,200 @@
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from typing import List
+from unittest.mock import AsyncMock, Mock
+
+from app.domain.entities.job import Job
+from app.domain.exceptions.job_exceptions import IngestQueueFullError, PartialSaveError, RepositoryError
+from app.domain.ports.job_repository import IJobRepository
+from app.infrastructure.secondary.queue.write_behind_queue import WriteBehindIngestQueue
+
+
+def _job(job_id: str) -> Job:
+    return Job(
+        id=job_id,
+        title=f"Job {job_id}",
+        company="Company",
+        location="Location",
+        url=f"https://example.com/job/{job_id}",
+        source="linkedin",
+    )
+
+
+@asynccontextmanager
+async def _session_factory():
+    yield object()
+
+
+@pytest.fixture
+def repository() -> AsyncMock:
+    repository = AsyncMock(spec=IJobRepository)
+    stored = {}
+
+    async def save_many(jobs: List[Job], upsert: bool = False):
+        duplicate_ids, updated_ids, unchanged_ids = [], [], []
+        for job in jobs:
+            if job.id in stored:
+                if not upsert or job.id in updated_ids + unchanged_ids:
+                    duplicate_ids.append(job.id)
+                elif stored[job.id] != job.title:
+                    updated_ids.append(job.id)
+                else:
+                    unchanged_ids.append(job.id)
+            stored[job.id] = job.title
+        return {
+            "inserted": len(jobs) - len(duplicate_ids) - len(updated_ids) - len(unchanged_ids),
+            "updated": len(updated_ids),
+            "updated_ids": updated_ids,
+            "unchanged": len(unchanged_ids),
+            "unchanged_ids": unchanged_ids,
+            "duplicates": len(duplicate_ids),
+            "duplicate_ids": duplicate_ids,
+            "near_duplicates": [],
+            "total": len(jobs)
+        }
+
+    repository.save_many.side_effect = save_many
+    return repository
+
+
+@pytest.fixture
+def stats_refresher() -> Mock:
+    return Mock()
+
+
+def _queue(repository, stats_refresher=None, **kwargs) -> WriteBehindIngestQueue:
+    options = {"batch_size": 3, "flush_interval": 0.01, "max_pending": 6}
+    options.update(kwargs)
+    return WriteBehindIngestQueue(
+        _session_factory,
+        repository_factory=lambda session: repository,
+        stats_refresher=stats_refresher,
+        **options
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWriteBehindIngestQueue:
+
+    async def test_coalesces_requests_into_one_batch(self, repository: AsyncMock, stats_refresher: Mock):
+        queue = _queue(repository, stats_refresher)
+        first = await queue.enqueue([_job("1"), _job("2")])
+        second = await queue.enqueue([_job("3")])
+
+        await queue.flush()
+
+        assert repository.save_many.await_count == 1
+        assert [job.id for job in repository.save_many.await_args.args[0]] == ["1", "2", "3"]
+        assert queue.get_ticket(first["ticket"])["status"] == "completed"
+        assert queue.get_ticket(second["ticket"])["inserted"] == 1
+        stats_refresher.mark_dirty.assert_called_once()
+
+    async def test_ticket_reports_its_own_duplicates(self, repository: AsyncMock):
+        queue = _queue(repository)
+        first = await queue.enqueue([_job("1")])
+        second = await queue.enqueue([_job("1"), _job("2")])
+
+        await queue.flush()
+
+        ticket = queue.get_ticket(second["ticket"])
+        assert queue.get_ticket(first["ticket"])["inserted"] == 1
+        assert ticket["inserted"] == 1
+        assert ticket["duplicate_ids"] == ["1"]
+
+    async def test_upsert_reports_rewritten_and_unchanged_postings(self, repository: AsyncMock):
+        queue = _queue(repository, upsert=True)
+        await queue.enqueue([_job("1"), _job("2")])
+        await queue.flush()
+
+        changed = _job("1")
+        changed.title = "Senior Job 1"
+        ticket = await queue.enqueue([changed, _job("2"), changed])
+        await queue.flush()
+
+        ticket = queue.get_ticket(ticket["ticket"])
+        assert repository.save_many.await_args.kwargs == {"upsert": True}
+        assert ticket["updated"] == 1
+        assert ticket["unchanged"] == 1
+        assert ticket["inserted"] == 0
+        assert ticket["duplicate_ids"] == ["1"]
+
+    async def test_ticket_spanning_batches_completes_after_last_one(self, repository: AsyncMock):
+        queue = _queue(repository, batch_size=2)
+        ticket = await queue.enqueue([_job("1"), _job("2"), _job("3")])
+
+        await queue.flush()
+        assert queue.get_ticket(ticket["ticket"])["status"] == "pending"
+
+        await queue.flush()
+        assert queue.get_ticket(ticket["ticket"])["status"] == "completed"
+        assert queue.get_ticket(ticket["ticket"])["inserted"] == 3
+
+    async def test_rejects_jobs_beyond_capacity(self, repository: AsyncMock):
+        queue = _queue(repository)
+        await queue.enqueue([_job(str(i)) for i in range(5)])
+
+        with pytest.raises(IngestQueueFullError):
+            await queue.enqueue([_job("5"), _job("6")])
+
+    async def test_failed_batch_marks_tickets_failed(self, repository: AsyncMock):
+        repository.save_many.side_effect = RepositoryError("boom")
+        queue = _queue(repository)
+        ticket = await queue.enqueue([_job("1")])
+
+        await queue.flush()
+
+        status = queue.get_ticket(ticket["ticket"])
+        assert status["status"] == "failed"
+        assert status["error"] == "boom"
+
+    async def test_partial_failure_fails_only_unsaved_tickets(self, repository: AsyncMock):
+        # The first chunk (job 1) was committed before the second one failed
+        repository.save_many.side_effect = PartialSaveError("Error saving jobs: deadlock", {
+            "inserted": 1,
+            "duplicates": 0,
+            "duplicate_ids": [],
+            "near_duplicates": [],
+            "failed": 2,
+            "failed_ids": ["2", "3"],
+            "total": 3
+        })
+        queue = _queue(repository)
+        saved = await queue.enqueue([_job("1")])
+        lost = await queue.enqueue([_job("2"), _job("3")])
+
+        await queue.flush()
+
+        saved = queue.get_ticket(saved["ticket"])
+        lost = queue.get_ticket(lost["ticket"])
+        assert saved["status"] == "completed"
+        assert saved["inserted"] == 1
+        assert lost["status"] == "failed"
+        assert lost["processed"] == 2
+        assert lost["inserted"] == 0
+        assert lost["error"] == "Error saving jobs: deadlock"
+
+    async def test_flusher_flushes_partial_batch_after_interval(self, repository: AsyncMock):
+        queue = _queue(repository)
+        queue.start()
+        ticket = await queue.enqueue([_job("1")])
+
+        await asyncio.sleep(0.05)
+
+        assert queue.get_ticket(ticket["ticket"])["status"] == "completed"
+        await queue.stop()
+
+    async def test_stop_drains_pending_jobs_and_refuses_new_ones(self, repository: AsyncMock):
+        queue = _queue(repository, flush_interval=60)
+        queue.start()
+        ticket = await queue.enqueue([_job("1")])
+
+        await queue.stop()
+
+        assert queue.get_ticket(ticket["ticket"])["status"] == "completed"
+        with pytest.raises(IngestQueueFullError, match="shutting down"):
+            await queue.enqueue([_job("2")])
+
+    async def test_unknown_ticket_returns_none(self, repository: AsyncMock):
+        assert _queue(repository).get_ticket("missing") is None
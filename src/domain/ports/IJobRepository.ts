@@ -11,6 +11,8 @@ export interface IJobRepository {
 export interface SubmitResult {
   success: boolean;
   inserted: number;
+  // Known jobs rewritten because their content changed (backend upsert mode)
+  updated?: number;
   duplicates: number;
   total: number;
 }
@@ -1,22 +1,72 @@
 import { IJobRepository, SubmitResult, JobStats } from '../../domain/ports/IJobRepository';
 import { Job, JobFilter } from '../../domain/entities/Job';
 
+// Same fields, order and separator as the backend's content_hash
+// (backend/app/domain/services/content_hash.py), read under the names the
+// submit payload carries them: a field the backend does not receive hashes as ''.
+const CONTENT_FIELDS = ['title', 'company', 'location', 'url', 'source', 'posted_date', 'description'];
+const CONTENT_SEPARATOR = '\x1f';
+
+async function contentHash(job: Job): Promise<string> {
+  const payload = job as unknown as Record<string, unknown>;
+  const content = CONTENT_FIELDS.map(field => String(payload[field] || '')).join(CONTENT_SEPARATOR);
+  const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(content));
+  return Array.from(new Uint8Array(digest), byte => byte.toString(16).padStart(2, '0')).join('');
+}
+
 export class ApiJobRepository implements IJobRepository {
   constructor(private apiUrl: string) {}
 
+  // Delta sync: ids and content hashes go up first, the backend answers with
+  // the jobs it lacks and the stored ones whose content changed
+  private async findJobsToUpload(jobs: Job[]): Promise<Job[]> {
+    try {
+      const hashes: Record<string, string> = {};
+      for (const job of jobs) {
+        hashes[job.id] = await contentHash(job);
+      }
+
+      const response = await fetch(`${this.apiUrl}/api/jobs/sync`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ ids: jobs.map(job => job.id), hashes })
+      });
+
+      if (!response.ok) {
+        console.warn('[ApiJobRepository] Sync unavailable, uploading all jobs - Status:', response.status);
+        return jobs;
+      }
+
+      const { missing, changed = [] } = await response.json();
+      const uploadIds = new Set<string>([...missing, ...changed]);
+      return jobs.filter(job => uploadIds.has(job.id));
+    } catch (error) {
+      console.warn('[ApiJobRepository] Sync failed, uploading all jobs:', error);
+      return jobs;
+    }
+  }
+
   async submitJobs(jobs: Job[]): Promise<SubmitResult> {
     console.log('[ApiJobRepository] submitJobs() called with', jobs.length, 'jobs');
     console.log('[ApiJobRepository] API URL:', this.apiUrl);
 
     try {
+      const newJobs = await this.findJobsToUpload(jobs);
+      const known = jobs.length - newJobs.length;
+      console.log('[ApiJobRepository] Jobs already known and unchanged on the backend:', known);
+
+      if (newJobs.length === 0) {
+        return { success: true, inserted: 0, duplicates: known, total: jobs.length };
+      }
+
       const url = `${this.apiUrl}/api/jobs/submit`;
       console.log('[ApiJobRepository] Sending POST request to:', url);
-      console.log('[ApiJobRepository] Request body:', { jobs: jobs.slice(0, 2) }); // Log first 2 jobs only
+      console.log('[ApiJobRepository] Request body:', { jobs: newJobs.slice(0, 2) }); // Log first 2 jobs only
 
       const response = await fetch(url, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ jobs })
+        body: JSON.stringify({ jobs: newJobs })
       });
 
       console.log('[ApiJobRepository] Response received - Status:', response.status, response.statusText);
@@ -30,7 +80,7 @@ export class ApiJobRepository implements IJobRepository {
 
       const result = await response.json();
       console.log('[ApiJobRepository] Parsed response:', result);
-      return result;
+      return { ...result, duplicates: result.duplicates + known, total: jobs.length };
     } catch (error) {
       console.error('[ApiJobRepository] Exception during submitJobs:', error);
       console.error('[ApiJobRepository] Error type:', error?.constructor?.name);